@@ -16,6 +16,8 @@ class AddInstanceCommand(UndoCommand):
         cnobj (CNObject): Object instance to add to Document
     """
 
+    __slots__ = ('_document', '_cnobj', '_obj_instance')
+
     def __init__(self, document: DocT, cnobj: CNObject):
         super(AddInstanceCommand, self).__init__("add instance")
         self._document = document
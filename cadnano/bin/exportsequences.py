@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""Export the staple sequences of many designs, one file per design::
+
+    python -m cadnano.bin.exportsequences design.json [...] [--format plate96]
+        [--columns Start End Sequence] [--output-dir DIR]
+
+Each file is written next to its design, or in ``--output-dir``, with the
+extension of the format.
+"""
+import argparse
+import os
+import sys
+
+LOCAL_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.dirname(os.path.dirname(LOCAL_DIR)))
+
+
+def main(argv=None):
+    from cadnano.fileio import sequenceexport
+    from cadnano.oligo import EXPORT_COLUMNS
+
+    parser = argparse.ArgumentParser(description="export the staple sequences of cadnano designs")
+    parser.add_argument('designs', nargs='+', help="cadnano design files")
+    parser.add_argument('--format', '-f', default='csv', choices=sequenceexport.FORMATS,
+                        help="output format, default csv")
+    parser.add_argument('--columns', '-c', nargs='+', default=[c for c in EXPORT_COLUMNS if c != 'AbstractSequence'],
+                        choices=EXPORT_COLUMNS, metavar='COLUMN',
+                        help="columns to export, default all but AbstractSequence, from: " + ' '.join(EXPORT_COLUMNS))
+    parser.add_argument('--output-dir', '-o', help="directory of the exported files")
+    args = parser.parse_args(argv)
+
+    from cadnano.fileio.decode import decodeFile
+
+    extension = '.tsv' if args.format == 'tsv' else '.csv'
+    for design in args.designs:
+        document = decodeFile(design)
+        part = document.activePart() or next(iter(document.getParts()))
+        if 'AbstractSequence' in args.columns:
+            part.setAbstractSequences()
+        base = os.path.splitext(os.path.basename(design))[0]
+        out_dir = args.output_dir or os.path.dirname(os.path.abspath(design))
+        out_path = os.path.join(out_dir, base + extension)
+        with open(out_path, 'w', newline='') as fd:
+            count = part.writeSequences(fd, args.columns, args.format)
+        print("%s: %d oligos to %s" % (design, count, out_path))
+# end def
+
+
+if __name__ == '__main__':
+    main()
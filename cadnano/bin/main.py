@@ -34,6 +34,10 @@ def main(argv=None):
     from cadnano import initAppWithGui
     # Things are a lot easier if we can pass None instead of sys.argv and only fall back to sys.argv when we need to.
     app = initAppWithGui(argv, do_exec=False)
+    if app.argns.instrument:
+        from cadnano import instrumentation
+        instrumentation.enable()
+        instrumentation.dumpAtExit()
     if app.argns.profile:
         print("Collecting profile data into cadnano.profile")
         import cProfile
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""Replay a session recorded by :class:`cadnano.sessionrecorder.SessionRecorder`
+on its starting design and print how long every command took::
+
+    python -m cadnano.bin.replaysession design.json session.jsonl.gz [--quiet]
+"""
+import argparse
+import os
+import sys
+from collections import defaultdict
+
+LOCAL_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.dirname(os.path.dirname(LOCAL_DIR)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="replay a recorded cadnano session headless")
+    parser.add_argument('design', help="the design the session started from")
+    parser.add_argument('session', help="the session log")
+    parser.add_argument('--quiet', '-q', action='store_true', help="only print the totals per command")
+    args = parser.parse_args(argv)
+
+    from cadnano.fileio.decode import decodeFile
+    from cadnano.sessionrecorder import replaySession
+
+    document = decodeFile(args.design)
+    totals = defaultdict(lambda: [0, 0., 0.])
+
+    def report(entry, seconds):
+        name = entry.get('cmd', entry.get('name', '')).rpartition('.')[2]
+        recorded = entry.get('t', 0.)
+        total = totals[(entry['op'], name)]
+        total[0] += 1
+        total[1] += recorded
+        total[2] += seconds
+        if not args.quiet:
+            print("%-6s %-36s %12.1f us %12.1f us" % (entry['op'], name[:36], 1e6*recorded, 1e6*seconds))
+
+    if not args.quiet:
+        print("%-6s %-36s %15s %15s" % ("op", "command", "recorded", "replayed"))
+    replaySession(document, args.session, callback=report)
+
+    print("%-6s %-36s %7s %12s %12s" % ("op", "command", "count", "recorded s", "replayed s"))
+    for (op, name), (count, recorded, replayed) in sorted(totals.items(), key=lambda x: -x[1][2]):
+        print("%-6s %-36s %7d %12.4f %12.4f" % (op, name[:36], count, recorded, replayed))
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,7 @@ class NucleicAcidPartItemController(PartItemController):
     ('partInstancePropertySignal',             'partInstancePropertySlot'),            # noqa
 
     ('partVirtualHelixAddedSignal',            'partVirtualHelixAddedSlot'),           # noqa
+    ('partVirtualHelicesAddedSignal',          'partVirtualHelicesAddedSlot'),         # noqa
     ('partVirtualHelixRemovingSignal',         'partVirtualHelixRemovingSlot'),        # noqa
     ('partVirtualHelixRemovedSignal',          'partVirtualHelixRemovedSlot'),         # noqa
     ('partVirtualHelixResizedSignal',          'partVirtualHelixResizedSlot'),         # noqa
@@ -10,6 +10,8 @@ class Insertion(object):
         length: length of :class:`Insertion`
     """
 
+    __slots__ = ('_length', '_index')
+
     def __init__(self, index: int, length: int):
         self._length = length
         self._index = index
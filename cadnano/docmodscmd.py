@@ -8,6 +8,8 @@ from cadnano.cntypes import (
 
 
 class AddModCommand(UndoCommand):
+    __slots__ = ('_document', '_params', '_mid')
+
     def __init__(self, document: DocT, params: dict, mid: str):
         """
         Args:
@@ -38,6 +40,8 @@ class AddModCommand(UndoCommand):
 
 
 class RemoveModCommand(UndoCommand):
+    __slots__ = ('_document', '_params_old', '_mid', '_ext_instances', '_int_instances')
+
     def __init__(self, document, mid):
         super(RemoveModCommand, self).__init__()
         self._document = document
@@ -91,6 +95,8 @@ class RemoveModCommand(UndoCommand):
 
 
 class ModifyModCommand(UndoCommand):
+    __slots__ = ('_document', '_params', '_mid', '_ext_instances', '_int_instances', '_params_old')
+
     def __init__(self, document, params, mid):
         super(ModifyModCommand, self).__init__()
         self._document = document
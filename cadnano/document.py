@@ -30,6 +30,7 @@ from cadnano.proxies.cnproxy import (
     ProxySignal,
     UndoStack
 )
+from cadnano.proxies.signalqueue import deferSignals
 from cadnano.docmodscmd import (
     AddModCommand,
     ModifyModCommand,
@@ -72,7 +73,11 @@ class Document(CNObject):
         super(Document, self).__init__(parent)
 
         self._undostack = us = UndoStack()  # notice NO parent, what does this mean?
-        us.setUndoLimit(30)
+        if hasattr(us, 'setSpill'):
+            # headless the history past the byte budget is spilled to a file
+            us.setSpill(True)
+        else:
+            us.setUndoLimit(30)
         self._children = set()     # for storing a reference to Parts (and Assemblies)
         self._instances = set()    # for storing instances of Parts (and Assemblies)
         self._app_window = None
@@ -119,6 +124,24 @@ class Document(CNObject):
         """
         return self._undostack
 
+    def deferSignals(self, immediate: frozenset = frozenset()):
+        """Context manager queueing the signals emitted inside it and emitting
+        them, coalesced, when it exits.  Nested uses join the outermost one.
+        Signals of every object are deferred, not only those of this document.
+
+            with document.deferSignals():
+                ...
+
+        Args:
+            immediate: names of signals not to defer inside the block,
+                besides ``signalqueue.IMMEDIATE``
+
+        Returns:
+            context manager yielding a :class:`signalqueue.SignalQueue`
+        """
+        return deferSignals(immediate)
+    # end def
+
     def children(self) -> Set[CNObject]:
         """Returns a list of parts associated with the document.
 
@@ -402,9 +425,10 @@ class Document(CNObject):
         Returns:
             ``True`` if ``oligo`` is selected otherwise ``False``
         """
-        strand5p = oligo.strand5p()
-        for strand in strand5p.generator3pStrand():
-            if self.isModelStrandSelected(strand):
+        selection_dict = self._selection_dict
+        for strand in oligo.strands():
+            selected = selection_dict.get(strand.strandSet())
+            if selected is not None and strand in selected:
                 return True
         return False
     # end def
@@ -415,9 +439,8 @@ class Document(CNObject):
         Args:
             oligo: ``Oligo`` object
         """
-        strand5p = oligo.strand5p()
         both_ends = (True, True)
-        for strand in strand5p.generator3pStrand():
+        for strand in oligo.strands():
             self.addStrandToSelection(strand, both_ends)
         self.updateStrandSelection()
     # end def
@@ -428,8 +451,7 @@ class Document(CNObject):
         Args:
             oligo: ``Oligo`` object
         """
-        strand5p = oligo.strand5p()
-        for strand in strand5p.generator3pStrand():
+        for strand in oligo.strands():
             self.removeStrandFromSelection(strand)
         self.updateStrandSelection()
     # end def
@@ -605,7 +627,7 @@ class Document(CNObject):
             self.undoStack().endMacro()
     # end def
 
-    def resizeSelection(self, delta: int, use_undostack: bool = True):
+    def resizeSelection(self, delta: int, use_undostack: bool = True, merge: bool = False):
         """Moves the selected idxs by delta by first iterating over all strands
         to calculate new idxs (method will return if snap-to behavior would
         create illegal state), then applying a resize command to each strand.
@@ -613,6 +635,8 @@ class Document(CNObject):
         Args:
             delta:
             use_undostack: optional, default is ``True``
+            merge: optional, merge with the previous resize of the selection,
+                for the steps of a drag. Default is ``False``
         """
         resize_list = []
         vh_set = set()
@@ -657,17 +681,19 @@ class Document(CNObject):
         if use_undostack:
             us.beginMacro("Resize Selection")
 
-        for strand, idx_low, idx_high in resize_list:
-            Strand.resize(strand,
-                          (idx_low, idx_high),
-                          use_undostack,
-                          update_segments=False)
-        if resize_list:
-            cmd = RefreshSegmentsCommand(part, vh_set)
-            if use_undostack:
-                us.push(cmd)
-            else:
-                cmd.redo()
+        with self.deferSignals():
+            for strand, idx_low, idx_high in resize_list:
+                Strand.resize(strand,
+                              (idx_low, idx_high),
+                              use_undostack,
+                              update_segments=False,
+                              merge=merge)
+            if resize_list:
+                cmd = RefreshSegmentsCommand(part, vh_set)
+                if use_undostack:
+                    us.push(cmd)
+                else:
+                    cmd.redo()
 
         if use_undostack:
             us.endMacro()
@@ -12,7 +12,20 @@ from cadnano.cntypes import (
 
 def decodeFile( filename: str,
                 document: DocT = None,
-                emit_signals: bool = False) -> DocT:
+                emit_signals: bool = False,
+                fast: bool = False) -> DocT:
+    """Decode a cadnano file into a document
+
+    Args:
+        filename: full path file name
+        document: optional, ``Document`` to populate, a new one by default
+        emit_signals: whether to signal views
+        fast: use the bulk decoder for version 3 files, see
+            :func:`v3decode.decodePart`
+
+    Returns:
+        the ``Document``
+    """
     with io.open(filename, 'r', encoding='utf-8') as fd:
         nno_dict = json.load(fd)
     if document is None:
@@ -24,7 +37,7 @@ def decodeFile( filename: str,
         else:
             v2decode.decode(document, nno_dict, emit_signals=emit_signals)
     else:
-        v3decode.decode(document, nno_dict, emit_signals=emit_signals)
+        v3decode.decode(document, nno_dict, emit_signals=emit_signals, fast=fast)
     return document
 # end def
 
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Stream the staple sequences of a part to a file
+
+Rows are made one oligo at a time by :meth:`Oligo.exportRow` and written
+straight to the file, so exporting many designs holds one row in memory at
+a time.  Only the requested columns are computed, leaving out
+``AbstractSequence`` skips the abstract sequences altogether.
+
+Formats:
+
+``csv``
+    comma separated with a header, the format of
+    :meth:`NucleicAcidPart.getSequences`
+``tsv``
+    tab separated with a header
+``plate96``, ``plate384``
+    comma separated with ``Plate`` and ``Well`` columns first, filling the
+    wells of 96 or 384 well plates row by row, ``A1``, ``A2``, ...
+"""
+import csv
+from typing import (
+    Iterable,
+    Iterator,
+    TextIO,
+    Tuple
+)
+
+from cadnano.oligo.oligo import EXPORT_COLUMNS
+from cadnano.cntypes import (
+    NucleicAcidPartT
+)
+
+PLATE_SHAPES = {'plate96': (8, 12), 'plate384': (16, 24)}
+"""format: (rows, columns) of the plate"""
+
+FORMATS = ('csv', 'tsv') + tuple(PLATE_SHAPES)
+
+
+def iterSequenceRows(part: NucleicAcidPartT,
+                     columns: Tuple[str, ...] = EXPORT_COLUMNS) -> Iterator[tuple]:
+    """Args:
+        part: the part to export
+        columns: names from ``EXPORT_COLUMNS``
+
+    Yields:
+        the row of each oligo of ``part``, see :meth:`Oligo.exportRow`
+
+    Raises:
+        CircularOligoException: a circular oligo is reached
+    """
+    for oligo in part.oligos():
+        yield oligo.exportRow(columns)
+# end def
+
+
+def iterWells(rows: int, columns: int) -> Iterator[Tuple[int, str]]:
+    """Args:
+        rows: rows of a plate, lettered from ``A``
+        columns: columns of a plate, numbered from 1
+
+    Yields:
+        ``(plate number, well)`` from plate 1 on, row by row
+    """
+    plate = 1
+    while True:
+        for row in range(rows):
+            letter = chr(ord('A') + row)
+            for column in range(1, columns + 1):
+                yield plate, "%s%d" % (letter, column)
+        plate += 1
+# end def
+
+
+def writeRows(rows: Iterable[tuple], fd: TextIO,
+              columns: Tuple[str, ...] = EXPORT_COLUMNS,
+              fmt: str = 'csv') -> int:
+    """Write rows with a header to an open text file
+
+    Args:
+        rows: values of ``columns``
+        fd: file opened with ``newline=''`` or an ``io.StringIO``
+        columns: the header
+        fmt: one of ``FORMATS``
+
+    Returns:
+        the number of rows written, without the header
+
+    Raises:
+        ValueError: unknown format
+    """
+    if fmt not in FORMATS:
+        raise ValueError("unknown format %r, expected one of %s" % (fmt, ', '.join(FORMATS)))
+    writer = csv.writer(fd, delimiter='\t' if fmt == 'tsv' else ',', lineterminator='\n')
+    count = 0
+    if fmt in PLATE_SHAPES:
+        writer.writerow(('Plate', 'Well') + tuple(columns))
+        for count, (well, row) in enumerate(zip(iterWells(*PLATE_SHAPES[fmt]), rows), 1):
+            writer.writerow(well + row)
+    else:
+        writer.writerow(columns)
+        for count, row in enumerate(rows, 1):
+            writer.writerow(row)
+    return count
+# end def
+
+
+def writeSequences(part: NucleicAcidPartT, fd: TextIO,
+                   columns: Tuple[str, ...] = EXPORT_COLUMNS,
+                   fmt: str = 'csv') -> int:
+    """Write the staple sequences of ``part`` to an open text file, see
+    :func:`writeRows`
+
+    Args:
+        part: the part to export
+        fd: file opened with ``newline=''`` or an ``io.StringIO``
+        columns: names from ``EXPORT_COLUMNS``
+        fmt: one of ``FORMATS``
+
+    Returns:
+        the number of oligos written
+
+    Raises:
+        CircularOligoException: the part has a circular oligo
+        KeyError: unknown column
+        ValueError: unknown format
+    """
+    columns = tuple(columns)
+    unknown = set(columns).difference(EXPORT_COLUMNS)
+    if unknown:
+        raise KeyError("unknown export columns %s" % sorted(unknown))
+    return writeRows(iterSequenceRows(part, columns), fd, columns, fmt)
+# end def
@@ -9,7 +9,9 @@ from cadnano.fileio.lattice import (
     SquareDnaPart
 )
 from cadnano.part.nucleicacidpart import DEFAULT_RADIUS
+from cadnano.part.partbuilder import PartBuilder
 from cadnano.part.refresholigoscmd import RefreshOligosCommand
+from cadnano.proxies.signalqueue import PART_STATE
 from cadnano.proxies.cnenum import (
     GridEnum,
     PointEnum,
@@ -19,10 +21,11 @@ from cadnano.proxies.cnenum import (
 from cadnano.objectinstance import ObjectInstance
 from cadnano.cntypes import (
     DocT,
+    NucleicAcidPartT,
     Vec3T
 )
 
-def decode(document: DocT, obj: dict, emit_signals: bool = True):
+def decode(document: DocT, obj: dict, emit_signals: bool = True, fast: bool = False):
     """Parses a dictionary (obj) created from reading a json file and uses it
     to populate the given document with model data.
 
@@ -30,23 +33,27 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
         document:
         obj:
         emit_signals: whether to signal views
+        fast: build each part in bulk, see :func:`decodePart`
 
     Raises:
         AssertionError, TypeError
     """
     obj.get('name')
 
-    for part_dict in obj['parts']:
-        grid_type = determineLatticeType(part_dict)
+    # the views write the part state back when they get it after creating
+    # their items, which would push commands
+    with document.deferSignals(immediate=PART_STATE):
+        for part_dict in obj['parts']:
+            grid_type = determineLatticeType(part_dict)
 
-        # NOTE: NC 2018.05.15 THIS is commented out since it violates model view
-        # isolation.  grid or slice view stuff should be in the View only
-        # a signal could be sent to a view with the info to determine this
-        # ortho_view_type = determineOrthoViewType(part_dict, grid_type)
-        # document.setSliceOrGridViewVisible(view_type=ortho_view_type)
+            # NOTE: NC 2018.05.15 THIS is commented out since it violates model view
+            # isolation.  grid or slice view stuff should be in the View only
+            # a signal could be sent to a view with the info to determine this
+            # ortho_view_type = determineOrthoViewType(part_dict, grid_type)
+            # document.setSliceOrGridViewVisible(view_type=ortho_view_type)
 
-        decodePart(document, part_dict, grid_type=grid_type,
-                   emit_signals=emit_signals)
+            decodePart(document, part_dict, grid_type=grid_type,
+                       emit_signals=emit_signals, fast=fast)
 
     modifications = obj['modifications']
 
@@ -112,7 +119,8 @@ def determineLatticeType(part_dict: dict) -> EnumType:
 def decodePart( document: DocT,
                 part_dict: dict,
                 grid_type: EnumType,
-                emit_signals: bool = False):
+                emit_signals: bool = False,
+                fast: bool = False):
     """Decode a a deserialized Part dictionary
 
     Args:
@@ -120,6 +128,9 @@ def decodePart( document: DocT,
         part_dict: deserialized dictionary describing the Part
         grid_type:
         emit_signals:
+        fast: create the virtual helices, strands and crossovers in bulk with
+            a :class:`PartBuilder`, refreshing segments and oligos once at
+            the end, rather than one at a time
     """
     if ( part_dict.get('point_type') == PointEnum.ARBITRARY or
         not part_dict.get('is_lattice', True) ):
@@ -132,15 +143,86 @@ def decodePart( document: DocT,
                                             grid_type=grid_type)
     part.setActive(True)
 
+    origins = part_dict.get('origins', [])
+    if len(origins) == 0:
+        raise ValueError("no virtual_helices found, origins length zero")
+
+    if fast:
+        _buildPart(part, part_dict, is_lattice)
+        if emit_signals:
+            part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), True)
+    else:
+        _createPartItems(part, part_dict, is_lattice, emit_signals)
+
+    for oligo in part_dict['oligos']:
+        id_num = oligo['id_num']
+        idx = oligo['idx5p']
+        is_fwd = oligo['is_5p_fwd']
+        color = oligo['color']
+        sequence = oligo['sequence']
+        name = oligo['name']
+        strand5p = part.getStrand(is_fwd, id_num, idx)
+        this_oligo = strand5p.oligo()
+        # this_oligo.applyColor(color, use_undostack=False)
+        if sequence is not None:
+            this_oligo.applySequence(sequence, use_undostack=False)
+        if name is not None:
+            this_oligo.setProperty('name', name)
+    # end for
+
+    # INSERTIONS, SKIPS
+    for id_num, idx, length in part_dict['insertions']:
+        fwd_strand = part.getStrand(True, id_num, idx)
+        rev_strand = part.getStrand(False, id_num, idx)
+        if fwd_strand:
+            fwd_strand.addInsertion(idx, length, use_undostack=False)
+        elif rev_strand:
+            rev_strand.addInsertion(idx, length, use_undostack=False)
+        else:
+            ins = 'Insertion' if length > 0 else 'Skip'
+            print("Cannot find strand for {} at {}[{}]".format(ins, id_num, idx))
+    # end for
+
+    # TODO fix this to set position
+    # instance_props = part_dict['instance_properties']    # list
+
+    vh_order = part_dict['virtual_helix_order']
+    if vh_order:
+        # print("import order", vh_order)
+        part.setImportedVHelixOrder(vh_order)
+
+    # Restore additional Part properties
+    for key in ('name',
+                'color',
+                'crossover_span_angle',
+                'max_vhelix_length'
+                ):
+        value = part_dict.get(key)
+        if value is not None:
+            part.setProperty(key, value, use_undostack=False)
+            part.partPropertyChangedSignal.emit(part, key, value)
+# end def
+
+
+def _createPartItems(part: NucleicAcidPartT,
+                     part_dict: dict,
+                     is_lattice: bool,
+                     emit_signals: bool):
+    """Create the virtual helices, strands and crossovers of ``part_dict``
+    one at a time, then assign the oligos
+
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+        is_lattice:
+        emit_signals:
+    """
     vh_id_list = part_dict.get('vh_list')
     vh_props = part_dict.get('virtual_helices')
     origins = part_dict.get('origins', [])
     directions = part_dict.get('directions', [])
     keys = list(vh_props.keys())
 
-    if len(origins) == 0:
-        raise ValueError("no virtual_helices found, origins length zero")
-
     if not is_lattice or len(origins[0]) == 3:
         for id_num, size in vh_id_list:
             x, y, z = origins[id_num]
@@ -200,53 +282,60 @@ def decodePart( document: DocT,
     # end for
 
     RefreshOligosCommand(part).redo()
-    for oligo in part_dict['oligos']:
-        id_num = oligo['id_num']
-        idx = oligo['idx5p']
-        is_fwd = oligo['is_5p_fwd']
-        color = oligo['color']
-        sequence = oligo['sequence']
-        name = oligo['name']
-        strand5p = part.getStrand(is_fwd, id_num, idx)
-        this_oligo = strand5p.oligo()
-        # this_oligo.applyColor(color, use_undostack=False)
-        if sequence is not None:
-            this_oligo.applySequence(sequence, use_undostack=False)
-        if name is not None:
-            this_oligo.setProperty('name', name)
-    # end for
+# end def
 
-    # INSERTIONS, SKIPS
-    for id_num, idx, length in part_dict['insertions']:
-        fwd_strand = part.getStrand(True, id_num, idx)
-        rev_strand = part.getStrand(False, id_num, idx)
-        if fwd_strand:
-            fwd_strand.addInsertion(idx, length, use_undostack=False)
-        elif rev_strand:
-            rev_strand.addInsertion(idx, length, use_undostack=False)
-        else:
-            ins = 'Insertion' if length > 0 else 'Skip'
-            print("Cannot find strand for {} at {}[{}]".format(ins, id_num, idx))
-    # end for
 
-    # TODO fix this to set position
-    # instance_props = part_dict['instance_properties']    # list
+def _buildPart(part: NucleicAcidPartT, part_dict: dict, is_lattice: bool):
+    """Bulk version of :func:`_createPartItems`
 
-    vh_order = part_dict['virtual_helix_order']
-    if vh_order:
-        # print("import order", vh_order)
-        part.setImportedVHelixOrder(vh_order)
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+        is_lattice:
+    """
+    vh_id_list = part_dict.get('vh_list')
+    vh_props = part_dict.get('virtual_helices')
+    origins = part_dict.get('origins', [])
+    directions = part_dict.get('directions', [])
+    keys = list(vh_props.keys())
 
-    # Restore additional Part properties
-    for key in ('name',
-                'color',
-                'crossover_span_angle',
-                'max_vhelix_length'
-                ):
-        value = part_dict.get(key)
-        if value is not None:
-            part.setProperty(key, value, use_undostack=False)
-            part.partPropertyChangedSignal.emit(part, key, value)
+    id_nums = [id_num for id_num, _ in vh_id_list]
+    lengths = [size for _, size in vh_id_list]
+    if not is_lattice or len(origins[0]) == 3:
+        for id_num in id_nums:
+            vh_props['eulerZ'][id_num] = 0.5*(360./10.5)
+        vh_origins = [origins[id_num] for id_num in id_nums]
+        vh_directions = [directions[id_num] for id_num in id_nums]
+    else:
+        z_list = vh_props['z']
+        vh_origins = [(origins[id_num][0], origins[id_num][1], z_list[id_num])
+                      for id_num in id_nums]
+        vh_directions = None
+
+    builder = PartBuilder(part)
+    builder.addVirtualHelices(vh_origins, lengths,
+                              directions=vh_directions,
+                              id_nums=id_nums,
+                              properties={k: [vh_props[k][id_num] for id_num in id_nums]
+                                          for k in keys})
+
+    strands = part_dict['strands']
+    strand_index_list = strands['indices']
+    color_list = strands['properties']
+    rows = []
+    for i in range(len(vh_id_list)):
+        id_num = vh_id_list[i][0]
+        idx_set = strand_index_list[i]
+        if idx_set is not None:
+            fwd_idxs, rev_idxs = idx_set
+            fwd_colors, rev_colors = color_list[i]
+            rows += [(id_num, True, low_idx, high_idx, color)
+                     for (low_idx, high_idx), color in zip(fwd_idxs, fwd_colors)]
+            rows += [(id_num, False, low_idx, high_idx, color)
+                     for (low_idx, high_idx), color in zip(rev_idxs, rev_colors)]
+    builder.addStrands(rows)
+    builder.addXovers(part_dict['xovers'])
+    builder.build(safe=False, use_undostack=False)
 # end def
 
 
@@ -273,114 +362,115 @@ def importToPart(   part_instance : ObjectInstance,
     if use_undostack:
         undostack = part.undoStack()
         undostack.beginMacro("Import to Part")
-    id_num_offset = part.getMaxIdNum() + 1
-    if id_num_offset % 2 == 1:
-        id_num_offset += 1
-    vh_id_list = copy_dict['vh_list']
-    origins = copy_dict['origins']
-    directions = copy_dict['directions']
-    vh_props = copy_dict['virtual_helices']
-    name_suffix = ".%d"
-
-    xoffset = offset[0] if offset else 0
-    yoffset = offset[1] if offset else 0
-
-    keys = list(vh_props.keys())
-    name_index = keys.index('name')
-    new_vh_id_set = set()
-    copied_vh_index_set = set()
-    if offset is None:
-        offx, offy = 0, 0
-    else:
-        offx, offy = offset
-
-    for i, pair in enumerate(vh_id_list):
-        id_num, size = pair
-
-        ''' using `i` because we could be using a subset of all virtual
-        helices in a part'''
-        x, y, z = origins[i]
-        the_dir: Vec3T = directions[i]
-
-        if offset is not None:
-            x += offx
-            y += offy
-        # try:
-        #     # Don't use id_num since is compacted
-        #     z = vh_props['z'][i]
-        # except:
-        #     print(vh_props)
-        #     raise
-        vals = [vh_props[k][i] for k in keys]
-        new_id_num = i + id_num_offset
-        # print("creating", new_id_num)
-        vals[name_index] += (name_suffix % new_id_num)
-
-        # NOTE GOT RID OF 'if' BY NC SINCE 'neighbors' SHOULD JUST BE
-        # RECALCULATED ON THE FLY? TODO LOOK INTO THIS
-        try:
-            ignore_index = keys.index('neighbors')
-            fixed_keys = keys[:ignore_index] + keys[ignore_index + 1:]
-            fixed_vals = vals[:ignore_index] + vals[ignore_index + 1:]
-        except ValueError:
-            fixed_keys = keys
-            fixed_vals = vals
-        # end if
-
-        did_create = part.createVirtualHelix(x, y, z, size,
-                                id_num=new_id_num,
-                                direction=the_dir,
-                                properties=(fixed_keys, fixed_vals),
-                                safe=use_undostack,
-                                use_undostack=use_undostack)
-        if did_create:
-            copied_vh_index_set.add(i)
-            new_vh_id_set.add(new_id_num)
-    # end for
-    strands = copy_dict['strands']
-    strand_index_list = strands['indices']
-    color_list = strands['properties']
-    for i, idx_set in enumerate(strand_index_list):
-        if i not in copied_vh_index_set:
-            continue
-        if idx_set is not None:
-            fwd_strand_set, rev_strand_set = part.getStrandSets(i + id_num_offset)
-            fwd_idxs, rev_idxs = idx_set
-            fwd_colors, rev_colors = color_list[i]
-            for idxs, color in zip(fwd_idxs, fwd_colors):
-                low_idx, high_idx = idxs
-                fwd_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=use_undostack)
-
-            for idxs, color in zip(rev_idxs, rev_colors):
-                low_idx, high_idx = idxs
-                rev_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=use_undostack)
-    # end def
-
-    xovers = copy_dict['xovers']
-    for from_i, from_is_fwd, from_idx, to_i, to_is_fwd, to_idx in xovers:
-        from_strand = part.getStrand(from_is_fwd, from_i + id_num_offset, from_idx)
-        to_strand = part.getStrand(to_is_fwd, to_i + id_num_offset, to_idx)
-        part.createXover(from_strand, from_idx,
-                         to_strand, to_idx,
-                         update_oligo=use_undostack,
-                         use_undostack=use_undostack)
-    if not use_undostack:
-        RefreshOligosCommand(part).redo()
-
-    # INSERTIONS, SKIPS
-    for i, idx, length in copy_dict['insertions']:
-        fwd_strand = part.getStrand(True, i + id_num_offset, idx)
-        rev_strand = part.getStrand(False, i + id_num_offset, idx)
-        if fwd_strand:
-            fwd_strand.addInsertion(idx, length, use_undostack=use_undostack)
-        elif rev_strand:
-            rev_strand.addInsertion(idx, length, use_undostack=use_undostack)
+    with part.deferSignals():
+        id_num_offset = part.getMaxIdNum() + 1
+        if id_num_offset % 2 == 1:
+            id_num_offset += 1
+        vh_id_list = copy_dict['vh_list']
+        origins = copy_dict['origins']
+        directions = copy_dict['directions']
+        vh_props = copy_dict['virtual_helices']
+        name_suffix = ".%d"
+
+        xoffset = offset[0] if offset else 0
+        yoffset = offset[1] if offset else 0
+
+        keys = list(vh_props.keys())
+        name_index = keys.index('name')
+        new_vh_id_set = set()
+        copied_vh_index_set = set()
+        if offset is None:
+            offx, offy = 0, 0
         else:
-            ins = 'Insertion' if length > 0 else 'Skip'
-            err = "Cannot find strand for {} at {}[{}]"
-            print(err.format(ins, i + id_num_offset, idx))
+            offx, offy = offset
+
+        for i, pair in enumerate(vh_id_list):
+            id_num, size = pair
+
+            ''' using `i` because we could be using a subset of all virtual
+            helices in a part'''
+            x, y, z = origins[i]
+            the_dir: Vec3T = directions[i]
+
+            if offset is not None:
+                x += offx
+                y += offy
+            # try:
+            #     # Don't use id_num since is compacted
+            #     z = vh_props['z'][i]
+            # except:
+            #     print(vh_props)
+            #     raise
+            vals = [vh_props[k][i] for k in keys]
+            new_id_num = i + id_num_offset
+            # print("creating", new_id_num)
+            vals[name_index] += (name_suffix % new_id_num)
+
+            # NOTE GOT RID OF 'if' BY NC SINCE 'neighbors' SHOULD JUST BE
+            # RECALCULATED ON THE FLY? TODO LOOK INTO THIS
+            try:
+                ignore_index = keys.index('neighbors')
+                fixed_keys = keys[:ignore_index] + keys[ignore_index + 1:]
+                fixed_vals = vals[:ignore_index] + vals[ignore_index + 1:]
+            except ValueError:
+                fixed_keys = keys
+                fixed_vals = vals
+            # end if
+
+            did_create = part.createVirtualHelix(x, y, z, size,
+                                    id_num=new_id_num,
+                                    direction=the_dir,
+                                    properties=(fixed_keys, fixed_vals),
+                                    safe=use_undostack,
+                                    use_undostack=use_undostack)
+            if did_create:
+                copied_vh_index_set.add(i)
+                new_vh_id_set.add(new_id_num)
+        # end for
+        strands = copy_dict['strands']
+        strand_index_list = strands['indices']
+        color_list = strands['properties']
+        for i, idx_set in enumerate(strand_index_list):
+            if i not in copied_vh_index_set:
+                continue
+            if idx_set is not None:
+                fwd_strand_set, rev_strand_set = part.getStrandSets(i + id_num_offset)
+                fwd_idxs, rev_idxs = idx_set
+                fwd_colors, rev_colors = color_list[i]
+                for idxs, color in zip(fwd_idxs, fwd_colors):
+                    low_idx, high_idx = idxs
+                    fwd_strand_set.createDeserializedStrand(low_idx, high_idx, color,
+                                                            use_undostack=use_undostack)
+
+                for idxs, color in zip(rev_idxs, rev_colors):
+                    low_idx, high_idx = idxs
+                    rev_strand_set.createDeserializedStrand(low_idx, high_idx, color,
+                                                            use_undostack=use_undostack)
+        # end def
+
+        xovers = copy_dict['xovers']
+        for from_i, from_is_fwd, from_idx, to_i, to_is_fwd, to_idx in xovers:
+            from_strand = part.getStrand(from_is_fwd, from_i + id_num_offset, from_idx)
+            to_strand = part.getStrand(to_is_fwd, to_i + id_num_offset, to_idx)
+            part.createXover(from_strand, from_idx,
+                             to_strand, to_idx,
+                             update_oligo=use_undostack,
+                             use_undostack=use_undostack)
+        if not use_undostack:
+            RefreshOligosCommand(part).redo()
+
+        # INSERTIONS, SKIPS
+        for i, idx, length in copy_dict['insertions']:
+            fwd_strand = part.getStrand(True, i + id_num_offset, idx)
+            rev_strand = part.getStrand(False, i + id_num_offset, idx)
+            if fwd_strand:
+                fwd_strand.addInsertion(idx, length, use_undostack=use_undostack)
+            elif rev_strand:
+                rev_strand.addInsertion(idx, length, use_undostack=use_undostack)
+            else:
+                ins = 'Insertion' if length > 0 else 'Skip'
+                err = "Cannot find strand for {} at {}[{}]"
+                print(err.format(ins, i + id_num_offset, idx))
 
     """
     TODO: figure out copy_dict['view_properties'] handling here
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""Opt-in timing counters of the hot paths of the model
+
+:func:`enable` wraps, until :func:`disable`:
+
+1. ``redo`` and ``undo`` of every :class:`UndoCommand` subclass, timed by
+   class.  The times of a macro include the times of its commands.
+2. The emits of the proxy signals, counted and timed by signal name.  The
+   time is spent in the connected slots.
+3. :meth:`NucleicAcidPart.queryBasePoint`,
+   :meth:`NucleicAcidPart.queryVirtualHelixOrigin` and
+   :meth:`NucleicAcidPart.queryIdNumNeighbor`, whose parts also report the
+   hit rates of their query caches.
+
+Nothing is wrapped while disabled, so it costs nothing.  Read the counters
+with :func:`snapshot`, format them with :func:`report` and zero them with
+:func:`reset`, or print the report when the program exits with
+:func:`dumpAtExit`, as ``cadnano --instrument`` does.
+"""
+import atexit
+import sys
+import time
+import weakref
+from functools import wraps
+from typing import (
+    Callable,
+    Dict,
+    List,
+    TextIO
+)
+
+QUERY_METHODS = ('queryBasePoint', 'queryVirtualHelixOrigin', 'queryIdNumNeighbor')
+
+_commands: Dict[str, List] = {}
+"""'<class>.<redo or undo>': [count, seconds]"""
+_signals: Dict[str, List] = {}
+"""signal name: [count, seconds]"""
+_queries: Dict[str, List] = {}
+"""query method name: [count, seconds]"""
+_parts = weakref.WeakSet()
+"""parts queried since the last :func:`reset`"""
+_patched: List[tuple] = []
+"""(owner, attribute, original) of the wrapped attributes"""
+
+
+def _count(stats: dict, key: str, seconds: float):
+    entry = stats.get(key)
+    if entry is None:
+        stats[key] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+# end def
+
+
+def _patch(owner: type, name: str, wrapper: Callable):
+    _patched.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+# end def
+
+
+def _timedCommand(func: Callable, key: str) -> Callable:
+    @wraps(func)
+    def timed(self):
+        start = time.perf_counter()
+        try:
+            return func(self)
+        finally:
+            _count(_commands, key, time.perf_counter() - start)
+    return timed
+# end def
+
+
+def _timedQuery(func: Callable, key: str) -> Callable:
+    @wraps(func)
+    def timed(self, *args, **kwargs):
+        _parts.add(self)
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _count(_queries, key, time.perf_counter() - start)
+    return timed
+# end def
+
+
+def _timedEmitNow(func: Callable) -> Callable:
+    @wraps(func)
+    def timed(self, sender, args):
+        start = time.perf_counter()
+        try:
+            return func(self, sender, args)
+        finally:
+            _count(_signals, self.name, time.perf_counter() - start)
+    return timed
+# end def
+
+
+def _countedBoundEmit(func: Callable) -> Callable:
+    from cadnano.proxies import signalqueue
+
+    @wraps(func)
+    def counted(self, *args):
+        signal = self.signal
+        if (signalqueue.active_queue is None and
+                not (signal._receivers or signal._by_sender)):
+            # nothing to call, the others are timed by emitNow
+            _count(_signals, signal.name, 0.)
+        return func(self, *args)
+    return counted
+# end def
+
+
+def _timedQtGet(func: Callable) -> Callable:
+    from cadnano.proxies.cnproxy import DeferredQtSignal
+
+    @wraps(func)
+    def get(self, obj, objtype=None):
+        bound = func(self, obj, objtype)
+        if obj is None or isinstance(bound, DeferredQtSignal):
+            # deferred emits are timed when flushed by emitNow
+            return bound
+        return _TimedQtSignal(self.name, bound)
+    return get
+# end def
+
+
+class _TimedQtSignal(object):
+    """``pyqtBoundSignal`` whose emits are timed
+    """
+    __slots__ = ('name', 'bound')
+
+    def __init__(self, name: str, bound):
+        self.name = name
+        self.bound = bound
+    # end def
+
+    def __getattr__(self, attr: str):
+        return getattr(self.bound, attr)
+    # end def
+
+    def emit(self, *args):
+        start = time.perf_counter()
+        try:
+            self.bound.emit(*args)
+        finally:
+            _count(_signals, self.name, time.perf_counter() - start)
+    # end def
+# end class
+
+
+def _commandClasses(base: type) -> List[type]:
+    classes = [base]
+    for cls in classes:
+        classes.extend(sub for sub in cls.__subclasses__() if sub not in classes)
+    return classes
+# end def
+
+
+def isEnabled() -> bool:
+    return bool(_patched)
+# end def
+
+
+def enable():
+    """Start timing.  Only the command classes imported by now are timed.
+    """
+    if _patched:
+        return
+    from cadnano.part.nucleicacidpart import NucleicAcidPart
+    from cadnano.proxies import cnproxy
+    for cls in _commandClasses(cnproxy.UndoCommand):
+        for name in ('redo', 'undo'):
+            if name in cls.__dict__:
+                _patch(cls, name, _timedCommand(cls.__dict__[name], cls.__name__ + '.' + name))
+    _patch(cnproxy.DummySignal, 'emitNow', _timedEmitNow(cnproxy.DummySignal.emitNow))
+    _patch(cnproxy.QtSignal, 'emitNow', _timedEmitNow(cnproxy.QtSignal.emitNow))
+    _patch(cnproxy.BoundSignal, 'emit', _countedBoundEmit(cnproxy.BoundSignal.emit))
+    if cnproxy.ProxySignal is cnproxy.QtSignal:
+        _patch(cnproxy.QtSignal, '__get__', _timedQtGet(cnproxy.QtSignal.__get__))
+    for name in QUERY_METHODS:
+        _patch(NucleicAcidPart, name, _timedQuery(NucleicAcidPart.__dict__[name], name))
+# end def
+
+
+def disable():
+    """Stop timing, keeping the counters
+    """
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+# end def
+
+
+def reset():
+    """Zero the counters, including the cache counters of the queried parts
+    """
+    _commands.clear()
+    _signals.clear()
+    _queries.clear()
+    for part in list(_parts):
+        part.queryCacheStats(reset=True)
+        part.crossoverCacheStats(reset=True)
+    _parts.clear()
+# end def
+
+
+def snapshot() -> dict:
+    """Returns:
+        ``dict`` of form::
+
+            {'commands': {'<class>.<redo or undo>': (count, seconds)},
+             'signals': {signal_name: (count, seconds)},
+             'queries': {method_name: (count, seconds)},
+             'caches': {'point' or 'origin' or 'crossover': {'hits': int, 'misses': int}}}
+
+        the cache counters are summed over the queried parts
+    """
+    caches = {name: {'hits': 0, 'misses': 0} for name in ('point', 'origin', 'crossover')}
+    for part in list(_parts):
+        stats = part.queryCacheStats()
+        stats['crossover'] = part.crossoverCacheStats()
+        for name, counters in caches.items():
+            counters['hits'] += stats[name]['hits']
+            counters['misses'] += stats[name]['misses']
+    return {'commands': {key: tuple(value) for key, value in _commands.items()},
+            'signals': {key: tuple(value) for key, value in _signals.items()},
+            'queries': {key: tuple(value) for key, value in _queries.items()},
+            'caches': caches}
+# end def
+
+
+def report(stats: dict = None, top: int = 25) -> str:
+    """Args:
+        stats: a :func:`snapshot`, defaults to the current one
+        top: number of rows of each table, by total time
+
+    Returns:
+        the counters as text tables
+    """
+    if stats is None:
+        stats = snapshot()
+    lines = []
+    for title in ('commands', 'signals', 'queries'):
+        rows = sorted(stats[title].items(), key=lambda item: -item[1][1])
+        lines.append("%-48s %10s %12s %12s" % (title, "count", "total ms", "mean us"))
+        for key, (count, seconds) in rows[:top]:
+            lines.append("%-48s %10d %12.2f %12.2f" % (key[:48], count, 1e3*seconds, 1e6*seconds/count))
+        if len(rows) > top:
+            lines.append("... %d more" % (len(rows) - top))
+        lines.append("")
+    lines.append("%-48s %10s %12s %12s" % ("caches", "hits", "misses", "hit rate"))
+    for name, counters in stats['caches'].items():
+        total = counters['hits'] + counters['misses']
+        rate = "%11.1f%%" % (100.*counters['hits']/total) if total else "%12s" % "-"
+        lines.append("%-48s %10d %12d %s" % (name, counters['hits'], counters['misses'], rate))
+    return '\n'.join(lines) + '\n'
+# end def
+
+
+def dumpAtExit(stream: TextIO = None):
+    """Print the :func:`report` to ``stream``, ``sys.stderr`` by default,
+    when the program exits
+    """
+    def dump():
+        (sys.stderr if stream is None else stream).write(report())
+    atexit.register(dump)
+# end def
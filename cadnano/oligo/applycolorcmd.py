@@ -5,6 +5,8 @@ from cadnano.cntypes import (
 )
 
 class ApplyColorCommand(UndoCommand):
+    __slots__ = ('_oligo', '_new_color', '_old_color')
+
     def __init__(self, oligo: OligoT, color: str):
         super(ApplyColorCommand, self).__init__("apply color")
         self._oligo = oligo
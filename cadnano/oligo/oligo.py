@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import sys
 import traceback
+from bisect import bisect_right
 from typing import (
     Tuple,
     List,
@@ -19,6 +20,7 @@ from cadnano.proxies.cnenum import (
 )
 from cadnano.strand import Strand
 from .applycolorcmd import ApplyColorCommand
+from .oligomembership import OligoNode
 from .applysequencecmd import ApplySequenceCommand
 from .removeoligocmd import RemoveOligoCommand
 from cadnano.setpropertycmd import SetPropertyCommand
@@ -32,6 +34,9 @@ OLIGO_LEN_ABOVE_WHICH_HIGHLIGHT = 60
 MAX_HIGHLIGHT_LENGTH = 800
 
 PROPERTY_KEYS = ['name', 'color', 'length', 'is_visible']
+
+EXPORT_COLUMNS = ('Start', 'End', 'Color', 'Mod5', 'Sequence', 'Mod3', 'AbstractSequence')
+"""columns of the staple sequence export, see :meth:`Oligo.exportRow`"""
 ALL_KEYS = ['id_num', 'idx5p', 'is_circular'] + PROPERTY_KEYS
 
 
@@ -39,6 +44,58 @@ class CircularOligoException(Exception):
     pass
 
 
+_UNSET = object()
+
+
+class _DerivedData(object):
+    """What :class:`Oligo` derives from its strands, valid until the oligo
+    is touched with :meth:`Oligo._touch` or its 5' strand changes
+
+    Args:
+        strand5p: the 5' strand
+    """
+    __slots__ = ('strand5p', 'strands', 'prefix', 'sequence')
+
+    def __init__(self, strand5p: Strand):
+        self.strand5p = strand5p
+        self.strands = tuple(strand5p.generator3pStrand())
+        # prefix[i] is the length of the strands before strands[i]
+        prefix = [0]
+        total = 0
+        for strand in self.strands:
+            total += strand.totalLength()
+            prefix.append(total)
+        self.prefix = prefix
+        self.sequence = _UNSET
+    # end def
+# end class
+
+
+def _idxAtOffset(strand: Strand, offset: int) -> int:
+    """Returns:
+        the index of the base ``offset`` bases from the 5' end of ``strand``,
+        an insertion of length ``n`` counts ``n + 1`` bases and a skip none
+    """
+    step = 1 if strand.isForward() else -1
+    idx = strand.idx5Prime()
+    insertions = strand.insertionsOnStrand()
+    if step < 0:
+        insertions.reverse()
+    for insertion in insertions:
+        inst_idx = insertion.idx()
+        before = (inst_idx - idx)*step
+        if offset < before:
+            break
+        offset -= before
+        width = 1 + insertion.length()
+        if offset < width:
+            return inst_idx
+        offset -= width
+        idx = inst_idx + step
+    return idx + step*offset
+# end def
+
+
 class Oligo(CNObject):
     """
     Oligo is a group of Strands that are connected via 5' and/or 3'
@@ -53,6 +110,8 @@ class Oligo(CNObject):
         part (Part): the model :class:`Part`
         color (str): optional, color property of the :class:`Oligo`
     """
+    __slots__ = ('_part', '_strand5p', '_is_circular', '_node', '_props', '_derived')
+
     editable_properties = ['name', 'color']
 
     def __init__(self, part, color=None, length=0):
@@ -60,6 +119,10 @@ class Oligo(CNObject):
         self._part = part
         self._strand5p = None
         self._is_circular = False
+        # union-find node of the strands of this oligo, see oligomembership
+        self._node = OligoNode(self)
+        # see _derivedData
+        self._derived = None
         self._props = {'name': "oligo%s" % str(id(self))[-4:],
                        'color': "#cc0000" if color is None else color,
                        'length': length,
@@ -129,6 +192,10 @@ class Oligo(CNObject):
 
     oligoSelectedChangedSignal = ProxySignal(CNObject, bool, name='oligoSelectedChangedSignal')
     """pyqtSignal(QObject, bool): (oligo, bool)"""
+
+    oligoStrandsChangedSignal = ProxySignal(CNObject, name='oligoStrandsChangedSignal')
+    """self, strands of this oligo were moved to or from another oligo at once
+    without a strandHasNewOligoSignal each"""
     ### SLOTS ###
 
     ### ACCESSORS ###
@@ -201,6 +268,10 @@ class Oligo(CNObject):
     # end def
 
     def _setLength(self, length: int, emit_signals: bool):
+        batch = self._part._batch
+        if batch is not None:
+            # lengths derived from a deferred refreshLength are refreshed
+            batch.oligo_lengths.add(self)
         before = self.shouldHighlight()
         key = 'length'
         self._props[key] = length
@@ -281,14 +352,46 @@ class Oligo(CNObject):
         Returns:
             str or None
         """
-        temp = self.strand5p()
-        if not temp:
-            return None
-        if temp.sequence():
-            return ''.join([Strand.sequence(strand)
-                            for strand in self.strand5p().generator3pStrand()])
-        else:
+        if not self._strand5p:
             return None
+        data = self._derivedData()
+        sequence = data.sequence
+        if sequence is _UNSET:
+            if data.strands[0].sequence():
+                sequence = ''.join([Strand.sequence(strand) for strand in data.strands])
+            else:
+                sequence = None
+            data.sequence = sequence
+        return sequence
+    # end def
+
+    def strands(self) -> Tuple[Strand, ...]:
+        """Returns:
+            the strands of the oligo from 5' to 3'
+        """
+        return self._derivedData().strands
+    # end def
+
+    def _derivedData(self) -> _DerivedData:
+        """The strands, lengths and sequence of the oligo are kept until the
+        oligo is touched with :meth:`_touch` or the 5' strand changes.
+
+        Returns:
+            the derived data of the oligo
+        """
+        data = self._derived
+        if data is None or data.strand5p is not self._strand5p:
+            data = self._derived = _DerivedData(self._strand5p)
+        return data
+    # end def
+
+    def _touch(self):
+        """Drop the strands, lengths and sequence cached by
+        :meth:`_derivedData`.  Called for every edit of the strands of the
+        oligo, their connections, indices, sequences and insertions, and when
+        strands join or leave the oligo.
+        """
+        self._derived = None
     # end def
 
     def sequenceExport(self, output: dict) -> dict:
@@ -301,43 +404,64 @@ class Oligo(CNObject):
         Returns:
             output with this oligo's values appended for each key
         """
+        columns = tuple(output.keys())
+        for key, value in zip(columns, self.exportRow(columns)):
+            output[key].append(value)
+        return output
+    # end def
+
+    def exportRow(self, columns: Tuple[str, ...] = EXPORT_COLUMNS) -> tuple:
+        """Values of one row of the staple sequence export, only computing
+        what ``columns`` asks for
+
+        Args:
+            columns: names from ``EXPORT_COLUMNS``
+
+        Returns:
+            the value of each column, in order
+
+        Raises:
+            CircularOligoException: the oligo has no 5' and 3' ends
+            KeyError: unknown column
+        """
+        if self._is_circular:
+            raise CircularOligoException("Cannot export circular oligo " + self.getName())
         part = self.part()
-        vh_num5p = self.strand5p().idNum()
-        strand5p = self.strand5p()
+        strand5p = self._strand5p
         idx5p = strand5p.idx5Prime()
+        wanted = set(columns)
+        unknown = wanted.difference(EXPORT_COLUMNS)
+        if unknown:
+            raise KeyError("unknown export columns %s" % sorted(unknown))
+        with_seq = 'Sequence' in wanted
+        with_a_seq = 'AbstractSequence' in wanted
         seq = []
         a_seq = []
-        if self.isCircular():
-            # print("A loop exists")
-            raise CircularOligoException("Cannot export circular oligo " + self.getName())
         for strand in strand5p.generator3pStrand():
-            seq.append(Strand.sequence(strand, for_export=True))
-            a_seq.append(Strand.abstractSeq(strand))
-            if strand.connection3p() is None:  # last strand in the oligo
-                vh_num3p = strand.idNum()
-                idx3p = strand.idx3Prime()
-        a_seq = ','.join(a_seq)
-        a_seq = "(%s)" % (a_seq)
-        modseq5p, modseq5p_name = part.getStrandModSequence(strand5p, idx5p,
-                                                            ModEnum.END_5PRIME)
-        modseq3p, modseq3p_name = part.getStrandModSequence(strand, idx3p,
-                                                            ModEnum.END_3PRIME)
-        seq = ''.join(seq)
-        seq = modseq5p + seq + modseq3p
-        # output = "%d[%d]\t%d[%d]\t%s\t%s\t%s\t%s\t(%s)\n" % \
-        #          (vh_num5p, idx5p, vh_num3p, idx3p, self.getColor(),
-        #           modseq5p_name, seq, modseq3p_name, a_seq)
-        # these are the keys
-        # keys = ['Start','End','Color', 'Mod5',
-        #         'Sequence','Mod3','AbstractSequence']
-        output['Start'].append("%d[%d]" % (vh_num5p, idx5p))
-        output['End'].append("%d[%d]" % (vh_num3p, idx3p))
-        output['Color'].append(self.getColor())
-        output['Mod5'].append(modseq5p_name)
-        output['Sequence'].append(seq)
-        output['Mod3'].append(modseq3p_name)
-        output['AbstractSequence'].append(a_seq)
-        return output
+            if with_seq:
+                seq.append(Strand.sequence(strand, for_export=True))
+            if with_a_seq:
+                a_seq.append(Strand.abstractSeq(strand))
+        # the loop leaves strand at the 3' end
+        idx3p = strand.idx3Prime()
+        values = {}
+        if with_seq or 'Mod5' in wanted:
+            modseq5p, values['Mod5'] = part.getStrandModSequence(strand5p, idx5p,
+                                                                 ModEnum.END_5PRIME)
+        if with_seq or 'Mod3' in wanted:
+            modseq3p, values['Mod3'] = part.getStrandModSequence(strand, idx3p,
+                                                                 ModEnum.END_3PRIME)
+        if with_seq:
+            values['Sequence'] = modseq5p + ''.join(seq) + modseq3p
+        if with_a_seq:
+            values['AbstractSequence'] = "(%s)" % ','.join(a_seq)
+        if 'Start' in wanted:
+            values['Start'] = "%d[%d]" % (strand5p.idNum(), idx5p)
+        if 'End' in wanted:
+            values['End'] = "%d[%d]" % (strand.idNum(), idx3p)
+        if 'Color' in wanted:
+            values['Color'] = self.getColor()
+        return tuple(values[key] for key in columns)
     # end def
 
     def shouldHighlight(self) -> bool:
@@ -417,11 +541,8 @@ class Oligo(CNObject):
         Returns:
             list of lengths of individual strands in the oligo
         """
-        strand5p = self.strand5p()
-        strand_lengths = []
-        for strand in strand5p.generator3pStrand():
-            strand_lengths.append(strand.totalLength())
-        return strand_lengths
+        prefix = self._derivedData().prefix
+        return [high - low for low, high in zip(prefix, prefix[1:])]
 
     def getNumberOfBasesToEachXover(self, use_3p_idx: bool = False) -> List[int]:
         """Convenience method to get a list of absolute distances from the 5' end
@@ -433,15 +554,11 @@ class Oligo(CNObject):
         Returns:
             list of integet differences
         """
-        strand5p = self.strand5p()
-        num_bases_to_xovers = []
+        data = self._derivedData()
         offset = 1 if use_3p_idx else 0  # 3p xover idx is always the next base
-        i = 0
-        for strand in strand5p.generator3pStrand():
-            if strand.connection3p():
-                i = i + strand.totalLength()
-                num_bases_to_xovers.append(i+offset)
-        return num_bases_to_xovers
+        # only the 3' strand has no 3' connection, if the oligo isn't circular
+        return [length + offset for strand, length in zip(data.strands, data.prefix[1:])
+                if strand.connection3p()]
 
     def splitAtAbsoluteLengths(self, len_list: List[int]):
         self._part.splitOligoAtAbsoluteLengths(self, len_list)
@@ -469,18 +586,39 @@ class Oligo(CNObject):
             tuple of form::
 
                 (vh, strandtype, baseidx)
+
+            or ``None`` past the 3' end
         """
-        strand5p = self.strand5p()
-        temp_len = 0
-        for strand in strand5p.generator3pStrand():
-            if (temp_len + strand.totalLength()) > len_for_pos:
-                vh = strand.idNum()
-                strandset = strand.strandType()
-                baseidx = strand.idx5Prime() + len_for_pos - temp_len
-                return (vh, strandset, baseidx)
-            else:
-                temp_len += strand.totalLength()
-        return None
+        return self.positionsAtLengths([len_for_pos])[0]
+    # end def
+
+    def positionsAtLengths(self, lengths: List[int]) -> List[Optional[Tuple[int, EnumType, int]]]:
+        """Convert many lengths in bases from the 5' end of the oligo to
+        absolute positions at once.  The strand of each length is found by
+        bisecting the cumulative strand lengths, insertions and skips
+        included.  Within a strand the position counts from its 5' end, a
+        length falling on an insertion gives the index of the insertion.
+
+        Args:
+            lengths: lengths in bases for position lookup
+
+        Returns:
+            list of ``(vh, strandtype, baseidx)`` or ``None`` for a length
+            out of the oligo, in the order of ``lengths``
+        """
+        data = self._derivedData()
+        strands, prefix = data.strands, data.prefix
+        num_strands = len(strands)
+        positions = []
+        for length in lengths:
+            i = bisect_right(prefix, length) - 1
+            if length < 0 or i >= num_strands:
+                positions.append(None)
+                continue
+            strand = strands[i]
+            idx = _idxAtOffset(strand, length - prefix[i])
+            positions.append((strand.idNum(), strand.strandType(), idx))
+        return positions
     # end def
 
     def setPart(self, part):
@@ -514,13 +652,16 @@ class Oligo(CNObject):
     # end def
 
     def refreshLength(self, emit_signals: bool = False):
-        temp = self.strand5p()
-        if not temp:
+        """Sum the length of the strands of this oligo.  Inside a
+        :meth:`NucleicAcidPart.batch` this is deferred until the batch closes
+        """
+        batch = self._part._batch
+        if batch is not None:
+            batch.oligo_lengths.add(self)
             return
-        length = 0
-        for strand in temp.generator3pStrand():
-            length += strand.totalLength()
-        self._setLength(length, emit_signals)
+        if not self._strand5p:
+            return
+        self._setLength(self._derivedData().prefix[-1], emit_signals)
     # end def
 
     def removeFromPart(self, emit_signals: bool = False):
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Union-find membership of strands in oligos
+
+Every :class:`Oligo` owns an :class:`OligoNode` and a :class:`Strand` points at
+the node of the oligo it was given with ``Strand.setOligo``.  The oligo of a
+strand is the label of the root of its node.  Joining two oligos with a
+crossover links their roots (union by rank) and relabels the new root, so the
+strands of the joined oligo are never visited.
+
+:func:`joinOligos` returns an :class:`OligoUnion` that :func:`splitOligo`
+rolls back in constant time as long as no strand has left the joined set in
+the meantime, which is the case for undo and redo of a crossover.  Otherwise
+:func:`splitOligo` falls back to relabeling the strands 3' of the split.
+"""
+from cadnano.cntypes import (
+    OligoT,
+    StrandT
+)
+
+
+class OligoUnion(object):
+    """Record of a :func:`joinOligos` to roll it back
+
+    Args:
+        child: the root linked below ``parent``
+        parent: the root of the joined set
+    """
+    __slots__ = ('child', 'parent', 'parent_rank', 'parent_oligo', 'version', 'joins')
+
+    def __init__(self, child: 'OligoNode', parent: 'OligoNode'):
+        self.child = child
+        self.parent = parent
+        self.parent_rank = parent.rank
+        self.parent_oligo = parent.oligo
+        self.version = parent.version
+        self.joins = parent.joins + 1
+    # end def
+
+    def isValid(self) -> bool:
+        """Returns:
+            ``True`` if the union is still the last change of its set
+        """
+        child = self.child
+        parent = self.parent
+        return (child.union is self and child.parent is parent and
+                parent.parent is None and parent.version == self.version and
+                parent.joins == self.joins)
+    # end def
+# end class
+
+
+class OligoNode(object):
+    """A set of strands of the same oligo
+
+    Args:
+        oligo: the oligo of the set while this node is a root
+    """
+    __slots__ = ('parent', 'rank', 'oligo', 'union', 'version', 'joins')
+
+    def __init__(self, oligo: OligoT):
+        self.parent: OligoNode = None
+        self.rank: int = 0
+        self.oligo: OligoT = oligo
+        # the union that linked this node to its parent, while it may be rolled back
+        self.union: OligoUnion = None
+        # bumped when a strand leaves a set through this node
+        self.version: int = 0
+        # number of unions into this node that may be rolled back
+        self.joins: int = 0
+    # end def
+
+    def find(self) -> 'OligoNode':
+        """Returns:
+            the root of this node.  The path is compressed, except across the
+            links of unions that may still be rolled back
+        """
+        node = self
+        path = []
+        while node.parent is not None:
+            union = node.union
+            if union is not None and union.version != node.parent.version:
+                # stale, it will never be rolled back
+                node.union = union = None
+            if union is None:
+                path.append(node)
+            else:
+                for item in path:
+                    item.parent = node
+                path = []
+            node = node.parent
+        for item in path:
+            item.parent = node
+        return node
+    # end def
+
+    def release(self):
+        """Called when a strand pointing at this node moves to another oligo,
+        invalidating the unions of the sets on its path
+        """
+        node = self
+        while node is not None:
+            node.version += 1
+            node = node.parent
+    # end def
+# end class
+
+
+def joinOligos(oligo5p: OligoT, oligo3p: OligoT, emit_signals: bool = False) -> OligoUnion:
+    """Move every strand of ``oligo3p`` to ``oligo5p`` without visiting them
+
+    Args:
+        oligo5p: the oligo that is kept
+        oligo3p: the oligo whose strands join ``oligo5p``
+        emit_signals: emit ``oligo3p.oligoStrandsChangedSignal``
+
+    Returns:
+        the union to pass to :func:`splitOligo`
+    """
+    root5p = oligo5p._node.find()
+    root3p = oligo3p._node.find()
+    if root5p.rank < root3p.rank:
+        child, parent = root5p, root3p
+    else:
+        child, parent = root3p, root5p
+    union = OligoUnion(child, parent)
+    child.parent = parent
+    child.union = union
+    parent.joins += 1
+    if child.rank == parent.rank:
+        parent.rank += 1
+    parent.oligo = oligo5p
+    oligo5p._touch()
+    oligo3p._touch()
+    if emit_signals:
+        oligo3p.oligoStrandsChangedSignal.emit(oligo3p)
+    return union
+# end def
+
+
+def splitOligo(union: OligoUnion, oligo3p: OligoT, strand3p: StrandT,
+               emit_signals: bool = False) -> bool:
+    """Move ``strand3p`` and the strands 3' of it to ``oligo3p``, undoing
+    ``union`` if possible
+
+    Args:
+        union: the :func:`joinOligos` that added ``oligo3p`` to the oligo of
+            ``strand3p`` or ``None``
+        oligo3p: the oligo of the split off strands
+        strand3p: the 5' strand of ``oligo3p``, no longer connected 5'
+        emit_signals: emit the ``oligoStrandsChangedSignal`` of the oligo the
+            strands leave or the ``strandHasNewOligoSignal`` of every strand
+
+    Returns:
+        ``True`` if ``union`` was rolled back, ``False`` if the strands were
+        relabeled
+    """
+    if union is not None and union.isValid():
+        child = union.child
+        parent = union.parent
+        oligo5p = parent.oligo
+        child.parent = None
+        child.union = None
+        parent.joins -= 1
+        parent.rank = union.parent_rank
+        parent.oligo = union.parent_oligo
+        oligo5p._touch()
+        oligo3p._touch()
+        if emit_signals:
+            oligo5p.oligoStrandsChangedSignal.emit(oligo5p)
+        return True
+    oligo3p._node = OligoNode(oligo3p)
+    for strand in strand3p.generator3pStrand():
+        # emits strandHasNewOligoSignal
+        strand.setOligo(oligo3p, emit_signals)
+    return False
+# end def
+
@@ -4,6 +4,8 @@ from cadnano.cntypes import (
 )
 
 class RemoveOligoCommand(UndoCommand):
+    __slots__ = ('_oligo', '_part', '_strand3p')
+
     def __init__(self, oligo: OligoT):
         super(RemoveOligoCommand, self).__init__("remove oligo")
         self._oligo = oligo
@@ -0,0 +1,51 @@
+from typing import (
+    Dict,
+    Optional
+)
+
+from cadnano.proxies.cnproxy import UndoCommand
+from cadnano.undocommand import (
+    packSequences,
+    unpackSequences
+)
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT
+)
+
+
+class ApplySequencesCommand(UndoCommand):
+    """Apply the sequences of many oligos of a part at once, see
+    :meth:`NucleicAcidPart.applySequences`.
+
+    The new and old sequences are each kept as one block compressed with
+    :func:`packSequences`.  Undo applies the old sequences in reverse order,
+    like undoing an :class:`ApplySequenceCommand` per oligo would.
+    """
+    __slots__ = ('_part', '_oligos', '_new_sequences', '_old_sequences')
+
+    def __init__(self, part: NucleicAcidPartT, assignments: Dict[OligoT, Optional[str]]):
+        super(ApplySequencesCommand, self).__init__("apply sequences")
+        self._part = part
+        self._oligos = tuple(assignments)
+        self._new_sequences = packSequences([None if seq is None else ''.join(seq)
+                                             for seq in assignments.values()])
+        self._old_sequences = packSequences([oligo.sequence() for oligo in self._oligos])
+    # end def
+
+    def redo(self):
+        self._apply(zip(self._oligos, unpackSequences(self._new_sequences)))
+    # end def
+
+    def undo(self):
+        self._apply(reversed(list(zip(self._oligos, unpackSequences(self._old_sequences)))))
+    # end def
+
+    def _apply(self, assignments):
+        part = self._part
+        oligo_list = part.sequenceBuffer().applySequences(dict(assignments))
+        with part.deferSignals():
+            for oligo in oligo_list:
+                oligo.oligoSequenceAddedSignal.emit(oligo)
+    # end def
+# end class
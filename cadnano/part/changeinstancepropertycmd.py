@@ -10,6 +10,8 @@ from cadnano.cntypes import (
 class ChangeInstancePropertyCommand(UndoCommand):
     """ Change ObjectInstance view properties"""
 
+    __slots__ = ('part', 'part_instance', 'view_name', 'flat_key', 'keyval', 'old_keyval')
+
     def __init__(self, part: PartT,
                         part_instance: ObjectInstanceT,
                         view_name: str,
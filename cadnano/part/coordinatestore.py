@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""Per virtual helix coordinate storage for :class:`NucleicAcidPart`
+
+Each virtual helix owns one chunk holding its axis, forward and reverse
+points with slack capacity at both ends, so appending, prepending or
+trimming bases only touches the points of that helix.  A contiguous packed
+copy of all points ordered by ID number, along with the matching
+``id_nums`` and ``indices`` arrays, is rebuilt lazily for bulk queries.
+"""
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    PointsT
+)
+
+AXIS, FWD, REV = 0, 1, 2
+
+DEFAULT_SLACK = 32  # minimum number of spare bases per end when reallocating
+GROWTH_FACTOR = 1.5
+
+
+class PackedPoints(NamedTuple):
+    """Contiguous copy of all points ordered by ID number then base index
+    """
+    axis_pts: np.ndarray
+    fwd_pts: np.ndarray
+    rev_pts: np.ndarray
+    id_nums: np.ndarray
+    indices: np.ndarray
+# end class
+
+
+def _emptyPacked() -> PackedPoints:
+    return PackedPoints(np.empty((0, 3), dtype=float),
+                        np.empty((0, 3), dtype=float),
+                        np.empty((0, 3), dtype=float),
+                        np.empty((0,), dtype=int),
+                        np.empty((0,), dtype=int))
+# end def
+
+
+class CoordinateStore(object):
+    """Chunked point storage keyed by virtual helix ID number
+
+    Args:
+        slack: minimum number of spare bases kept at each end of a chunk
+            when it is reallocated
+    """
+
+    def __init__(self, slack: int = DEFAULT_SLACK):
+        self.slack: int = int(slack)
+        self._chunks: Dict[int, np.ndarray] = {}
+        """``(3, capacity, 3)`` arrays of axis, forward and reverse points"""
+        self._bounds: Dict[int, List[int]] = {}
+        """``[lo, hi]`` of the used rows in each chunk"""
+        self._z_bounds: Dict[int, Tuple[float, float]] = {}
+        self._total_points: int = 0
+        self._offsets: Dict[int, int] = None
+        self._packed: PackedPoints = None
+    # end def
+
+    def __contains__(self, id_num: int) -> bool:
+        return id_num in self._chunks
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+    # end def
+
+    @property
+    def total_points(self) -> int:
+        return self._total_points
+    # end def
+
+    def copy(self) -> 'CoordinateStore':
+        """Returns:
+            a deep copy of the store
+        """
+        new_store = CoordinateStore(self.slack)
+        new_store._chunks = {id_num: chunk.copy() for id_num, chunk in self._chunks.items()}
+        new_store._bounds = {id_num: list(lo_hi) for id_num, lo_hi in self._bounds.items()}
+        new_store._z_bounds = self._z_bounds.copy()
+        new_store._total_points = self._total_points
+        return new_store
+    # end def
+
+    def idNums(self) -> List[int]:
+        """Returns:
+            sorted list of the stored ID numbers
+        """
+        return sorted(self._chunks)
+    # end def
+
+    def size(self, id_num: int) -> int:
+        """Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            number of bases of the virtual helix
+
+        Raises:
+            KeyError: ``id_num`` not stored
+        """
+        lo, hi = self._bounds[id_num]
+        return hi - lo
+    # end def
+
+    def capacity(self, id_num: int) -> int:
+        """Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            number of bases the chunk of ``id_num`` holds before reallocating
+        """
+        return self._chunks[id_num].shape[1]
+    # end def
+
+    def offsetAndSize(self, id_num: int) -> Tuple[int, int]:
+        """Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            tuple of form ``(offset, size)`` into the arrays of :meth:`packed`
+
+        Raises:
+            KeyError: ``id_num`` not stored
+        """
+        lo, hi = self._bounds[id_num]
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = {}
+            offset = 0
+            for i in sorted(self._bounds):
+                offsets[i] = offset
+                i_lo, i_hi = self._bounds[i]
+                offset += i_hi - i_lo
+        return offsets[id_num], hi - lo
+    # end def
+
+    def points(self, id_num: int) -> PointsT:
+        """Views onto the points of a virtual helix.  Call :meth:`touch`
+        after writing through them
+
+        Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            tuple of :obj:`ndarray` of form ``(axis_pts, fwd_pts, rev_pts)``
+
+        Raises:
+            KeyError: ``id_num`` not stored
+        """
+        chunk = self._chunks[id_num]
+        lo, hi = self._bounds[id_num]
+        return chunk[AXIS, lo:hi], chunk[FWD, lo:hi], chunk[REV, lo:hi]
+    # end def
+
+    def gather(self, which: int, id_nums: np.ndarray, idxs: np.ndarray) -> np.ndarray:
+        """Look up many points at once
+
+        Args:
+            which: one of ``AXIS``, ``FWD`` or ``REV``
+            id_nums: ID number of each point, grouped by ID number
+            idxs: base index of each point
+
+        Returns:
+            n x 3 :obj:`ndarray` of points
+        """
+        out = np.empty((len(id_nums), 3), dtype=float)
+        if len(id_nums) == 0:
+            return out
+        chunks = self._chunks
+        bounds = self._bounds
+        splits = np.flatnonzero(np.diff(id_nums)) + 1
+        starts = np.concatenate(([0], splits)).tolist()
+        stops = np.concatenate((splits, [len(id_nums)])).tolist()
+        for start, stop in zip(starts, stops):
+            id_num = int(id_nums[start])
+            out[start:stop] = chunks[id_num][which, bounds[id_num][0] + idxs[start:stop]]
+        return out
+    # end def
+
+    def create(self, id_num: int, capacity: int = 0):
+        """Add an empty virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            capacity: expected number of bases, to be prepended
+
+        Raises:
+            IndexError: ``id_num`` already stored
+        """
+        if id_num in self._chunks:
+            raise IndexError('id_num %s already exists' % id_num)
+        lo = max(int(capacity), 0) + self.slack
+        self._chunks[id_num] = np.full((3, lo + self.slack, 3), np.inf, dtype=float)
+        self._bounds[id_num] = [lo, lo]
+        self._z_bounds[id_num] = (np.inf, -np.inf)
+        self._offsets = None
+        self._packed = None
+    # end def
+
+    def delete(self, id_num: int):
+        """Remove a virtual helix and all of its points
+
+        Args:
+            id_num: virtual helix ID number
+
+        Raises:
+            KeyError: ``id_num`` not stored
+        """
+        self._total_points -= self.size(id_num)
+        del self._chunks[id_num]
+        del self._bounds[id_num]
+        del self._z_bounds[id_num]
+        self._offsets = None
+        self._packed = None
+    # end def
+
+    def _reserve(self, id_num: int, num_points: int, is_right: bool):
+        """Make room for ``num_points`` more points at one end of a chunk,
+        reallocating only that chunk when out of slack
+        """
+        chunk = self._chunks[id_num]
+        lo_hi = self._bounds[id_num]
+        lo, hi = lo_hi
+        capacity = chunk.shape[1]
+        if (hi + num_points <= capacity) if is_right else (lo - num_points >= 0):
+            return
+        size = hi - lo
+        new_size = size + num_points
+        spare = max(int(new_size*(GROWTH_FACTOR - 1.)), 2*self.slack)
+        new_chunk = np.full((3, new_size + spare, 3), np.inf, dtype=float)
+        new_lo = spare // 2
+        if not is_right:
+            new_lo += num_points
+        new_chunk[:, new_lo:new_lo + size] = chunk[:, lo:hi]
+        self._chunks[id_num] = new_chunk
+        lo_hi[0], lo_hi[1] = new_lo, new_lo + size
+    # end def
+
+    def insert(self, id_num: int, points: PointsT, is_right: bool):
+        """Add points to one end of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            points: tuple of n x 3 axis, forward and reverse points
+            is_right: whether to append, otherwise prepend
+        """
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        num_points = len(new_axis_pts)
+        self._reserve(id_num, num_points, is_right)
+        chunk = self._chunks[id_num]
+        lo_hi = self._bounds[id_num]
+        if is_right:
+            lo, hi = lo_hi[1], lo_hi[1] + num_points
+            lo_hi[1] = hi
+        else:
+            lo, hi = lo_hi[0] - num_points, lo_hi[0]
+            lo_hi[0] = lo
+        chunk[AXIS, lo:hi] = new_axis_pts
+        chunk[FWD, lo:hi] = new_fwd_pts
+        chunk[REV, lo:hi] = new_rev_pts
+        self._total_points += num_points
+        self._offsets = None
+        self.touch(id_num)
+    # end def
+
+    def remove(self, id_num: int, length: int, is_right: bool):
+        """Trim points from one end of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            length: number of points to remove
+            is_right: whether to trim the high end, otherwise the low end
+
+        Raises:
+            IndexError: ``length`` greater than the size of the virtual helix
+        """
+        size = self.size(id_num)
+        if length > size:
+            raise IndexError("length longer {} than indices existing".format(length))
+        chunk = self._chunks[id_num]
+        lo_hi = self._bounds[id_num]
+        if is_right:
+            chunk[:, lo_hi[1] - length:lo_hi[1]] = np.inf
+            lo_hi[1] -= length
+        else:
+            chunk[:, lo_hi[0]:lo_hi[0] + length] = np.inf
+            lo_hi[0] += length
+        self._total_points -= length
+        self._offsets = None
+        self.touch(id_num)
+    # end def
+
+    def set(self, id_num: int, points: PointsT, idx_start: int = 0):
+        """Overwrite points of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            points: tuple of n x 3 axis, forward and reverse points
+            idx_start: base index of the first point
+        """
+        chunk = self._chunks[id_num]
+        lo = self._bounds[id_num][0] + idx_start
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        hi = lo + len(new_axis_pts)
+        chunk[AXIS, lo:hi] = new_axis_pts
+        chunk[FWD, lo:hi] = new_fwd_pts
+        chunk[REV, lo:hi] = new_rev_pts
+        self.touch(id_num)
+    # end def
+
+    def translate(self, id_num: int, delta: np.ndarray):
+        """Args:
+            id_num: virtual helix ID number
+            delta: of :obj:`float` of length 3
+        """
+        chunk = self._chunks[id_num]
+        lo, hi = self._bounds[id_num]
+        chunk[:, lo:hi] += delta
+        self.touch(id_num)
+    # end def
+
+    def touch(self, id_num: int):
+        """Update the bookkeeping after the points of ``id_num`` change
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        lo, hi = self._bounds[id_num]
+        if hi > lo:
+            axis_z = self._chunks[id_num][AXIS, lo:hi, 2]
+            self._z_bounds[id_num] = (axis_z.min().item(), axis_z.max().item())
+        else:
+            self._z_bounds[id_num] = (np.inf, -np.inf)
+        self._packed = None
+    # end def
+
+    def zBoundsIds(self) -> Tuple[int, int]:
+        """Returns:
+            tuple of form ``(id_z_min, id_z_max)``, the lowest ID number
+            reaching the minimum and the maximum axis ``z``, ``-1`` if empty
+        """
+        id_z_min = id_z_max = -1
+        z_min, z_max = np.inf, -np.inf
+        for id_num in sorted(self._z_bounds):
+            lo, hi = self._z_bounds[id_num]
+            if lo < z_min:
+                z_min, id_z_min = lo, id_num
+            if hi > z_max:
+                z_max, id_z_max = hi, id_num
+        return id_z_min, id_z_max
+    # end def
+
+    def packed(self) -> PackedPoints:
+        """Contiguous copy of all points, rebuilt only after a change
+
+        Returns:
+            :class:`PackedPoints`.  Treat as read only
+        """
+        packed = self._packed
+        if packed is not None:
+            return packed
+        id_nums = self.idNums()
+        if not id_nums:
+            packed = _emptyPacked()
+        else:
+            bounds = self._bounds
+            chunks = self._chunks
+            pieces = [chunks[i][:, bounds[i][0]:bounds[i][1]] for i in id_nums]
+            sizes = [piece.shape[1] for piece in pieces]
+            pts = np.concatenate(pieces, axis=1)
+            packed_id_nums = np.repeat(np.array(id_nums, dtype=int), sizes)
+            starts = np.cumsum([0] + sizes[:-1])
+            indices = np.arange(len(packed_id_nums)) - np.repeat(starts, sizes)
+            packed = PackedPoints(pts[AXIS], pts[FWD], pts[REV], packed_id_nums, indices)
+        self._packed = packed
+        return packed
+    # end def
+# end class
@@ -1,11 +1,14 @@
 from ast import literal_eval
-import bisect
 from typing import (
+    Dict,
     Union,
     List,
+    Sequence,
     Tuple
 )
 
+import numpy as np
+
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     NucleicAcidPartT,
@@ -14,6 +17,11 @@ from cadnano.cntypes import (
 )
 
 class CreateVirtualHelixCommand(UndoCommand):
+    __slots__ = (
+        'part', 'id_num', 'origin_pt', 'direction', 'length', 'color', 'keys', 'neighbors',
+        'threshold', 'safe', 'old_limits', 'values'
+    )
+
     def __init__(self,
                 part: NucleicAcidPartT,
                 x: float,
@@ -63,7 +71,14 @@ class CreateVirtualHelixCommand(UndoCommand):
 
         self.neighbors: List[int] = []
         if not safe:
-            self.neighbors = literal_eval(self.values[self.keys.index('neighbors')])
+            neighbors_index = self.keys.index('neighbors')
+            neighbors = self.values[neighbors_index]
+            if isinstance(neighbors, str):
+                # parse the stored form once, and hand the list on to the part
+                neighbors = literal_eval(neighbors)
+                self.values = list(self.values)
+                self.values[neighbors_index] = neighbors
+            self.neighbors = list(neighbors)
 
         self.threshold: float = 2.1*part.radius()
         self.safe: bool = safe
@@ -84,13 +99,9 @@ class CreateVirtualHelixCommand(UndoCommand):
                     part._getVirtualHelixOriginNeighbors(id_num, self.threshold))
 
             neighbors = self.neighbors
-            part.vh_properties.loc[id_num, 'neighbors'] = str(list(neighbors))
+            part._setVirtualHelixNeighbors(id_num, neighbors)
             for neighbor_id in neighbors:
-                nneighbors = literal_eval(
-                    part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-                )
-                bisect.insort_left(nneighbors, id_num)
-                part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+                part._addVirtualHelixNeighbor(neighbor_id, id_num)
         else:
             neighbors = self.neighbors
         if self.keys is not None:
@@ -101,6 +112,7 @@ class CreateVirtualHelixCommand(UndoCommand):
                                            self.keys, self.values,
                                            emit_signals=False)
             part.resetCoordinates(id_num)
+        part._invalidateCrossoverCache(id_num)
         part.partVirtualHelixAddedSignal.emit(part, id_num, vh, neighbors)
         # print('Done redoing create of %s' % self.id_num)
     # end def
@@ -110,10 +122,8 @@ class CreateVirtualHelixCommand(UndoCommand):
         id_num = self.id_num
         # since we're hashing on the object in the views do this first
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(part.getVirtualHelixProperties(neighbor_id, 'neighbors'))
             try:
-                nneighbors.remove(id_num)
-                part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+                part._removeVirtualHelixNeighbor(neighbor_id, id_num)
             except:
                 print("id_num %d not there in neighbor %d" % (id_num, neighbor_id))
                 pass
@@ -124,7 +134,122 @@ class CreateVirtualHelixCommand(UndoCommand):
             part, id_num, part.getVirtualHelix(id_num), self.neighbors)
         # clear out part references
         part._removeHelix(id_num)
+        part._invalidateCrossoverCache(id_num)
         part._setVirtualHelixOriginLimits(self.old_limits)
         part.partVirtualHelixRemovedSignal.emit(part, id_num)
     # end def
 # end class
+
+
+class CreateVirtualHelicesCommand(UndoCommand):
+    __slots__ = (
+        'part', 'origins', 'directions', 'lengths', 'id_nums', 'properties_list',
+        'safe_list', 'color', 'neighbors', 'threshold', 'old_limits'
+    )
+
+    def __init__(self,
+                part: NucleicAcidPartT,
+                origins: Sequence[Vec3T],
+                lengths: Sequence[int],
+                directions: Sequence[Vec3T] = None,
+                id_nums: Sequence[int] = None,
+                properties_list: Sequence[tuple] = None,
+                safe_list: Sequence[bool] = None,
+                parities: Sequence[int] = None):
+        '''``UndoCommand`` to create many virtual helices in a
+        ``NucleicAcidPart`` in one pass.  Neighbors of all the ``safe``
+        virtual helices are computed together and views are notified with a
+        single ``partVirtualHelicesAddedSignal``
+
+        Args:
+            part: The parent ``NucleicAcidPart``
+            origins: ``(x, y, z)`` or ``(x, y)`` of the 0 - index base of
+                each virtual helix
+            lengths: Length of each virtual helix in bases
+            directions: optional, direction of each virtual helix. Defaults
+                to ``(0, 0, 1)``
+            id_nums: optional, ID number of each virtual helix, ``None``
+                entries get a new ID number
+            properties_list: optional, ``None`` or a tuple of ``(keys, values)``
+                per virtual helix
+            safe_list: optional, per virtual helix whether to compute its
+                neighbors. Default is ``True``. Otherwise the ``neighbors``
+                must be in its properties
+            parities: optional, even == 0, odd == 1, None == doesn't matter
+                per virtual helix for new ID numbers
+        '''
+        super(CreateVirtualHelicesCommand, self).__init__("create virtual helices")
+        self.part: NucleicAcidPartT = part
+        origins = np.array(origins, dtype=float)
+        if origins.ndim == 2 and origins.shape[1] == 2:
+            origins = np.column_stack((origins, np.zeros(len(origins))))
+        self.origins: np.ndarray = origins.reshape(-1, 3)
+        count = len(self.origins)
+        if directions is None:
+            directions = [(0, 0, 1.)]*count
+        self.directions: np.ndarray = np.array(directions, dtype=float).reshape(-1, 3)
+        self.lengths: List[int] = [int(x) for x in lengths]
+
+        new_id_nums = []
+        for i in range(count):
+            id_num = None if id_nums is None else id_nums[i]
+            if id_num is None:
+                parity = None if parities is None else parities[i]
+                id_num = part._getNewIdNum(parity=parity)
+            # reserve now to prevent collisions between helices in this batch
+            part._reserveIdNum(id_num)
+            new_id_nums.append(int(id_num))
+        self.id_nums: List[int] = new_id_nums
+        self.properties_list: List[tuple] = None
+        if properties_list is not None:
+            self.properties_list = [p if (p is None or isinstance(p, tuple))
+                                    else (list(p.keys()), list(p.values()))
+                                    for p in properties_list]
+        self.safe_list: List[bool] = ([True]*count if safe_list is None
+                                      else [bool(x) for x in safe_list])
+        self.color: str = part.getColor()
+        self.neighbors: Dict[int, List[int]] = {}
+        self.threshold: float = 2.1*part.radius()
+        self.old_limits: RectT = None
+    # end def
+
+    def redo(self):
+        part = self.part
+        id_nums = self.id_nums
+        self.old_limits = part.getVirtualHelixOriginLimits()
+        part._createHelices(id_nums, self.origins, self.directions, self.lengths,
+                            self.color, self.properties_list)
+
+        # update all neighbors in one pass
+        safe_id_nums = [id_num for id_num, safe in zip(id_nums, self.safe_list) if safe]
+        computed = part.recomputeNeighbors(self.threshold, safe_id_nums)
+        for id_num, neighbors in computed.items():
+            for neighbor_id in neighbors:
+                if (neighbor_id not in computed and
+                        id_num not in part.getVirtualHelixNeighbors(neighbor_id)):
+                    part._addVirtualHelixNeighbor(neighbor_id, id_num)
+        self.neighbors = {id_num: part.getVirtualHelixNeighbors(id_num) for id_num in id_nums}
+        part.partVirtualHelicesAddedSignal.emit(part, list(id_nums))
+    # end def
+
+    def undo(self):
+        part = self.part
+        id_nums = self.id_nums
+        created = set(id_nums)
+        for id_num in reversed(id_nums):
+            neighbors = self.neighbors.get(id_num, [])
+            for neighbor_id in neighbors:
+                if (neighbor_id not in created and
+                        id_num in part.getVirtualHelixNeighbors(neighbor_id)):
+                    part._removeVirtualHelixNeighbor(neighbor_id, id_num)
+            # signaling the view is two parts to clean up signals properly
+            # and then allow the views to refresh
+            part.partVirtualHelixRemovingSignal.emit(
+                part, id_num, part.getVirtualHelix(id_num), neighbors)
+            part._removeHelix(id_num)
+            part._invalidateCrossoverCache(id_num)
+        part._setVirtualHelixOriginLimits(self.old_limits)
+        for id_num in reversed(id_nums):
+            part.partVirtualHelixRemovedSignal.emit(part, id_num)
+    # end def
+# end class
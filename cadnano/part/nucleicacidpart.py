@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
+import io
 import math
 from ast import literal_eval
-from bisect import bisect_left
-from collections import (
-    defaultdict,
-    deque
+from bisect import (
+    bisect_left,
+    insort_left
 )
+from collections import defaultdict
+from contextlib import contextmanager
 from heapq import (
     heapify,
     heappush,
@@ -18,14 +20,19 @@ from typing import (
     Union,
     List,
     Set,
-    Dict
+    Dict,
+    Optional,
+    TextIO
 )
 
 import numpy as np
-import pandas as pd
 
 from cadnano import util
-from cadnano.oligo import RemoveOligoCommand
+from cadnano.fileio import sequenceexport
+from cadnano.oligo import (
+    EXPORT_COLUMNS,
+    RemoveOligoCommand
+)
 from cadnano.proxies.cnenum import (
     GridEnum,
     PartEnum,
@@ -38,9 +45,24 @@ from cadnano.part.part import Part
 from cadnano.removeinstancecmd import RemoveInstanceCommand
 from cadnano.setpropertycmd import SetVHPropertyCommand
 from cadnano.strandset import SplitCommand, StrandSet
-from .createvhelixcmd import CreateVirtualHelixCommand
+from .applysequencescmd import ApplySequencesCommand
+from .createvhelixcmd import (
+    CreateVirtualHelixCommand,
+    CreateVirtualHelicesCommand
+)
 from .removevhelixcmd import RemoveVirtualHelixCommand
 from .resizevirtualhelixcmd import ResizeVirtualHelixCommand
+from .coordinatestore import (
+    AXIS,
+    FWD,
+    REV,
+    CoordinateStore
+)
+from .partbatch import PartBatch
+from .querycache import QueryCache
+from .sequencebuffer import SequenceBuffer
+from .propertystore import PropertyStore
+from .spatialindex import SpatialIndex
 from .translatevhelixcmd import TranslateVirtualHelicesCommand
 from .virtualhelix import VirtualHelix
 from .xovercmds import (
@@ -74,7 +96,7 @@ equivalent to np.sum(a*a, axis=1) but faster
 """
 from numpy.core.umath_tests import inner1d
 
-DEFAULT_CACHE_SIZE = 20
+DEFAULT_CACHE_SIZE = 256
 
 def _defaultProperties(id_num, grid_type=GridEnum.HONEYCOMB):
     props_dict = {'name': "vh%d" % (id_num),
@@ -102,19 +124,16 @@ def _defaultProperties(id_num, grid_type=GridEnum.HONEYCOMB):
 
 
 VH_PROPERTY_KEYS = set([x for x in _defaultProperties(0)[0]])
-Z_PROP_INDEX = -1  # index for Dataframe.iloc calls
 
 
-def _defaultDataFrame(size, grid_type=GridEnum.HONEYCOMB):
+def _defaultPropertyStore(size, grid_type=GridEnum.HONEYCOMB):
     dummy_id_num = 999
     columns, row = _defaultProperties(dummy_id_num, grid_type)
-    df = pd.DataFrame([row for i in range(size)], columns=columns)
-    return df
+    return PropertyStore(columns, row, size)
 # end def
 
 
 DEFAULT_SIZE = 256
-DEFAULT_FULL_SIZE = DEFAULT_SIZE * 48
 DEFAULT_RADIUS = 1.0  # nm - It was set to 1.25 before
 HONEYCOMB_SUB_STEP_SIZE = 7
 SQUARE_SUB_STEP_SIZE = 8
@@ -133,6 +152,11 @@ class NucleicAcidPart(Part):
        order per id_num
     2. Contains the id_num per coordinate.
 
+    The coordinates are stored in one chunk per id_num so that resizing a
+    virtual helix only touches its own points.  ``axis_pts``, ``fwd_pts``,
+    ``rev_pts``, ``id_nums`` and ``indices`` are a packed copy built on
+    demand for bulk queries.
+
     Uses `*args` and `**kwargs` to make subclassing easier
 
     Args:
@@ -157,6 +181,17 @@ class NucleicAcidPart(Part):
         'z'
     ]
 
+    # properties that change the result of potentialCrossoverMap
+    _XOVER_PROPERTY_KEYS = frozenset([
+        'bases_per_repeat',
+        'eulerZ',
+        'helical_pitch',
+        'minor_groove_angle',
+        'neighbors',
+        'turns_per_repeat',
+        'z'
+    ])
+
     @classmethod
     def _count(cls):
         NucleicAcidPart.__count += 1
@@ -170,11 +205,16 @@ class NucleicAcidPart(Part):
             do_copy
             grid_type
             is_lattice
+            query_cache_size: int
         '''
         super(NucleicAcidPart, self).__init__(*args, **kwargs)
         do_copy: bool = kwargs.get('do_copy', False)
         grid_type: EnumType = kwargs.get('grid_type', GridEnum.NONE)
         is_lattice: EnumType = kwargs.get('is_lattice', True)
+        cache_size: int = kwargs.get('query_cache_size', DEFAULT_CACHE_SIZE)
+
+        self._batch: PartBatch = None
+        """the open :meth:`batch` or ``None``"""
 
         if do_copy:
             return
@@ -228,13 +268,8 @@ class NucleicAcidPart(Part):
         ############################
 
         # 1. per virtual base pair allocations
-        self.total_points: int = 0
-        self.axis_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        # self.axis_pts[:, 2] = 0.0
-        self.fwd_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.rev_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.id_nums = np.full((DEFAULT_FULL_SIZE,), -1, dtype=int)
-        self.indices = np.zeros((DEFAULT_FULL_SIZE,), dtype=int)
+        self._coords = CoordinateStore()
+        """Axis and phosphate points chunked per virtual helix"""
 
         # 2. per virtual helix allocations
         self.total_id_nums: int = 0  # should be equal to len(self.reserved_ids)
@@ -248,27 +283,37 @@ class NucleicAcidPart(Part):
 
         self.directions = np.zeros((DEFAULT_SIZE, 3), dtype=float)
 
-        self._offset_and_size: List[Union[None, Tuple[int, int]]] = [None] * DEFAULT_SIZE
-        """Bookkeeping for fast lookup of indices for insertions and deletions
-        and coordinate points. The length of this is the max id_num used.
-        """
         self._virtual_helices_dict: Dict[int, VirtualHelix] = {}
 
         self.reserved_ids: Set[int] = set()
 
-        self.vh_properties = _defaultDataFrame(DEFAULT_SIZE, grid_type)
+        self.vh_properties = _defaultPropertyStore(DEFAULT_SIZE, grid_type)
+        self._vh_neighbors: Dict[int, List[int]] = {}
+        """Neighbor ID numbers per ID number. The ``neighbors`` property
+        string is only generated from this when requested
+        """
 
         self.fwd_strandsets = [None] * DEFAULT_SIZE
         self.rev_strandsets = [None] * DEFAULT_SIZE
         self.segment_dict = {}  # for tracking strand segments
 
+        # Spatial indices for radius queries, kept in sync with the arrays above
+        self._axis_index = SpatialIndex()
+        self._fwd_index = SpatialIndex()
+        self._rev_index = SpatialIndex()
+        self._origin_index = SpatialIndex()
+
         # Cache Stuff
-        self._point_cache = None
-        self._point_cache_keys = None
-        self._resetPointCache()
-        self._origin_cache = None
-        self._origin_cache_keys = None
-        self._resetOriginCache()
+        self._point_cache = QueryCache(cache_size)
+        self._origin_cache = QueryCache(cache_size)
+        self._xover_cache = None
+        self._xover_cache_keys = None
+        self._resetCrossoverCache()
+        self._xover_cache_hits = 0
+        self._xover_cache_misses = 0
+
+        # bases of the strands while sequences are applied
+        self._sequence_buffer = SequenceBuffer(self)
 
         # scratch allocations for vector calculations
         self.m3_scratch0 = np.zeros((3, 3), dtype=float)
@@ -297,6 +342,9 @@ class NucleicAcidPart(Part):
     partVirtualHelixAddedSignal = ProxySignal(object, int, object, object, name='partVirtualHelixAddedSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
+    partVirtualHelicesAddedSignal = ProxySignal(CNObject, object, name='partVirtualHelicesAddedSignal')
+    """self, list of id_nums"""
+
     partVirtualHelixRemovingSignal = ProxySignal(object, int, object, object, name='partVirtualHelixRemovingSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
@@ -329,14 +377,47 @@ class NucleicAcidPart(Part):
         _name = self.__class__.__name__
         return '%s_%s_%s' % (_name, -1, _id)
 
+    @property
+    def total_points(self) -> int:
+        return self._coords.total_points
+    # end def
+
+    @property
+    def axis_pts(self) -> np.ndarray:
+        """Packed axis points of all virtual helices, read only"""
+        return self._coords.packed().axis_pts
+    # end def
+
+    @property
+    def fwd_pts(self) -> np.ndarray:
+        """Packed forward phosphate points of all virtual helices, read only"""
+        return self._coords.packed().fwd_pts
+    # end def
+
+    @property
+    def rev_pts(self) -> np.ndarray:
+        """Packed reverse phosphate points of all virtual helices, read only"""
+        return self._coords.packed().rev_pts
+    # end def
+
+    @property
+    def id_nums(self) -> np.ndarray:
+        """ID number of each row of the packed points"""
+        return self._coords.packed().id_nums
+    # end def
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Base index of each row of the packed points"""
+        return self._coords.packed().indices
+    # end def
+
     def _resetOriginCache(self):
-        self._origin_cache = {}
-        self._origin_cache_keys = deque([None] * DEFAULT_CACHE_SIZE)
+        self._origin_cache.clear()
     # end def
 
     def _resetPointCache(self):
-        self._point_cache = {}
-        self._point_cache_keys = deque([None] * DEFAULT_CACHE_SIZE)
+        self._point_cache.clear()
     # end def
 
     def copy(self,  document: DocT,
@@ -357,23 +438,27 @@ class NucleicAcidPart(Part):
             new_vhg = constructor(document=document, do_copy=True)
         if not isinstance(new_vhg, NucleicAcidPart):
             raise ValueError("new_vhg {} is not an instance of a NucleicAcidPart".format(new_vhg))
-        new_vhg.total_points = self.total_points
-        new_vhg.axis_pts = self.axis_pts.copy()
-        new_vhg.fwd_pts = self.fwd_pts.copy()
-        new_vhg.rev_pts = self.rev_pts.copy()
-        new_vhg.id_nums = self.id_nums.copy()
-        new_vhg.indices = self.indices.copy()
+        new_vhg._coords = self._coords.copy()
 
         new_vhg.total_id_nums = self.total_id_nums
         new_vhg._origin_pts = self._origin_pts
         new_vhg.origin_limits = self.origin_limits
         new_vhg.directions = self.directions
+        new_vhg._axis_index = self._axis_index.copy()
+        new_vhg._fwd_index = self._fwd_index.copy()
+        new_vhg._rev_index = self._rev_index.copy()
+        new_vhg._origin_index = self._origin_index.copy()
+        new_vhg._point_cache = QueryCache(self._point_cache.size)
+        new_vhg._origin_cache = QueryCache(self._origin_cache.size)
+        new_vhg._resetCrossoverCache()
+        new_vhg._xover_cache_hits = 0
+        new_vhg._xover_cache_misses = 0
 
-        new_vhg.offset_and_size = self._offset_and_size.copy()
         new_vhg.reserved_ids = self.reserved_ids.copy()
 
-        new_vhg.vh_properties = _defaultDataFrame(DEFAULT_SIZE,
-                                                  self._group_properties['grid_type'])
+        new_vhg.vh_properties = _defaultPropertyStore(DEFAULT_SIZE,
+                                                      self._group_properties['grid_type'])
+        new_vhg._vh_neighbors = {k: v.copy() for k, v in self._vh_neighbors.items()}
 
         new_vhg.fwd_strandsets = [x.simpleCopy(new_vhg) for x in self.fwd_strandsets]
         new_vhg.rev_strandsets = [x.simpleCopy(new_vhg) for x in self.rev_strandsets]
@@ -421,11 +506,9 @@ class NucleicAcidPart(Part):
         Raises:
             KeyError for ``id_num`` not being there
         """
-        offset_and_size = self._offset_and_size
-        if id_num > len(offset_and_size) - 1 or offset_and_size[id_num] is None:
+        if id_num not in self._coords:
             raise KeyError('id_num %s not in NucleicAcidPart' % id_num)
-        else:
-            return offset_and_size[id_num]
+        return self._coords.offsetAndSize(id_num)
     # end def
 
     def getVirtualHelix(self, id_num: int) -> VirtualHelix:
@@ -582,11 +665,9 @@ class NucleicAcidPart(Part):
 
             for a given virtual helix ID number
         """
-        offset, size = self.getOffsetAndSize(id_num)
-        lo, hi = offset, offset + size
-        return (self.axis_pts[lo:hi],
-                self.fwd_pts[lo:hi],
-                self.rev_pts[lo:hi])
+        if id_num not in self._coords:
+            raise KeyError('id_num %s not in NucleicAcidPart' % id_num)
+        return self._coords.points(id_num)
     # end def
 
     def getCoordinate(self, id_num: int, idx: int) -> np.ndarray:
@@ -603,10 +684,11 @@ class NucleicAcidPart(Part):
             KeyError: id_num not in NucleicAcidPart
             IndexError: idx is greater than size
         """
-        offset, size = self.getOffsetAndSize(id_num)
+        axis_pts, _, _ = self.getCoordinates(id_num)
+        size = len(axis_pts)
 
         if idx < size:
-            return self.axis_pts[offset + idx]
+            return axis_pts[idx]
         else:
             raise IndexError("idx {} greater than size {}".format(idx, size))
     # end def
@@ -651,7 +733,7 @@ class NucleicAcidPart(Part):
         Returns:
             list of :obj:`int` of virtual helix ID numbers used
         """
-        return [i for i, j in filter(lambda x: x[1] is not None, enumerate(self._offset_and_size))]
+        return self._coords.idNums()
     # end def
 
     def _setVirtualHelixOriginLimits(self, limits: RectT = None):
@@ -700,13 +782,18 @@ class NucleicAcidPart(Part):
     # end def
 
     def refreshSegments(self, id_num: int):
-        """Partition strandsets into overlapping segments
+        """Partition strandsets into overlapping segments.  Inside a
+        :meth:`batch` this is deferred until the batch closes
 
         Returns:
             tuple: of segments for the forward and reverse strand of form::
 
                 ( [ [(start, end),...], ...], [ [(start, end),...], ...])
         """
+        if self._batch is not None:
+            # refreshed once when the batch closes
+            self._batch.segments.add(id_num)
+            return None
         _, _ = self.getOffsetAndSize(id_num)
         fwd_ss = self.fwd_strandsets[id_num]
         rev_ss = self.rev_strandsets[id_num]
@@ -845,26 +932,31 @@ class NucleicAcidPart(Part):
             id_nums (array-like): of :obj:`int` virtual helix ID numbers
             delta (array-like):  of :obj:`float` of length 3
         """
-        self._resetOriginCache()
-        self._resetPointCache()
         origin_pts = self._origin_pts
+        origin_index = self._origin_index
         delta_origin = delta #delta[:2]  # x, y only
+        coords = self._coords
         for id_num in id_nums:
             coord_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
-            coord_pts += delta  # use += to modify the view
-            fwd_pts += delta  # use += to modify the view
-            rev_pts += delta  # use += to modify the view
+            idxs = np.arange(len(coord_pts))
+            self._unindexPoints(id_num, idxs, (coord_pts, fwd_pts, rev_pts))
+            coords.translate(id_num, delta)  # modifies the views
+            self._indexPoints(id_num, idxs, (coord_pts, fwd_pts, rev_pts))
+            self._point_cache.invalidate((id_num,), coord_pts)
+            self._invalidateCrossoverCache(id_num)
+            origin_index.remove(id_num, (0,), origin_pts[id_num])
             origin_pts[id_num, :] += delta_origin
-        try:
-            self.vh_properties.iloc[list(id_nums), Z_PROP_INDEX] += delta[2]
-        except Exception:
-            print(list(id_nums), Z_PROP_INDEX)
-            raise
-        self._setVirtualHelixOriginLimits()
+            origin_index.insert(id_num, (0,), origin_pts[id_num])
+            self._origin_cache.invalidate((id_num,), origin_pts[id_num])
+        self.vh_properties.addToColumn(id_nums, 'z', delta[2])
+        if self._batch is not None:
+            self._batch.origin_limits = True
+        else:
+            self._setVirtualHelixOriginLimits()
     # end def
 
     def getIndices(self, id_num):
-        """return a view onto the numpy array for a given id_num
+        """return the base indices for a given id_num
 
         Args:
             id_num (int): virtual helix ID number
@@ -872,9 +964,51 @@ class NucleicAcidPart(Part):
         Returns:
             ndarray: of :obj:`int` array of indices corresponding to points
         """
-        offset, size = self.getOffsetAndSize(id_num)
-        lo, hi = offset, offset + size
-        return self.indices[lo:hi]
+        _, size = self.getOffsetAndSize(id_num)
+        return np.arange(size)
+    # end def
+
+    def _indexPoints(self, id_num: int, idxs: np.ndarray, points: PointsT):
+        """Add points to the spatial indices
+
+        Args:
+            id_num: virtual helix ID number
+            idxs: base indices of the points
+            points: tuple containing :obj:`array-like` of axis, and forward
+                and reverse phosphates points
+        """
+        axis_pts, fwd_pts, rev_pts = points
+        self._axis_index.insert(id_num, idxs, axis_pts)
+        self._fwd_index.insert(id_num, idxs, fwd_pts)
+        self._rev_index.insert(id_num, idxs, rev_pts)
+    # end def
+
+    def _unindexPoints(self, id_num: int, idxs: np.ndarray, points: PointsT):
+        """Remove points from the spatial indices.  ``points`` must be the
+        coordinates at the time they were indexed
+
+        Args:
+            id_num: virtual helix ID number
+            idxs: base indices of the points
+            points: tuple containing :obj:`array-like` of axis, and forward
+                and reverse phosphates points
+        """
+        axis_pts, fwd_pts, rev_pts = points
+        self._axis_index.remove(id_num, idxs, axis_pts)
+        self._fwd_index.remove(id_num, idxs, fwd_pts)
+        self._rev_index.remove(id_num, idxs, rev_pts)
+    # end def
+
+    def _shiftIndexedPoints(self, id_num: int, delta: int):
+        """Offset the base indices of a virtual helix in the spatial indices
+
+        Args:
+            id_num: virtual helix ID number
+            delta: amount to add to the base indices
+        """
+        self._axis_index.shiftIndices(id_num, delta)
+        self._fwd_index.shiftIndices(id_num, delta)
+        self._rev_index.shiftIndices(id_num, delta)
     # end def
 
     def getNeighbors(self, id_num, radius, idx=0):
@@ -896,14 +1030,98 @@ class NucleicAcidPart(Part):
         _, _ = self.getOffsetAndSize(id_num)
 
         coord = self.getCoordinate(id_num, idx)
-        neighbors, indices = self.queryBasePoint(radius, *coord)
-        non_id_num_idxs, _ = np.where(neighbors != id_num)
-        return list(zip(np.take(neighbors, non_id_num_idxs),
-                        np.take(indices, non_id_num_idxs)
+        neighbors, indices = self.queryBasePoint(radius, tuple(coord))
+        non_id_num_idxs, = np.where(neighbors != id_num)
+        return list(zip(np.take(neighbors, non_id_num_idxs).tolist(),
+                        np.take(indices, non_id_num_idxs).tolist()
                         )
                     )
     # end def
 
+    def getVirtualHelixNeighbors(self, id_num: int) -> List[int]:
+        """Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            copy of the list of neighbor ID numbers
+        """
+        return list(self._vh_neighbors.get(id_num, ()))
+    # end def
+
+    def _setVirtualHelixNeighbors(self, id_num: int, neighbors: Iterable[int]):
+        """Args:
+            id_num: virtual helix ID number
+            neighbors: neighbor ID numbers, or their string form as stored
+                in a file
+        """
+        if isinstance(neighbors, str):
+            neighbors = literal_eval(neighbors)
+        self._vh_neighbors[id_num] = [int(x) for x in neighbors]
+    # end def
+
+    def _addVirtualHelixNeighbor(self, id_num: int, neighbor_id: int):
+        """Insert ``neighbor_id`` into the sorted neighbors of ``id_num``
+
+        Args:
+            id_num: virtual helix ID number
+            neighbor_id: neighbor ID number
+        """
+        neighbors = self._vh_neighbors.setdefault(id_num, [])
+        insort_left(neighbors, neighbor_id)
+    # end def
+
+    def _removeVirtualHelixNeighbor(self, id_num: int, neighbor_id: int):
+        """Args:
+            id_num: virtual helix ID number
+            neighbor_id: neighbor ID number
+
+        Raises:
+            ValueError: ``neighbor_id`` is not a neighbor
+        """
+        self._vh_neighbors.get(id_num, []).remove(neighbor_id)
+    # end def
+
+    def recomputeNeighbors(self, radius: float = None,
+                                id_nums: Iterable[int] = None) -> Dict[int, List[int]]:
+        """Recompute the neighbors of many virtual helices at once from
+        their origins, replacing the stored neighbors
+
+        Args:
+            radius: optional, radial distance within which a neighbors origin
+                exists. default to 2.1 * radius
+            id_nums: optional, ID numbers to update. default to all
+
+        Returns:
+            ``dict`` of the new neighbor lists of the updated ID numbers
+        """
+        if radius is None:
+            radius = 2.1*self._radius
+        all_id_nums = np.array(self.getidNums(), dtype=int)
+        if id_nums is None:
+            query_id_nums = all_id_nums
+        else:
+            query_id_nums = np.array(sorted(id_nums), dtype=int)
+        out = {}
+        if len(all_id_nums) == 0 or len(query_id_nums) == 0:
+            return out
+        origins = self._origin_pts[all_id_nums]
+        r2 = radius*radius
+        step = max(1, PROXIMITY_CHUNK_SIZE // len(all_id_nums))
+        for lo in range(0, len(query_id_nums), step):
+            chunk = query_id_nums[lo:lo + step]
+            difference = origins[np.newaxis, :, :] - self._origin_pts[chunk][:, np.newaxis, :]
+            delta = inner1d(difference, difference)
+            rows, cols = np.nonzero(delta <= r2)
+            neighbor_ids = all_id_nums[cols]
+            bounds = np.searchsorted(rows, np.arange(len(chunk) + 1))
+            for i, id_num in enumerate(chunk.tolist()):
+                neighbors = [x for x in neighbor_ids[bounds[i]:bounds[i + 1]].tolist()
+                             if x != id_num]
+                out[id_num] = neighbors
+        self._vh_neighbors.update(out)
+        return out
+    # end def
+
     def _getVirtualHelixOriginNeighbors(self, id_num: int, radius: float) -> Set[int]:
         """might use radius = 2.1*RADIUS
         for now return a set of neighbor id_nums
@@ -925,7 +1143,8 @@ class NucleicAcidPart(Part):
     def _addCoordinates(self, id_num: int, points: PointsT, is_right: bool):
         """Points will only be added on the ends of a virtual helix
         not internally.  NO GAPS!
-        handles reindex the points in self.indices
+        Only the chunk of ``id_num`` is touched, the base indices of the
+        existing points shift when prepending
 
         Args:
             id_num: virtual helix ID number
@@ -934,80 +1153,20 @@ class NucleicAcidPart(Part):
             is_right: whether we are extending in the positive index
                 direction or prepending
         """
-        offset_and_size_tuple = self.getOffsetAndSize(id_num)
-
-        # 1. Find insert indices
-        offset_and_size = self._offset_and_size
-        len_axis_pts = len(self.axis_pts)
+        _, size = self.getOffsetAndSize(id_num)
 
         new_axis_pts, new_fwd_pts, new_rev_pts = points
         num_points = len(new_axis_pts)  # number of points being added
 
-        self._resetPointCache()
+        self._point_cache.invalidate((id_num,), new_axis_pts)
 
-        # 1. existing id_num
-        offset, size = offset_and_size_tuple
-        lo_idx_limit, hi_idx_limit = offset, offset + size
         if is_right:
-            insert_idx = hi_idx_limit
-        else:  # prepend
-            insert_idx = offset
-
-        # new_lims = (hi_idx_limit, hi_idx_limit + num_points)
-        # print("{} settting offset {} and size {}".format(id_num, offset, size + num_points))
-        # print("length before {}".format(len_axis_pts))
-        offset_and_size[id_num] = (offset, size + num_points)
-        # increment the offset for every higher index
-        for i, o_and_s in enumerate(offset_and_size[id_num + 1:], start=id_num + 1):
-            if o_and_s is not None:
-                offset_and_size[i] = (o_and_s[0] + num_points, o_and_s[1])
-
-        # 2. Did exceed allocation???
-        total_points = self.total_points
-        if total_points + num_points > len_axis_pts:
-            diff = self.total_points + num_points - len_axis_pts
-            number_of_new_elements = math.ceil(diff / DEFAULT_FULL_SIZE) * DEFAULT_FULL_SIZE
-            total_rows = len_axis_pts + number_of_new_elements
-            # resize per virtual base allocations
-            self.axis_pts.resize((total_rows, 3))
-            self.axis_pts[len_axis_pts:] = [np.inf, np.inf, np.inf]
-
-            self.fwd_pts.resize((total_rows, 3))
-            self.fwd_pts[len_axis_pts:] = np.inf
-
-            self.rev_pts.resize((total_rows, 3))
-            self.rev_pts[len_axis_pts:] = np.inf
-
-            self.id_nums.resize((total_rows,))
-            self.id_nums[len_axis_pts:] = -1
-
-            self.indices.resize((total_rows,))
-            self.indices[len_axis_pts:] = 0
-        # end if exceeded allocation
-        axis_pts = self.axis_pts
-        fwd_pts = self.fwd_pts
-        rev_pts = self.rev_pts
-        id_nums = self.id_nums
-        indices = self.indices
-
-        # 3. Move Existing data
-        move_idx_start = insert_idx + num_points
-        move_idx_end = total_points + num_points
-
-        axis_pts[move_idx_start:move_idx_end] = axis_pts[insert_idx:total_points]
-        axis_pts[insert_idx:move_idx_start] = new_axis_pts
-        fwd_pts[move_idx_start:move_idx_end] = fwd_pts[insert_idx:total_points]
-        fwd_pts[insert_idx:move_idx_start] = new_fwd_pts
-        rev_pts[move_idx_start:move_idx_end] = rev_pts[insert_idx:total_points]
-        rev_pts[insert_idx:move_idx_start] = new_rev_pts
-
-        # just overwrite everything for indices and id_nums no need to move
-        id_nums[move_idx_start:move_idx_end] = id_nums[insert_idx:total_points]
-        id_nums[insert_idx:move_idx_start] = id_num
-        indices[move_idx_start:move_idx_end] = indices[insert_idx:total_points]
-        indices[lo_idx_limit:lo_idx_limit + num_points + size] = list(range(num_points + size))
-
-        self.total_points += num_points
+            new_idxs = np.arange(size, size + num_points)
+        else:
+            self._shiftIndexedPoints(id_num, num_points)
+            new_idxs = np.arange(num_points)
+        self._indexPoints(id_num, new_idxs, points)
+        self._coords.insert(id_num, points, is_right)
     # end def
 
     def getDirections(self, id_nums) -> np.ndarray:
@@ -1083,7 +1242,8 @@ class NucleicAcidPart(Part):
         Returns:
             ndarray of shape (3, 3)
         """
-        if np.all(v1 == v2):
+        # compare as arrays, a tuple never equals a list
+        if np.array_equal(v1, v2):
             return self.eye3_scratch.copy()
 
         v1 = self.normalize(v1)
@@ -1141,46 +1301,15 @@ class NucleicAcidPart(Part):
 
         self._reserveIdNum(id_num)
 
-        offset_and_size = self._offset_and_size
-
-        # 1. New id_num / virtual helix insert after all other points
-        # expand offset and size as required
-        self._resetOriginCache()
-
-        len_offset_and_size = len(offset_and_size)
-        number_of_new_elements = id_num - len_offset_and_size + 1
-        if number_of_new_elements > 0:
-            offset_and_size += [None]*number_of_new_elements
-            self.fwd_strandsets += [None]*number_of_new_elements
-            self.rev_strandsets += [None]*number_of_new_elements
-        # find the next highest insertion offset
-        next_o = self.total_points
-        for next_o_and_s in offset_and_size[id_num + 1:]:
-            if next_o_and_s:
-                next_o, next_s = next_o_and_s
-                break
-        # this_offset = num_points
-        offset_and_size[id_num] = (next_o, 0)
-        # the other offsets will be adjusted later
-
-        # 2. Assign origin on creation, resizing as needed
-        len_origin_pts = len(self._origin_pts)
-        if id_num >= len_origin_pts:
-            diff = id_num - len_origin_pts + 1 # add 1 to make sure this increases size
-            number_of_new_elements = math.ceil(diff / DEFAULT_SIZE)*DEFAULT_SIZE
-            total_rows = len_origin_pts + number_of_new_elements
-            # resize adding zeros
-            self._origin_pts.resize((total_rows, 3))
-            self._origin_pts[len_origin_pts:] = np.inf
-
-            self.directions.resize((total_rows, 3))
-            self.directions[len_origin_pts:] = 0  # unnecessary as resize fills with zeros
-
-            self.vh_properties = self.vh_properties.append(_defaultDataFrame(number_of_new_elements,
-                                                           self._group_properties['grid_type']),
-                                                           ignore_index=True)
+        # 1. New id_num / virtual helix gets its own empty chunk
+        # expand the strandset lists as required
+        self._origin_cache.invalidate((id_num,), origin)
+        self._growPerHelixStorage(id_num)
+        self._coords.create(id_num, num_points)
 
+        # 2. Assign origin on creation
         self._origin_pts[id_num] = origin #origin[:2]
+        self._origin_index.insert(id_num, (0,), self._origin_pts[id_num])
         new_x, new_y = origin[:2]
         xLL, yLL, xUR, yUR = self.origin_limits
         if new_x < xLL:
@@ -1193,7 +1322,10 @@ class NucleicAcidPart(Part):
             yUR = new_y
         self.origin_limits = (xLL, yLL, xUR, yUR)
         self.directions[id_num] = direction
-        self.vh_properties.loc[id_num, ['name', 'color', 'length']] = "vh%d" % (id_num), color, num_points
+        vh_properties = self.vh_properties
+        vh_properties.set(id_num, 'name', "vh%d" % (id_num))
+        vh_properties.set(id_num, 'color', color)
+        vh_properties.set(id_num, 'length', num_points)
 
         if self.fwd_strandsets[id_num] is None:
             self.fwd_strandsets[id_num] = StrandSet(True, id_num, self, num_points)
@@ -1212,6 +1344,230 @@ class NucleicAcidPart(Part):
         return vh
     # end def
 
+    def _growPerHelixStorage(self, max_id_num: int):
+        """Grow the per virtual helix allocations to fit ``max_id_num``
+
+        Args:
+            max_id_num: highest virtual helix ID number to fit
+        """
+        number_of_new_elements = max_id_num - len(self.fwd_strandsets) + 1
+        if number_of_new_elements > 0:
+            self.fwd_strandsets += [None]*number_of_new_elements
+            self.rev_strandsets += [None]*number_of_new_elements
+
+        len_origin_pts = len(self._origin_pts)
+        if max_id_num >= len_origin_pts:
+            diff = max_id_num - len_origin_pts + 1 # add 1 to make sure this increases size
+            number_of_new_elements = math.ceil(diff / DEFAULT_SIZE)*DEFAULT_SIZE
+            total_rows = len_origin_pts + number_of_new_elements
+            # reallocate rather than resize in place, which fails while
+            # anything (a debugger, a profiler) holds a reference
+            new_rows = np.full((number_of_new_elements, 3), np.inf, dtype=float)
+            self._origin_pts = np.concatenate((self._origin_pts, new_rows))
+            self.directions = np.concatenate((self.directions, np.zeros_like(new_rows)))
+
+            _, default_row = _defaultProperties(999, self._group_properties['grid_type'])
+            self.vh_properties.append(number_of_new_elements, default_row)
+    # end def
+
+    def _createHelices(self,    id_nums: List[int],
+                                origins: np.ndarray,
+                                directions: np.ndarray,
+                                lengths: List[int],
+                                color: str,
+                                properties_list: List[Tuple] = None) -> List[VirtualHelix]:
+        """Bulk version of :meth:`_createHelix`.  Allocations grow once,
+        properties are written per column and the points of all the virtual
+        helices are computed in one vectorized pass
+
+        Args:
+            id_nums: virtual helix ID numbers
+            origins: n x 3 origins, referenced from an index of 0.
+            directions: n x 3 direction vectors
+            lengths: number of bases of each virtual helix
+            color: hexadecimal color code in the form: ``#RRGGBB``
+            properties_list: optional, per virtual helix ``None`` or a tuple
+                of ``(keys, values)`` applied before the points are computed
+
+        Returns:
+            list of the new Virtual Helix objects
+
+        Raises:
+            IndexError: an ID number exists already or is repeated
+        """
+        id_nums = [int(x) for x in id_nums]
+        if len(set(id_nums)) != len(id_nums):
+            raise IndexError('repeated id_nums in %s' % id_nums)
+        coords = self._coords
+        for id_num in id_nums:
+            if id_num in coords:
+                raise IndexError('id_num %s already exists' % id_num)
+        if not id_nums:
+            return []
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        lengths = [int(x) for x in lengths]
+
+        for id_num in id_nums:
+            self._reserveIdNum(id_num)
+        self._growPerHelixStorage(max(id_nums))
+
+        # 1. Origins and directions
+        self._origin_cache.invalidate(id_nums, origins)
+        self._origin_pts[id_nums] = origins
+        self.directions[id_nums] = directions
+        origin_index = self._origin_index
+        for id_num, origin in zip(id_nums, origins):
+            origin_index.insert(id_num, (0,), origin)
+        xLL, yLL, xUR, yUR = self.origin_limits
+        self.origin_limits = (min(xLL, origins[:, 0].min()), min(yLL, origins[:, 1].min()),
+                              max(xUR, origins[:, 0].max()), max(yUR, origins[:, 1].max()))
+
+        # 2. Properties, which the points depend on
+        vh_properties = self.vh_properties
+        vh_properties.setColumn(id_nums, 'name', ["vh%d" % (id_num) for id_num in id_nums])
+        vh_properties.setColumn(id_nums, 'color', color)
+        vh_properties.setColumn(id_nums, 'length', lengths)
+        if properties_list is not None:
+            grouped = defaultdict(list)
+            for i, properties in enumerate(properties_list):
+                if properties is not None:
+                    keys, values = properties
+                    grouped[tuple(keys)].append((id_nums[i], values))
+            for keys, rows in grouped.items():
+                row_id_nums, row_values = zip(*rows)
+                self._setVirtualHelixPropertyColumns(row_id_nums, keys, list(zip(*row_values)))
+
+        for id_num, num_points in zip(id_nums, lengths):
+            if self.fwd_strandsets[id_num] is None:
+                self.fwd_strandsets[id_num] = StrandSet(True, id_num, self, num_points)
+                self.rev_strandsets[id_num] = StrandSet(False, id_num, self, num_points)
+            else:
+                self.fwd_strandsets[id_num]._reset(num_points)
+                self.rev_strandsets[id_num]._reset(num_points)
+        self.total_id_nums += len(id_nums)
+
+        # 3. Create points
+        (coord_pts, fwd_pts, rev_pts), starts = self._pointsFromDirections(id_nums,
+                                                                          origins,
+                                                                          directions,
+                                                                          lengths)
+        self._point_cache.invalidate(id_nums, coord_pts)
+        counts = np.diff(starts)
+        point_id_nums = np.repeat(id_nums, counts)
+        point_idxs = np.arange(len(coord_pts)) - np.repeat(starts[:-1], counts)
+        self._axis_index.insertMany(point_id_nums, point_idxs, coord_pts)
+        self._fwd_index.insertMany(point_id_nums, point_idxs, fwd_pts)
+        self._rev_index.insertMany(point_id_nums, point_idxs, rev_pts)
+        vhs = []
+        virtual_helices_dict = self._virtual_helices_dict
+        for i, id_num in enumerate(id_nums):
+            lo, hi = starts[i], starts[i + 1]
+            points = (coord_pts[lo:hi], fwd_pts[lo:hi], rev_pts[lo:hi])
+            coords.create(id_num, hi - lo)
+            coords.insert(id_num, points, False)
+            self._invalidateCrossoverCache(id_num)
+            virtual_helices_dict[id_num] = vh = VirtualHelix(id_num, self)
+            vhs.append(vh)
+        self._group_properties['virtual_helix_order'].extend(id_nums)
+        return vhs
+    # end def
+
+    def _setVirtualHelixPropertyColumns(self,   id_nums: Iterable[int],
+                                                keys: List[str],
+                                                columns: List[list]):
+        """Bulk version of :meth:`_setVirtualHelixProperties` without
+        signaling.  Sets the same keys on many virtual helices
+
+        Args:
+            id_nums: virtual helix ID numbers
+            keys: the ordered keys of the properties
+            columns: per key, the list of values of each virtual helix
+        """
+        id_nums = list(id_nums)
+        for key, values in zip(keys, columns):
+            if key == 'neighbors':
+                for id_num, neighbors in zip(id_nums, values):
+                    self._setVirtualHelixNeighbors(id_num, neighbors)
+                continue
+            if key in self._FLOAT_PROPERTY_KEYS:
+                values = [float(x) for x in values]
+            self.vh_properties.setColumn(id_nums, key, list(values))
+        if not self._XOVER_PROPERTY_KEYS.isdisjoint(keys):
+            for id_num in id_nums:
+                self._invalidateCrossoverCache(id_num)
+    # end def
+
+    def _pointsFromDirections(self, id_nums: List[int],
+                                    origins: np.ndarray,
+                                    directions: np.ndarray,
+                                    lengths: List[int]) -> Tuple[PointsT, np.ndarray]:
+        """Vectorized :meth:`_pointsFromDirection` for whole virtual helices
+        starting at index 0
+
+        Args:
+            id_nums: virtual helix ID numbers
+            origins: n x 3 origins, referenced from an index of 0.
+            directions: n x 3 direction vectors
+            lengths: number of bases of each virtual helix
+
+        Returns:
+            tuple of form::
+
+                ((coord_pts, fwd_pts, rev_pts), starts)
+
+            where the points of ``id_nums[i]`` are rows
+            ``starts[i]:starts[i + 1]``
+        """
+        rad = self._radius
+        BW = self._BASE_WIDTH
+        vh_properties = self.vh_properties
+        bpr = vh_properties.column('bases_per_repeat')[id_nums].astype(float)
+        tpr = vh_properties.column('turns_per_repeat')[id_nums].astype(float)
+        eulerZ = vh_properties.column('eulerZ')[id_nums].astype(float)
+        mgroove = vh_properties.column('minor_groove_angle')[id_nums].astype(float)
+        # see _pointsFromDirection for the conventions
+        twist_per_base = np.radians(tpr*360./bpr)
+        eulerZ = np.radians(eulerZ)
+        mgroove = np.radians(mgroove)
+
+        lengths = np.asarray(lengths, dtype=int)
+        starts = np.zeros(len(lengths) + 1, dtype=int)
+        np.cumsum(lengths, out=starts[1:])
+        helix_of_base = np.repeat(np.arange(len(lengths)), lengths)
+        idxs = np.arange(starts[-1]) - starts[helix_of_base]
+
+        fwd_angles = -idxs*twist_per_base[helix_of_base] + eulerZ[helix_of_base]
+        rev_angles = fwd_angles + mgroove[helix_of_base]
+        z_pts = BW*idxs
+
+        fwd_pts = rad*np.column_stack((np.cos(fwd_angles),
+                                       np.sin(fwd_angles),
+                                       np.zeros(len(idxs))))
+        fwd_pts[:, 2] = z_pts
+        rev_pts = rad*np.column_stack((np.cos(rev_angles),
+                                       np.sin(rev_angles),
+                                       np.zeros(len(idxs))))
+        rev_pts[:, 2] = z_pts
+        coord_pts = np.zeros((len(idxs), 3))
+        coord_pts[:, 2] = z_pts
+
+        # rotate about 0 index and then translate, once per distinct direction
+        direction_groups = defaultdict(list)
+        for i, direction in enumerate(map(tuple, np.asarray(directions).tolist())):
+            direction_groups[direction].append(i)
+        for direction, group in direction_groups.items():
+            m = self.makeRotation((0, 0, 1), direction)
+            if len(direction_groups) == 1:
+                rows = slice(None)
+            else:
+                rows = np.isin(helix_of_base, group)
+            origin_rows = origins[helix_of_base[rows]]
+            for pts in (fwd_pts, rev_pts, coord_pts):
+                pts[rows] = np.dot(m, pts[rows].T).T + origin_rows
+        return (coord_pts, fwd_pts, rev_pts), starts
+    # end def
+
     def _pointsFromDirection(self,
                     id_num: int,
                     origin: Vec3T,
@@ -1237,12 +1593,12 @@ class NucleicAcidPart(Part):
         """
         rad = self._radius
         BW = self._BASE_WIDTH
-        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.loc[id_num,
+        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.get(id_num,
                                                                ['helical_pitch',
                                                                 'bases_per_repeat',
                                                                 'turns_per_repeat',
                                                                 'eulerZ',
-                                                                'minor_groove_angle']]
+                                                                'minor_groove_angle'])
         twist_per_base = tpr*360./bpr
         """
         + angle is CCW
@@ -1287,7 +1643,7 @@ class NucleicAcidPart(Part):
         np.add(np.dot(m, coord_pts.T, out=scratch).T, origin, out=coord_pts)
 
         if index < 0:
-            self.vh_properties.loc[id_num, 'eulerZ'] = math.degrees(eulerZ_new)
+            self.vh_properties.set(id_num, 'eulerZ', math.degrees(eulerZ_new))
 
         return (coord_pts, fwd_pts, rev_pts)
     # end def
@@ -1307,12 +1663,13 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        props = self.vh_properties.loc[id_num, keys]
-        if isinstance(props, pd.Series):
-            return [v.item() if isinstance(v, (np.float64, np.int64, np.bool_)) else v for v in props]
-        else:
-            return props.item() if isinstance(props, (np.float64, np.int64, np.bool_)) else props
+        if isinstance(keys, (list, tuple)):
+            if 'neighbors' in keys:
+                return [str(self._vh_neighbors.get(id_num, [])) if key == 'neighbors'
+                        else self.vh_properties.get(id_num, key) for key in keys]
+        elif keys == 'neighbors':
+            return str(self._vh_neighbors.get(id_num, []))
+        return self.vh_properties.get(id_num, keys)
     # end
 
     def helixProperties(self,
@@ -1334,15 +1691,17 @@ class NucleicAcidPart(Part):
         if id_num_list is None:
             lim = max(self._highest_even_id_num_used + 1,
                       self._highest_odd_id_num_used + 1)
-            props = self.vh_properties.iloc[:lim]
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(slice(0, lim))
+            props['neighbors'] = [str(self._vh_neighbors.get(id_num, []))
+                                  for id_num in range(lim)]
             origins = self._origin_pts[:lim]
             directions = self.directions[:lim]
             return props, origins, directions
         elif isinstance(id_num_list, list):
             # select by list of indices
-            props = self.vh_properties.iloc[id_num_list].reset_index(drop=True)
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(id_num_list)
+            props['neighbors'] = [str(self._vh_neighbors.get(id_num, []))
+                                  for id_num in id_num_list]
             origins = self._origin_pts[id_num_list]
             directions = self.getDirections(id_num_list)
             return props, origins, directions
@@ -1371,12 +1730,8 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        series = self.vh_properties.loc[id_num]
-        # to_dict doesn't promote to python native types needed by QVariant
-        # leaves as numpy integers and floats
-        out = dict((k, v.item()) if isinstance(v, (np.float64, np.int64, np.bool_))
-                   else (k, v) for k, v in zip(series.index, series.tolist()))
+        out = self.vh_properties.getRow(id_num)
+        out['neighbors'] = str(self._vh_neighbors.get(id_num, []))
         if inject_extras:
             bpr = float(out['bases_per_repeat'])
             tpr = float(out['turns_per_repeat'])
@@ -1447,11 +1802,16 @@ class NucleicAcidPart(Part):
                                                                             values_list[index]))
 
         for index, key in enumerate(keys_list):
+            if key == 'neighbors':
+                self._setVirtualHelixNeighbors(id_num, values_list[index])
+                continue
             try:
-                self.vh_properties.loc[id_num, (key)] = values_list[index]
+                self.vh_properties.set(id_num, key, values_list[index])
             except KeyError:
                 print("Key not in VH properties {}: {}, {}".format(key, id_num, values))
                 raise
+        if not self._XOVER_PROPERTY_KEYS.isdisjoint(keys_list):
+            self._invalidateCrossoverCache(id_num)
 
         if emit_signals:
             self.partVirtualHelixPropertyChangedSignal.emit(
@@ -1528,10 +1888,13 @@ class NucleicAcidPart(Part):
                 self.rev_strandsets[id_num].resize(delta, 0)
         else:  # delta == 0
             return
+        self._invalidateCrossoverCache(id_num)
         _, final_size = self.getOffsetAndSize(id_num)
-        self.vh_properties.loc[id_num, 'length'] = final_size
-        self._group_properties['max_vhelix_length'] = self.vh_properties['length'].max()
-        # return 0, self.vh_properties['length'].idxmax()
+        self.vh_properties.set(id_num, 'length', final_size)
+        if self._batch is not None:
+            self._batch.max_length = True
+        else:
+            self._group_properties['max_vhelix_length'] = self.vh_properties.column('length').max().item()
         return self.zBoundsIds()
     # end def
 
@@ -1542,12 +1905,7 @@ class NucleicAcidPart(Part):
         Returns:
             tuple: of :obj:`int`, of form (ID_z_min, ID_z_max)
         """
-        test = self.axis_pts[:, 2]
-        id_z_min = self.id_nums[np.argmin(test)]
-        # use numpy masked arrays to mask out infinites
-        id_z_max = self.id_nums[np.argmax(np.ma.array(test,
-                                                      mask=np.isinf(test)))]
-        return id_z_min, id_z_max
+        return self._coords.zBoundsIds()
     # end def
 
     def _removeHelix(self, id_num: int):
@@ -1568,6 +1926,8 @@ class NucleicAcidPart(Part):
         # this needs to be changed
         self._group_properties['virtual_helix_order'].remove(id_num)
         del self._virtual_helices_dict[id_num]
+        self._vh_neighbors.pop(id_num, None)
+        self._sequence_buffer.discard(id_num)
     # end def
 
     def resetCoordinates(self, id_num: int):
@@ -1581,8 +1941,9 @@ class NucleicAcidPart(Part):
         Raises:
             KeyError:
         """
-        offset, size = self.getOffsetAndSize(id_num)
-        origin = self.axis_pts[offset]  # zero point of axis
+        axis_pts, _, _ = self.getCoordinates(id_num)
+        size = len(axis_pts)
+        origin = axis_pts[0].copy()  # zero point of axis
         direction = self.directions[id_num]
         points = self._pointsFromDirection(id_num, origin, direction, size, 0)
         self._setCoordinates(id_num, points)
@@ -1610,11 +1971,17 @@ class NucleicAcidPart(Part):
             raise IndexError(err.format(len(points), idx_start, size))
 
         new_axis_pts, new_fwd_pts, new_rev_pts = points
-        lo = offset + idx_start
+        lo = idx_start
         hi = lo + len(new_axis_pts)
-        self.axis_pts[lo:hi] = new_axis_pts
-        self.fwd_pts[lo:hi] = new_fwd_pts
-        self.rev_pts[lo:hi] = new_rev_pts
+        idxs = np.arange(idx_start, idx_start + len(new_axis_pts))
+        axis_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
+        self._unindexPoints(id_num, idxs, (axis_pts[lo:hi],
+                                           fwd_pts[lo:hi],
+                                           rev_pts[lo:hi]))
+        self._coords.set(id_num, points, idx_start)
+        self._indexPoints(id_num, idxs, points)
+        self._point_cache.invalidate((id_num,), new_axis_pts)
+        self._invalidateCrossoverCache(id_num)
     # end def
 
     def _removeCoordinates(self, id_num: int, length: int, is_right: bool) -> bool:
@@ -1633,78 +2000,38 @@ class NucleicAcidPart(Part):
             KeyError:
             IndexError:
         """
-        offset, size = self.getOffsetAndSize(id_num)
+        _, size = self.getOffsetAndSize(id_num)
         if length > size:
             raise IndexError("length longer {} than indices existing".format(length))
-        lo, hi = offset, offset + size
         if is_right:
-            idx_start, idx_stop = hi - length, hi
+            idx_start, idx_stop = size - length, size
         else:
-            idx_start, idx_stop = lo, lo + length
-
-        self._resetPointCache()
-        offset_and_size = self._offset_and_size
-        current_offset_and_size_length = len(offset_and_size)
-
-        # 1. Move the good data
-        total_points = self.total_points
-        relocate_idx_end = total_points - length
-
-        axis_pts = self.axis_pts
-        try:
-            axis_pts[idx_start:relocate_idx_end] = axis_pts[idx_stop:total_points]
-        except Exception:
-            err = "idx_start {}, relocate_idx_end {}, idx_stop {}, total_points {}, length {}"
-            print(err.format(idx_start, relocate_idx_end, idx_stop, total_points, length))
-            raise
-        axis_pts[relocate_idx_end:total_points] = np.inf
-
-        fwd_pts = self.fwd_pts
-        fwd_pts[idx_start:relocate_idx_end] = fwd_pts[idx_stop:total_points]
-        fwd_pts[relocate_idx_end:total_points] = np.inf
-
-        rev_pts = self.rev_pts
-        rev_pts[idx_start:relocate_idx_end] = rev_pts[idx_stop:total_points]
-        rev_pts[relocate_idx_end:total_points] = np.inf
-
-        id_nums = self.id_nums
-        id_nums[idx_start:relocate_idx_end] = id_nums[idx_stop:total_points]
-        id_nums[relocate_idx_end:total_points] = -1
-
-        indices = self.indices
-        indices[idx_start:relocate_idx_end] = indices[idx_stop:total_points]
-        indices[relocate_idx_end:total_points] = 0
+            idx_start, idx_stop = 0, length
+        removed_idxs = np.arange(idx_start, idx_stop)
+
+        self._point_cache.invalidate((id_num,))
+        axis_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
+        self._unindexPoints(id_num, removed_idxs, (axis_pts[idx_start:idx_stop],
+                                                   fwd_pts[idx_start:idx_stop],
+                                                   rev_pts[idx_start:idx_stop]))
         if not is_right:
-            # We need to adjust the base index
-            # lo offset index should not change for a given id_num
-            indices[lo:lo + length] -= length
-
-        # 2. Adjust the offsets of id_nums greater than id_num
-        for i, item in enumerate(offset_and_size[id_num + 1:], start=1):
-            if item is not None:
-                offset_other, size_other = item
-                offset_and_size[i + id_num] = (offset_other - length, size_other)
+            self._shiftIndexedPoints(id_num, -length)
 
-        # 3. Check if we need to remove Virtual Helix
+        # 1. Check if we need to remove Virtual Helix
         if size == length:
             self.total_id_nums -= 1
-            self._resetOriginCache()
-            offset_and_size[id_num] = None
+            self._origin_cache.invalidate((id_num,))
+            self._coords.delete(id_num)
+            for spatial_index in (self._axis_index, self._fwd_index, self._rev_index):
+                spatial_index.discard(id_num)
+            self._origin_index.remove(id_num, (0,), self._origin_pts[id_num])
+            self._origin_index.discard(id_num)
             self._origin_pts[id_num, :] = (np.inf, np.inf, np.inf)  # set off to infinity
-            # trim the unused id_nums at the end
-            remove_count = 0
-            for i in range(current_offset_and_size_length - 1, id_num - 1, -1):
-                if offset_and_size[i] is None:
-                    remove_count += 1
-                else:
-                    break
-            self._offset_and_size = offset_and_size[:current_offset_and_size_length - remove_count]
             did_remove = True
         else:
-            # print("Did remove", size, length)
-            offset_and_size[id_num] = (offset, size - length)
+            # 2. Trim the chunk, leaving the other virtual helices alone
+            self._coords.remove(id_num, length, is_right)
             did_remove = False
-        self.total_points -= length
         return did_remove
     # end def
 
@@ -1721,18 +2048,12 @@ class NucleicAcidPart(Part):
             tuple of :obj:`ndarray`
         """
         qc = self._point_cache
-        query = (radius, point)
-        if query in qc:
-            return qc.get(query)
-        else:
+        key = qc.key(radius, point)
+        res = qc.get(key)
+        if res is None:
             res = self._queryBasePoint(radius, point)
-            self._point_cache_keys.append(query)
-            qc[query] = res
-            # limit the size of the cache
-            old_key = self._point_cache_keys.popleft()
-            if old_key is not None:
-                del qc[old_key]
-            return res
+            qc.put(key, radius, point, res, res[0].tolist())
+        return res
     # end def
 
     def _queryBasePoint(self,
@@ -1747,19 +2068,57 @@ class NucleicAcidPart(Part):
         Returns:
             tuple of :obj:`ndarray`
         """
-        difference = self.axis_pts - point
-        ldiff = len(difference)
-        delta = self.delta3D_scratch
-        if ldiff != len(delta):
-            self.delta3D_scratch = delta = np.empty((ldiff,), dtype=float)
+        return self._queryPointIndex(self._axis_index, AXIS, radius, point)
+    # end def
 
-        # compute square of distance to point
-        delta = inner1d(difference, difference, out=delta)
-        close_points, = np.where(delta < radius*radius)
-        # return list(zip(    np.take(self.id_nums, close_points),
-        #                     np.take(self.indices, close_points) ))
-        return (np.take(self.id_nums, close_points),
-                np.take(self.indices, close_points))
+    def _queryPhosphatePoint(self,
+                            radius: float,
+                            point: Vec3T,
+                            is_fwd: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """return the ID numbers and indices of all forward or reverse
+        phosphates closer than radius
+
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+            is_fwd: ``True`` for forward phosphates, ``False`` for reverse
+
+        Returns:
+            tuple of :obj:`ndarray`
+        """
+        if is_fwd:
+            return self._queryPointIndex(self._fwd_index, FWD, radius, point)
+        else:
+            return self._queryPointIndex(self._rev_index, REV, radius, point)
+    # end def
+
+    def _queryPointIndex(self,
+                        spatial_index: SpatialIndex,
+                        which: int,
+                        radius: float,
+                        point: Vec3T) -> Tuple[np.ndarray, np.ndarray]:
+        """Use a spatial index to find the points closer than radius
+
+        Args:
+            spatial_index: index over the ``which`` points
+            which: one of ``AXIS``, ``FWD`` or ``REV``
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            tuple of :obj:`ndarray` of form (id_nums, idxs) sorted by ID
+            number then index
+        """
+        cand_id_nums, cand_idxs = spatial_index.query(radius, point)
+        if len(cand_id_nums) == 0:
+            return cand_id_nums, cand_idxs
+        order = np.lexsort((cand_idxs, cand_id_nums))
+        cand_id_nums = cand_id_nums[order]
+        cand_idxs = cand_idxs[order]
+        difference = self._coords.gather(which, cand_id_nums, cand_idxs) - point
+        delta = inner1d(difference, difference)
+        close = delta < radius*radius
+        return cand_id_nums[close], cand_idxs[close]
     # end def
 
     def queryVirtualHelixOrigin(self,
@@ -1776,25 +2135,53 @@ class NucleicAcidPart(Part):
             ``ndarray`` close origin points to ``point``
         """
         qc = self._origin_cache
-        query = (radius, point)
-        if query in qc:
-            return qc.get(query)
-        else:
-            # print('miss')
-            res = self._queryVirtualHelixOrigin(radius, point)
-            res = res.tolist()
-            self._origin_cache_keys.append(query)
-            qc[query] = res
-            # print("size", len(qc))
-            # limit the size of the cache
-            old_key = self._origin_cache_keys.popleft()
-            if old_key is not None:
-                # try:
-                del qc[old_key]
-                # except:
-                #     print(old_key, list(qc.keys()))
-                #     raise
-            return res
+        key = qc.key(radius, point)
+        res = qc.get(key)
+        if res is None:
+            res = self._queryVirtualHelixOrigin(radius, point).tolist()
+            qc.put(key, radius, point, res, res)
+        return res
+    # end def
+
+    def setQueryCacheSize(self, size: int):
+        """Set the maximum number of entries of the base point and
+        virtual helix origin query caches
+
+        Args:
+            size: number of entries, 0 disables caching
+        """
+        self._point_cache.resize(size)
+        self._origin_cache.resize(size)
+    # end def
+
+    def sequenceBuffer(self) -> SequenceBuffer:
+        """Returns:
+            the buffers sequences are applied through, see
+            :meth:`SequenceBuffer.applyOligoSequence`
+        """
+        return self._sequence_buffer
+    # end def
+
+    def queryCacheStats(self, reset: bool = False) -> Dict[str, Dict[str, int]]:
+        """Profiling counters of the base point and virtual helix origin
+        query caches
+
+        Args:
+            reset: optionally zero the counters after reading
+
+        Returns:
+            ``dict`` of form::
+
+                {'point': point_stats, 'origin': origin_stats}
+
+            see :meth:`QueryCache.stats`
+        """
+        stats = {'point': self._point_cache.stats(),
+                 'origin': self._origin_cache.stats()}
+        if reset:
+            self._point_cache.resetStats()
+            self._origin_cache.resetStats()
+        return stats
     # end def
 
     def _queryVirtualHelixOrigin(self,
@@ -1810,17 +2197,16 @@ class NucleicAcidPart(Part):
         Returns:
             ``ndarray`` close origin points to ``point``
         """
-        difference = self._origin_pts - point
-        ldiff = len(difference)
-        delta = self.delta2D_scratch
-        if ldiff != len(delta):
-            self.delta2D_scratch = delta = np.empty((ldiff,), dtype=float)
+        candidates, _ = self._origin_index.query(radius, point)
+        candidates.sort()
+        difference = self._origin_pts[candidates] - point
 
         # compute square of distance to point
-        inner1d(difference, difference, out=delta)
-        close_points, = np.where(delta <= radius*radius)
-        # take then sort the indices of the points in range
-        sorted_idxs = np.argsort(np.take(delta, close_points))
+        delta = inner1d(difference, difference)
+        in_range = delta <= radius*radius
+        close_points = candidates[in_range]
+        # sort the indices of the points in range
+        sorted_idxs = np.argsort(delta[in_range])
 
         return close_points[sorted_idxs]
     # end def
@@ -1937,7 +2323,7 @@ class NucleicAcidPart(Part):
                 (start index, bases per repeat)
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr = self.vh_properties.loc[id_num, 'bases_per_repeat']
+        bpr = self.vh_properties.get(id_num, 'bases_per_repeat')
         half_period = bpr // 2
         if size - index < bpr:
             start = size - bpr
@@ -1972,8 +2358,8 @@ class NucleicAcidPart(Part):
 
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
+        bpr, tpr = self.vh_properties.get(id_num,
+                                          ['bases_per_repeat', 'turns_per_repeat'])
         bases_per_turn = bpr / tpr
         if index is None:
             start, length = 0, size
@@ -1994,12 +2380,10 @@ class NucleicAcidPart(Part):
 
         theta, radius = self.radiusForAngle(alpha, RADIUS, bases_per_turn, BW)
         # convert to a list since we can't speed this loop up without cython or something
-        axis_pts = self.axis_pts
-        fwd_pts = self.fwd_pts
-        rev_pts = self.rev_pts
-        this_axis_pts = axis_pts[offset + start:offset + start + length].tolist()
-        this_fwd_pts = fwd_pts[offset + start:offset + start + length].tolist()
-        this_rev_pts = rev_pts[offset + start:offset + start + length].tolist()
+        axis_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
+        this_axis_pts = axis_pts[start:start + length].tolist()
+        this_fwd_pts = fwd_pts[start:start + length].tolist()
+        this_rev_pts = rev_pts[start:start + length].tolist()
         # for now just looks against everything
         # rsquared1 = RADIUS*RADIUS + BASE_WIDTH*BASE_WIDTH/4
         # print("THE search radius", radius, RADIUS)
@@ -2008,18 +2392,15 @@ class NucleicAcidPart(Part):
         key_prop_list = ['eulerZ', 'bases_per_repeat',
                          'turns_per_repeat', 'minor_groove_angle']
         for neighbor_id in neighbors:
-            eulerZ, bpr, tpr, mgroove = self.vh_properties.loc[neighbor_id, key_prop_list]
+            eulerZ, bpr, tpr, mgroove = self.vh_properties.get(neighbor_id, key_prop_list)
             twist_per_base = tpr*360./bpr
             half_period = math.floor(bpr / 2)
             tpb = math.radians(twist_per_base)
             eulerZ = math.radians(eulerZ)
             mgroove = math.radians(mgroove)
 
-            offset, size = self.getOffsetAndSize(neighbor_id)
-
             # 1. Finds points that point at neighbors axis point
-            naxis_pts = axis_pts[offset:offset + size]
-            nfwd_pts = fwd_pts[offset:offset + size]
+            naxis_pts, nfwd_pts, _ = self.getCoordinates(neighbor_id)
 
             direction = self.directions[neighbor_id]
             len_neighbor_pts = len(naxis_pts)
@@ -2130,36 +2511,171 @@ class NucleicAcidPart(Part):
         Raises:
             ValueError:
         """
+        start, length = self._crossoverQueryRange(id_num, index)
+        per_neighbor_hits = {}
+
+        fwd_axis_pairs = {}
+        rev_axis_pairs = {}
+
+        for neighbor_id in neighbors:
+            if start < 0:
+                # window overhangs a short virtual helix, don't cache
+                candidates = self._crossoverCandidates(id_num, start, length, neighbor_id,
+                                                       self._crossoverThresholds(id_num))
+                fwd_axis_hits, rev_axis_hits = self._crossoverHits(start, candidates)
+            else:
+                candidates = self._cachedCrossoverCandidates(id_num, neighbor_id)
+                if index is not None:
+                    candidates = tuple(_slicePairs(pairs, start, start + length)
+                                       for pairs in candidates)
+                fwd_axis_hits, rev_axis_hits = self._crossoverHits(0, candidates)
+            # NOTE: only the forward pairs of the last neighbor are returned
+            fwd_axis_pairs = {}
+            self._crossoverPairs(id_num, neighbor_id, fwd_axis_hits, fwd_axis_pairs, True)
+            self._crossoverPairs(id_num, neighbor_id, rev_axis_hits, rev_axis_pairs, False)
+            per_neighbor_hits[neighbor_id] = (fwd_axis_hits, rev_axis_hits)
+        # end for
+        return per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs)
+    # end def
+
+    def potentialCrossoverMapAll(self) -> Dict[int, Tuple[Dict[int, Tuple[HitListT, HitListT]],
+                                                          Tuple[dict, dict]]]:
+        """Compute the potential crossover map of every virtual helix in the
+        part.  Each neighboring pair of virtual helices is only compared once,
+        the phosphate proximity of the reverse direction being the transpose
+        of the forward one.
+
+        Returns:
+            ``dict`` of form::
+
+                id_num: (per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs))
+
+            where each value matches the output of :meth:`potentialCrossoverMap`
+        """
+        return {id_num: self.queryIdNumNeighbor(id_num,
+                                                self._vh_neighbors.get(id_num, []))
+                for id_num in self.getidNums()}
+    # end def
+
+    def _cachedCrossoverCandidates(self, id_num: int, neighbor_id: int) -> Tuple[tuple, tuple,
+                                                                                  tuple, tuple]:
+        """Cached :meth:`_crossoverCandidates` over the full length of a
+        virtual helix.  On a miss the transposed candidates of the reverse
+        pair are cached too when both virtual helices share thresholds
+
+        Args:
+            id_num: virtual helix ID number
+            neighbor_id: neighbor virtual helix ID number
+
+        Returns:
+            output of :meth:`_crossoverCandidates`
+        """
+        key = (id_num, neighbor_id)
+        cache = self._xover_cache
+        candidates = cache.get(key)
+        if candidates is not None:
+            self._xover_cache_hits += 1
+            return candidates
+        self._xover_cache_misses += 1
+        _, size = self.getOffsetAndSize(id_num)
+        thresholds = self._crossoverThresholds(id_num)
+        candidates = self._crossoverCandidates(id_num, 0, size, neighbor_id, thresholds)
+        self._cacheCrossoverCandidates(key, candidates)
+        reverse_key = (neighbor_id, id_num)
+        if reverse_key not in cache and thresholds == self._crossoverThresholds(neighbor_id):
+            ff, fr, rf, rr = candidates
+            self._cacheCrossoverCandidates(reverse_key, (_transposePairs(ff),
+                                                         _transposePairs(rf),
+                                                         _transposePairs(fr),
+                                                         _transposePairs(rr)))
+        return candidates
+    # end def
+
+    def _cacheCrossoverCandidates(self, key: Tuple[int, int], candidates: tuple):
+        self._xover_cache[key] = candidates
+        for id_num in key:
+            self._xover_cache_keys[id_num].add(key)
+    # end def
+
+    def _invalidateCrossoverCache(self, id_num: int):
+        """Drop all cached crossover candidates involving a virtual helix.
+        Call whenever its coordinates, helical properties or neighbors change
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        cache = self._xover_cache
+        cache_keys = self._xover_cache_keys
+        for key in cache_keys.pop(id_num, ()):
+            cache.pop(key, None)
+            other_id_num = key[1] if key[0] == id_num else key[0]
+            other_keys = cache_keys.get(other_id_num)
+            if other_keys is not None:
+                other_keys.discard(key)
+    # end def
+
+    def _resetCrossoverCache(self):
+        self._xover_cache = {}
+        self._xover_cache_keys = defaultdict(set)
+    # end def
+
+    def crossoverCacheStats(self, reset: bool = False) -> Dict[str, int]:
+        """Profiling counters of the crossover candidate cache
+
+        Args:
+            reset: optionally zero the hit and miss counters after reading
+
+        Returns:
+            ``dict`` with keys ``hits``, ``misses`` and ``size``
+        """
+        stats = {'hits': self._xover_cache_hits,
+                 'misses': self._xover_cache_misses,
+                 'size': len(self._xover_cache)}
+        if reset:
+            self._xover_cache_hits = 0
+            self._xover_cache_misses = 0
+        return stats
+    # end def
+
+    def _crossoverQueryRange(self, id_num: int, index: int = None) -> Tuple[int, int]:
+        """Range of bases of a virtual helix to search for crossovers
+
+        Args:
+            id_num: virtual helix ID number
+            index: optional, index to center the search window at.  The
+                whole virtual helix is searched if ``None``
+
+        Returns:
+            tuple of form (start, length)
+        """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
-        bases_per_turn = bpr / tpr
         if index is None:
-            start, length = 0, size
+            return 0, size
+        bpr = self.vh_properties.get(id_num, 'bases_per_repeat')
+        half_period = bpr // 2
+        if size - index < bpr:
+            return int(size - bpr), int(bpr)
         else:
-            half_period = bpr // 2
-            if size - index < bpr:
-                start, length = int(size - bpr), int(bpr)
-            else:
-                start, length = int(max(index - half_period, 0)), int(bpr)
-        # norm = np.linalg.norm
-        # cross = np.cross
-        # dot = np.dot
-        # normalize = self.normalize
+            return int(max(index - half_period, 0)), int(bpr)
+    # end def
+
+    def _crossoverThresholds(self, id_num: int) -> Tuple[Tuple[float, float, float, float],
+                                                         Tuple[float, float, float, float]]:
+        """Distance thresholds for ANTI-PARALLEL and PARALLEL phosphate
+        proximity of a virtual helix
+
+        Returns:
+            tuple of form (anti_parallel, parallel) where each item is of form::
+
+                (rsquared_min, rsquared_max, zdelta_min, zdelta_max)
+        """
+        bpr, tpr = self.vh_properties.get(id_num,
+                                          ['bases_per_repeat', 'turns_per_repeat'])
+        bases_per_turn = bpr / tpr
         PI = math.pi
-        # TWOPI = 2*PI
         RADIUS = self._radius
         BW = self._BASE_WIDTH
 
-        # theta, radius = self.radiusForAngle(alpha, RADIUS, bases_per_turn, BW)
-        # convert to a list since we can't speed this loop up without cython or something
-        # axis_pts = self.axis_pts
-        fwd_pts = self.fwd_pts
-        rev_pts = self.rev_pts
-        # this_axis_pts = axis_pts[offset + start:offset + start + length].tolist()
-        this_fwd_pts = fwd_pts[offset + start:offset + start + length].tolist()
-        this_rev_pts = rev_pts[offset + start:offset + start + length].tolist()
-
         """TODO: decide how we want to handle maintaining bond length
         ideal adjacent ANTI-PARALLEL xover strands project to a plane normal
         to the helical axis and point in the SAME direction
@@ -2187,116 +2703,104 @@ class NucleicAcidPart(Part):
                               math.sin(ma_f*half_twist_per_base)))**2
         r2_axial = BW*BW
 
-        # print("r2:", r2_radial, r2_tangent, r2_axial)
-        # 2. ANTI-PARALLEL
+        # 2. ANTI-PARALLEL, zdelta is always >= 0 so -1 disables the lower bound
         rsquared_ap = r2_tangent + r2_radial
-        rsquared_ap_min = 0
-        rsquared_ap_max = rsquared_ap
+        anti_parallel = (0, rsquared_ap, -1., 0.3*r2_axial)
 
         # 3. PARALLEL
         rsquared_p = r2_tangent + r2_radial + r2_axial
-        rsquared_p_min = r2_axial
-        rsquared_p_max = rsquared_p + 0.25*r2_axial
-        per_neighbor_hits = {}
+        parallel = (r2_axial, rsquared_p + 0.25*r2_axial, 0.3*r2_axial, 1.1*r2_axial)
+        return anti_parallel, parallel
+    # end def
 
-        fwd_axis_pairs = {}
-        rev_axis_pairs = {}
+    def _crossoverCandidates(self, id_num: int,
+                                start: int,
+                                length: int,
+                                neighbor_id: int,
+                                thresholds: tuple) -> Tuple[tuple, tuple, tuple, tuple]:
+        """Pairs of phosphates within a bond length between a range of a
+        virtual helix and all phosphates of a neighbor
 
-        for neighbor_id in neighbors:
-            offset, size = self.getOffsetAndSize(neighbor_id)
+        Args:
+            id_num: virtual helix ID number
+            start: first index of the range
+            length: number of bases in the range
+            neighbor_id: neighbor virtual helix ID number
+            thresholds: output of :meth:`_crossoverThresholds`
 
-            # 1. Finds points that point at neighbors axis point
-            nfwd_pts = fwd_pts[offset:offset + size]
-            nrev_pts = rev_pts[offset:offset + size]
+        Returns:
+            tuple of (rows, cols) pairs of :obj:`ndarray` of form::
 
-            # direction = self.directions[neighbor_id]
-            len_neighbor_pts = len(nfwd_pts)
-            delta = self.delta3D_scratch
-            if len_neighbor_pts != len(delta):
-                self.delta3D_scratch = delta = np.empty((len_neighbor_pts,), dtype=float)
+                (fwd_to_nfwd, fwd_to_nrev, rev_to_nfwd, rev_to_nrev)
+        """
+        anti_parallel, parallel = thresholds
+        _, fwd_pts, rev_pts = self.getCoordinates(id_num)
+        this_fwd_pts = fwd_pts[start:start + length]
+        this_rev_pts = rev_pts[start:start + length]
+        _, nfwd_pts, nrev_pts = self.getCoordinates(neighbor_id)
+        direction = self.directions[id_num]
+        norm = np.linalg.norm(direction)
+        if norm > 0:
+            direction = direction / norm
+        return (_proximityPairs(this_fwd_pts, nfwd_pts, direction, parallel),
+                _proximityPairs(this_fwd_pts, nrev_pts, direction, anti_parallel),
+                _proximityPairs(this_rev_pts, nfwd_pts, direction, anti_parallel),
+                _proximityPairs(this_rev_pts, nrev_pts, direction, parallel))
+    # end def
 
-            fwd_axis_hits = []
-            for i, point in enumerate(this_fwd_pts):
-                difference = nfwd_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                f_idxs = np.where((delta > rsquared_p_min) &
-                                  (delta < rsquared_p_max) &
-                                  (zdelta > 0.3*r2_axial) &
-                                  (zdelta < 1.1*r2_axial)
-                                  )[0].tolist()
-                difference = nrev_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                r_idxs = np.where((delta > rsquared_ap_min) &
-                                  (delta < rsquared_ap_max) &
-                                  (zdelta < 0.3*r2_axial))[0].tolist()
-                if f_idxs or r_idxs:
-                    fwd_axis_hits.append((start + i, f_idxs, r_idxs))
-            # end for
+    @staticmethod
+    def _crossoverHits(start: int, candidates: tuple) -> Tuple[HitListT, HitListT]:
+        """Convert proximity pairs into hit lists
 
-            # Scan for pairs of bases in AP xovers
-            idx_last = -2
-            fwd_axis_pairs = {}
-            isAGreaterThanB_Z = self.isAGreaterThanB_Z
-            for i, f_idxs, r_idxs in fwd_axis_hits:
-                if r_idxs:
-                    if idx_last + 1 == i:
-                        # print("pair", idx_last, i)
-                        fwd_axis_pairs[idx_last] = (True, neighbor_id)  # 5 prime  most strand
-                        fwd_axis_pairs[i] = (False, neighbor_id)        # 3 prime most strand
-                    idx_last = i
-                if f_idxs:
-                    for idxB in f_idxs:
-                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
-                            fwd_axis_pairs[i] = (False, neighbor_id)
-                        else:
-                            fwd_axis_pairs[i] = (True, neighbor_id)
+        Args:
+            start: first index of the range the pairs were computed for
+            candidates: output of :meth:`_crossoverCandidates`
 
-            rev_axis_hits = []
-            for i, point in enumerate(this_rev_pts):
-                difference = nfwd_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                f_idxs = np.where((delta > rsquared_ap_min) &
-                                  (delta < rsquared_ap_max) &
-                                  (zdelta < 0.3*r2_axial))[0].tolist()
+        Returns:
+            tuple of form (fwd_axis_hits, rev_axis_hits)
+        """
+        fwd_to_nfwd, fwd_to_nrev, rev_to_nfwd, rev_to_nrev = candidates
+        return (_hitsFromPairs(start, fwd_to_nfwd, fwd_to_nrev),
+                _hitsFromPairs(start, rev_to_nfwd, rev_to_nrev))
+    # end def
 
-                difference = nrev_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                r_idxs = np.where((delta > rsquared_p_min) &
-                                  (delta < rsquared_p_max) &
-                                  (zdelta > 0.3*r2_axial) &
-                                  (zdelta < 1.1*r2_axial)
-                                  )[0].tolist()
-                if f_idxs or r_idxs:
-                    rev_axis_hits.append((start + i, f_idxs, r_idxs))
-            # end for
+    def _crossoverPairs(self,   id_num: int,
+                                neighbor_id: int,
+                                axis_hits: HitListT,
+                                axis_pairs: dict,
+                                is_fwd: bool):
+        """Scan for pairs of bases in AP xovers and PARALLEL xovers, adding
+        them to ``axis_pairs``
 
-            # Scan for pairs of bases in AP xovers
-            idx_last = -2
-            for i, f_idxs, r_idxs in rev_axis_hits:
-                if f_idxs:
-                    if idx_last + 1 == i:
-                        # print("pair", idx_last, i)
-                        rev_axis_pairs[idx_last] = (False, neighbor_id)    # 3 prime  most strand
-                        rev_axis_pairs[i] = (True, neighbor_id)            # 5 prime most strand
-                    idx_last = i
-                if r_idxs:
-                    for idxB in r_idxs:
-                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
-                            rev_axis_pairs[i] = (True, neighbor_id)
-                        else:
-                            rev_axis_pairs[i] = (False, neighbor_id)
+        Args:
+            id_num: virtual helix ID number
+            neighbor_id: neighbor virtual helix ID number
+            axis_hits: hit list of one strand direction of ``id_num``
+            axis_pairs: dictionary to update of form::
 
-            per_neighbor_hits[neighbor_id] = (fwd_axis_hits, rev_axis_hits)
-        # end for
-        return per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs)
+                index: (is_5p, neighbor_id)
+
+            is_fwd: whether ``axis_hits`` are for the forward strand
+        """
+        if not axis_hits:
+            return
+        this_z = self.getCoordinates(id_num)[0][:, 2]
+        neighbor_z = self.getCoordinates(neighbor_id)[0][:, 2]
+        idx_last = -2
+        for i, f_idxs, r_idxs in axis_hits:
+            if is_fwd:
+                ap_idxs, p_idxs = r_idxs, f_idxs
+            else:
+                ap_idxs, p_idxs = f_idxs, r_idxs
+            if ap_idxs:
+                if idx_last + 1 == i:
+                    axis_pairs[idx_last] = (is_fwd, neighbor_id)        # 5 prime most strand if fwd
+                    axis_pairs[i] = (not is_fwd, neighbor_id)           # 3 prime most strand if fwd
+                idx_last = i
+            if p_idxs:
+                # the last neighbor index wins
+                is_a_greater = bool(this_z[i] > neighbor_z[p_idxs[-1]])
+                axis_pairs[i] = (is_a_greater != is_fwd, neighbor_id)
     # end def
 
     @staticmethod
@@ -2491,7 +2995,7 @@ class NucleicAcidPart(Part):
 
 
         """
-        neighbors = literal_eval(self.vh_properties.loc[id_num, 'neighbors'])
+        neighbors = self._vh_neighbors.get(id_num, [])
         # alpha = self.getProperty('crossover_span_angle')
 
         # idx = None # FORCE this for now to prevent animation GC crashes
@@ -2517,17 +3021,36 @@ class NucleicAcidPart(Part):
         return xLL * scale_factor, yLL * scale_factor, xUR * scale_factor, yUR * scale_factor
     # end def
 
-    def getSequences(self) -> str:
-        """getSequences"""
-        # s = "Start\tEnd\tColor\tMod5\tSequence\tMod3\tAbstractSequence\n"
-        keys = ['Start', 'End', 'Color', 'Mod5',
-                'Sequence', 'Mod3', 'AbstractSequence']
-        out = {key: [] for key in keys}
-        for oligo in self._oligos:
-            oligo.sequenceExport(out)
-        df = pd.DataFrame(out, columns=keys)
-        s = df.to_csv(index=False)
-        return s
+    def getSequences(self, columns: Tuple[str, ...] = EXPORT_COLUMNS, fmt: str = 'csv') -> str:
+        """Staple sequences as text, see :func:`sequenceexport.writeSequences`
+        to write them to a file as they are made
+
+        Args:
+            columns: names from ``EXPORT_COLUMNS``
+            fmt: one of ``sequenceexport.FORMATS``
+
+        Returns:
+            the table with a header
+        """
+        out = io.StringIO()
+        sequenceexport.writeSequences(self, out, columns, fmt)
+        return out.getvalue()
+    # end def
+
+    def writeSequences(self, fd: TextIO, columns: Tuple[str, ...] = EXPORT_COLUMNS, fmt: str = 'csv') -> int:
+        """Stream the staple sequences to a file, see
+        :func:`sequenceexport.writeSequences`
+
+        Args:
+            fd: file opened with ``newline=''``
+            columns: names from ``EXPORT_COLUMNS``
+            fmt: one of ``sequenceexport.FORMATS``
+
+        Returns:
+            the number of oligos written
+        """
+        return sequenceexport.writeSequences(self, fd, columns, fmt)
+    # end def
 
     def getIdNums(self) -> Set[int]:
         """return the set of all ids used"""
@@ -2638,11 +3161,10 @@ class NucleicAcidPart(Part):
             if (k - j) < 2:
                 return k
 
-        # Convert lengths to absolute positions
-        abs_positions = []
-        for olg_len in len_list:
-            id_num, ss_type, idx = oligo.getAbsolutePositionAtLength(olg_len)
-            abs_positions.append((id_num, ss_type, idx))
+        # Convert lengths to absolute positions, the last base before each
+        # break stays with the 5' oligo
+        abs_positions = oligo.positionsAtLengths([olg_len - 1 for olg_len in len_list])
+        for id_num, ss_type, idx in abs_positions:
             ss = self.getStrandSets(id_num)[ss_type]
             strand = ss.getStrand(idx)
             if strand.hasXoverAt(idx):
@@ -2769,11 +3291,9 @@ class NucleicAcidPart(Part):
         lists that have lengths equal to that of x_list and y_list (which must
         also be lists with equal lengths).
 
-        For each element in the specified lists, a CreateVirtualHelixCommand is
-        created and queued in a list.  execCommandList is then called to batch
-        the creation of virtual helices in an undo stack macro.  This results in
-        one undo/redo operation for all the virtual helices created in this
-        batch
+        All the virtual helices are created by a single
+        CreateVirtualHelicesCommand.  This results in one undo/redo operation
+        for all the virtual helices created in this batch
 
         Args:
             x_list:  A list of length N corresponding to the x
@@ -2815,34 +3335,60 @@ class NucleicAcidPart(Part):
         assert parities is None or isinstance(parities, (list, tuple))
         assert parities is None or len(parities) == len(x_list)
 
-        commands = []
-        id_numbers = []
-
-        for i, x in enumerate(x_list):
-            y = y_list[i]
-            z = z_list[i] if z_list else 0.0
-            _length = length[i] if length else self._STEP_SIZE*2
-            _id_num = id_nums[i] if id_nums is not None else None
-            _properties = properties_list[i] if properties_list is not None else None
-            _safe = safe_list[i] if safe_list is not None else True
-            _parity = parities[i] if parities is not None else None
+        count = len(x_list)
+        if z_list is None:
+            z_list = [0.0]*count
+        if length is None:
+            length = [self._STEP_SIZE*2]*count
+        c = CreateVirtualHelicesCommand(self,
+                                        list(zip(x_list, y_list, z_list)),
+                                        length,
+                                        id_nums=id_nums,
+                                        properties_list=properties_list,
+                                        safe_list=safe_list,
+                                        parities=parities)
+        util.doCmd(self, c, use_undostack=use_undo_stack)
+        return list(c.id_nums)
+    # end def
 
-            # Reserve the _id_num to prevent id_number collisions between VHs created in this loop
-            if _id_num is None:
-                _id_num = self._getNewIdNum(parity=_parity)
-                self._reserveIdNum(requested_id_num=_id_num)
+    def createVirtualHelices(self,  origins: List[Vec3T],
+                                    lengths: List[int],
+                                    directions: List[Vec3T] = None,
+                                    id_nums: List[int] = None,
+                                    properties: Dict[str, list] = None,
+                                    safe: bool = True,
+                                    use_undostack: bool = True) -> List[int]:
+        """Create many VirtualHelices in one pass with a single
+        CreateVirtualHelicesCommand.  Unlike :meth:`createVirtualHelix` no
+        check for an existing virtual helix at the same origin is made
 
-            command = CreateVirtualHelixCommand(self, x=x, y=y, z=z,
-                                                length=_length,
-                                                id_num=_id_num,
-                                                properties=_properties,
-                                                safe=_safe,
-                                                parity=_parity)
-            commands.append(command)
-            id_numbers.append(_id_num)
+        Args:
+            origins: ``(x, y, z)`` or ``(x, y)`` of each VirtualHelix
+            lengths: Size of each VirtualHelix
+            directions: optional, direction of each VirtualHelix
+            id_nums: optional, ID number of each VirtualHelix
+            properties: optional, ``dict`` of property key to the list of
+                values of each VirtualHelix
+            safe: Update neighbors otherwise, the ``neighbors`` must be in
+                ``properties``
+            use_undostack: Set to ``False`` to disable undo stack for bulk
+                operations such as file import.
 
-        util.execCommandList(self, commands=commands, desc='SPA', use_undostack=use_undo_stack)
-        return id_numbers
+        Returns:
+            list of the ID numbers created
+        """
+        properties_list = None
+        if properties:
+            keys = list(properties.keys())
+            properties_list = [(keys, list(values))
+                               for values in zip(*[properties[key] for key in keys])]
+        c = CreateVirtualHelicesCommand(self, origins, lengths,
+                                        directions=directions,
+                                        id_nums=id_nums,
+                                        properties_list=properties_list,
+                                        safe_list=[safe]*len(origins))
+        util.doCmd(self, c, use_undostack=use_undostack)
+        return list(c.id_nums)
     # end def
 
     def removeVirtualHelix(self, id_num: int, use_undostack: bool = True):
@@ -3108,6 +3654,45 @@ class NucleicAcidPart(Part):
         return idx + delta
     # end def
 
+    @contextmanager
+    def batch(self, name: str = "Batch edit", use_undostack: bool = True):
+        """Context manager for many edits at once.  Refreshing the strand
+        segments, oligo lengths, virtual helix neighbors, origin limits and
+        maximum virtual helix length is deferred until the batch closes and
+        then done once for what changed.  Signals are deferred with
+        :meth:`deferSignals`.  Nested batches join the outermost one.
+
+            with part.batch("Auto staple"):
+                ...
+
+        Inside the batch these values may be out of date.  Undoing or redoing
+        the batch later updates them as the edits are replayed.
+
+        Args:
+            name: name of the undo macro recording the batch
+            use_undostack: default is ``True``, record the batch as one undo
+                macro
+
+        Yields:
+            the :class:`PartBatch` of the outermost batch
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+        with self.deferSignals():
+            undostack = self.undoStack() if use_undostack else None
+            if undostack is not None:
+                undostack.beginMacro(name)
+            batch = self._batch = PartBatch(self)
+            try:
+                yield batch
+            finally:
+                self._batch = None
+                batch.finish()
+                if undostack is not None:
+                    undostack.endMacro()
+    # end def
+
     def newPart(self) -> Part:
         return Part(self._document)
     # end def
@@ -3129,7 +3714,7 @@ class NucleicAcidPart(Part):
                                 new_size: int,
                                 use_undostack: bool = True,
                                 zoom_to_fit: bool = False):
-        old_size = self.vh_properties.loc[id_num, 'length']
+        old_size = self.vh_properties.get(id_num, 'length')
         delta = int(new_size - old_size)
         c = ResizeVirtualHelixCommand(self, id_num, True, delta, zoom_to_fit)
         util.doCmd(self, c, use_undostack=use_undostack)
@@ -3163,41 +3748,53 @@ class NucleicAcidPart(Part):
 
         emits ``partVirtualHelicesTranslatedSignal``
         """
-        threshold = 2.1*self._radius
+        vh_set = set(vh_set)
         # 1. get old neighbor list
         old_neighbors = set()
         for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            old_neighbors.update(neighbors)
+            old_neighbors.update(self._vh_neighbors.get(id_num, ()))
         # 2. move in the virtual_helix_group
         self._translateCoordinates(vh_set, (dx, dy, dz))
         # 3. update neighbor calculations
+        batch = self._batch
+        if batch is not None:
+            # neighbors are not updated until the batch closes, so these are
+            # the neighbors before the batch
+            batch.old_neighbors.update(old_neighbors)
+            batch.moved.update(vh_set)
+            left_overs = old_neighbors.difference(vh_set)
+        else:
+            left_overs = self._updateNeighbors(vh_set, old_neighbors)
+        self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, left_overs, do_deselect)
+    # end def
+
+    def _updateNeighbors(self, vh_set: Set[int], old_neighbors: Set[int]) -> Set[int]:
+        """Recompute the neighbors of moved virtual helices and of their old
+        and new neighbors
+
+        emits ``partVirtualHelixPropertyChangedSignal`` for each of them
+
+        Args:
+            vh_set: ID numbers of the moved virtual helices
+            old_neighbors: neighbors of ``vh_set`` before the move
+
+        Returns:
+            the old and new neighbors that are not in ``vh_set``
+        """
+        threshold = 2.1*self._radius
         new_neighbors = set()
-        for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties( id_num,
-                                                'neighbors',
-                                                str(list(neighbors)),
-                                                use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
+        for neighbors in self.recomputeNeighbors(threshold, vh_set).values():
             new_neighbors.update(neighbors)
 
         # now update the old and new neighbors that were not in the vh set
         left_overs = new_neighbors.union(old_neighbors).difference(vh_set)
-        for id_num in left_overs:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties( id_num,
-                                                'neighbors',
-                                                str(list(neighbors)),
-                                                use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
-        self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, left_overs, do_deselect)
+        self.recomputeNeighbors(threshold, left_overs)
+        for id_num in vh_set.union(left_overs):
+            self._invalidateCrossoverCache(id_num)
+            self.partVirtualHelixPropertyChangedSignal.emit(
+                self, id_num, self.getVirtualHelix(id_num),
+                ['neighbors'], [str(self._vh_neighbors[id_num])])
+        return left_overs
     # end def
 
     ### PRIVATE SUPPORT METHODS ###
@@ -3309,6 +3906,32 @@ class NucleicAcidPart(Part):
         self._current_base_count = 0
     # end def
 
+    def applySequences(self, assignments: Dict[OligoT, Optional[str]], use_undostack: bool = True):
+        """Apply sequences to many oligos in one pass as a single command,
+        the same as :meth:`Oligo.applySequence` on each in turn, so the
+        complement of a scaffold assigned first is overwritten by the
+        sequences of the staples assigned after it.  Every oligo whose
+        sequence changes is notified once.
+
+        Args:
+            assignments: ``dict`` of form::
+
+                {oligo: sequence or None}
+
+            use_undostack: Default is ``True``
+
+        Raises:
+            ValueError: an oligo is not part of this part
+        """
+        for oligo in assignments:
+            if oligo.part() is not self:
+                raise ValueError("oligo %s is not part of %s" % (oligo.getName(), self.getName()))
+        if not assignments:
+            return
+        c = ApplySequencesCommand(self, assignments)
+        util.doCmd(self, c, use_undostack=use_undostack)
+    # end def
+
     def setAbstractSequences(self, emit_signals: bool = False):
         """Reset, assign, and display abstract sequence numbers."""
         # reset all sequence numbers
@@ -3622,6 +4245,132 @@ class NucleicAcidPart(Part):
 # end class
 
 
+PROXIMITY_CHUNK_SIZE = 1 << 18  # max number of point pairs per broadcast
+
+
+def _proximityPairs(pts: np.ndarray,
+                    other_pts: np.ndarray,
+                    direction: np.ndarray,
+                    thresholds: Tuple[float, float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Find all pairs of points of two point sets that satisfy crossover
+    thresholds.
+
+    Points are projected on ``direction`` and only pairs whose projections
+    are within the maximum crossover distance are compared, so for parallel
+    virtual helices each point is only compared to a short sliding window
+    of the other set.  Windows are broadcast in chunks to bound memory.
+
+    Args:
+        pts: n x 3 array of points
+        other_pts: m x 3 array of points
+        direction: unit vector to project points on
+        thresholds: of form (rsquared_min, rsquared_max, zdelta_min, zdelta_max)
+
+    Returns:
+        tuple of :obj:`ndarray` of form (rows, cols) of the matching pairs
+        sorted by row then column
+    """
+    rsquared_min, rsquared_max, zdelta_min, zdelta_max = thresholds
+    n, m = len(pts), len(other_pts)
+    if n == 0 or m == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    reach = math.sqrt(rsquared_max)*(1. + 1e-9)
+    other_proj = np.dot(other_pts, direction)
+    order = np.argsort(other_proj, kind='stable')
+    sorted_proj = other_proj[order]
+    proj = np.dot(pts, direction)
+    window_lo = np.searchsorted(sorted_proj, proj - reach, side='left')
+    window_hi = np.searchsorted(sorted_proj, proj + reach, side='right')
+    window_size = int((window_hi - window_lo).max())
+    if window_size == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    window = np.arange(window_size)
+    step = max(1, PROXIMITY_CHUNK_SIZE // window_size)
+    out_rows = []
+    out_cols = []
+    for lo in range(0, n, step):
+        hi = min(lo + step, n)
+        candidates = window_lo[lo:hi, np.newaxis] + window
+        in_window = candidates < window_hi[lo:hi, np.newaxis]
+        cols = order[np.minimum(candidates, m - 1)]
+        difference = other_pts[cols] - pts[lo:hi, np.newaxis, :]
+        delta = inner1d(difference, difference)
+        zdelta = np.square(difference[:, :, 2])
+        mask = (in_window &
+                (delta > rsquared_min) &
+                (delta < rsquared_max) &
+                (zdelta > zdelta_min) &
+                (zdelta < zdelta_max))
+        rows, k = np.nonzero(mask)
+        out_rows.append(rows + lo)
+        out_cols.append(cols[rows, k])
+    rows = np.concatenate(out_rows)
+    cols = np.concatenate(out_cols)
+    sort_idxs = np.lexsort((cols, rows))
+    return rows[sort_idxs], cols[sort_idxs]
+# end def
+
+
+def _slicePairs(pairs: Tuple[np.ndarray, np.ndarray],
+                start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Args:
+        pairs: output of :func:`_proximityPairs`
+        start: first row to keep
+        stop: row to stop at
+
+    Returns:
+        the pairs with rows in the range [start, stop)
+    """
+    rows, cols = pairs
+    lo, hi = np.searchsorted(rows, (start, stop))
+    return rows[lo:hi], cols[lo:hi]
+# end def
+
+
+def _transposePairs(pairs: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Args:
+        pairs: output of :func:`_proximityPairs`
+
+    Returns:
+        the pairs with rows and columns swapped, sorted by row then column
+    """
+    rows, cols = pairs
+    sort_idxs = np.lexsort((rows, cols))
+    return cols[sort_idxs], rows[sort_idxs]
+# end def
+
+
+def _hitsFromPairs(start: int,
+                    f_pairs: Tuple[np.ndarray, np.ndarray],
+                    r_pairs: Tuple[np.ndarray, np.ndarray]) -> HitListT:
+    """Args:
+        start: index of the first row of the pairs
+        f_pairs: proximity to the forward phosphates of a neighbor
+        r_pairs: proximity to the reverse phosphates of a neighbor
+
+    Returns:
+        list of form::
+
+            [(index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]
+    """
+    f_rows, f_cols = f_pairs
+    r_rows, r_cols = r_pairs
+    rows = np.union1d(f_rows, r_rows)
+    # rows are sorted so each row's columns end where the next row's begin
+    f_bounds = np.searchsorted(f_rows, rows).tolist() + [len(f_rows)]
+    r_bounds = np.searchsorted(r_rows, rows).tolist() + [len(r_rows)]
+    f_cols = f_cols.tolist()
+    r_cols = r_cols.tolist()
+    hits = []
+    for j, i in enumerate(rows.tolist()):
+        hits.append((start + i,
+                     f_cols[f_bounds[j]:f_bounds[j + 1]],
+                     r_cols[r_bounds[j]:r_bounds[j + 1]]))
+    return hits
+# end def
+
+
 def distanceToPoint(origin: Vec3T, direction: Vec3T, point: Vec3T) -> float:
     """Distance of a line to a point
 
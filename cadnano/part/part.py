@@ -7,6 +7,7 @@ from typing import (
 
 from cadnano import util
 from cadnano.proxies.cnproxy import ProxySignal
+from cadnano.proxies.signalqueue import deferSignals
 from cadnano.proxies.cnobject import CNObject
 from cadnano.objectinstance import ObjectInstance
 from .changeinstancepropertycmd import ChangeInstancePropertyCommand
@@ -113,6 +114,19 @@ class Part(CNObject):
         return self._document
     # end def
 
+    def deferSignals(self):
+        """Context manager queueing the signals emitted inside it and emitting
+        them, coalesced, when it exits, see :meth:`Document.deferSignals`
+
+            with part.deferSignals():
+                ...
+
+        Returns:
+            context manager yielding a :class:`signalqueue.SignalQueue`
+        """
+        return deferSignals()
+    # end def
+
     def setSequenceOffset(self, offset=0):
         """Set sequence offset
         
@@ -279,6 +293,10 @@ class Part(CNObject):
     # end def
 
     def _setProperty(self, key: str, value: Any, emit_signals: bool = False):
+        if isinstance(value, list):
+            # lists like virtual_helix_order are edited in place, so don't
+            # share them with the caller or the undo history
+            value = list(value)
         self._group_properties[key] = value
 
         if emit_signals:
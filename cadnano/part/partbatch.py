@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Derived state of a :class:`NucleicAcidPart` left out of date by the edits
+of a :meth:`NucleicAcidPart.batch` and brought up to date when it closes
+"""
+from typing import Set
+
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT
+)
+
+
+class PartBatch(object):
+    """Dirty derived state of a part during :meth:`NucleicAcidPart.batch`
+
+    Args:
+        part: the part being edited
+    """
+    __slots__ = ('part', 'segments', 'oligo_lengths', 'moved', 'old_neighbors',
+                 'origin_limits', 'max_length')
+
+    def __init__(self, part: NucleicAcidPartT):
+        self.part: NucleicAcidPartT = part
+        self.segments: Set[int] = set()
+        """ID numbers of the virtual helices to refresh the segments of"""
+        self.oligo_lengths: Set[OligoT] = set()
+        """oligos whose length was changed or needs a refresh"""
+        self.moved: Set[int] = set()
+        """ID numbers of the translated virtual helices"""
+        self.old_neighbors: Set[int] = set()
+        """neighbors of the translated virtual helices before they moved"""
+        self.origin_limits: bool = False
+        self.max_length: bool = False
+    # end def
+
+    def finish(self):
+        """Recompute the dirty state once, emitting the signals the deferred
+        updates would have
+        """
+        part = self.part
+        id_nums = set(part.getidNums())
+        if self.origin_limits and id_nums:
+            part._setVirtualHelixOriginLimits()
+        if self.max_length:
+            gps = part._group_properties
+            gps['max_vhelix_length'] = part.vh_properties.column('length').max().item()
+        if self.moved:
+            part._updateNeighbors(self.moved & id_nums, self.old_neighbors & id_nums)
+        for id_num in sorted(self.segments & id_nums):
+            part.refreshSegments(id_num)
+        oligos = part._oligos
+        for oligo in self.oligo_lengths:
+            if oligo in oligos:
+                oligo.refreshLength(emit_signals=True)
+    # end def
+# end class
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Bulk construction of :class:`NucleicAcidPart` contents
+
+A :class:`PartBuilder` collects tables of virtual helices, strands and
+crossovers and adds them to a part in one pass: the virtual helices are
+created by a single :class:`CreateVirtualHelicesCommand` (one allocation,
+vectorized points, one neighbor search and one coalesced signal) and with
+the undo stack everything is recorded in one macro.
+"""
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple
+)
+
+from cadnano import util
+from cadnano.part.createvhelixcmd import CreateVirtualHelicesCommand
+from cadnano.part.refresholigoscmd import RefreshOligosCommand
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    Vec3T
+)
+
+StrandRowT = Tuple[int, bool, int, int, str]
+"""``(id_num, is_fwd, low_idx, high_idx, color)``, ``color`` may be ``None``"""
+
+XoverRowT = Tuple[int, bool, int, int, bool, int]
+"""``(from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx)``"""
+
+
+class PartBuilder(object):
+    """Accumulate virtual helices, strands and crossovers for a part and add
+    them with :meth:`build`
+
+    Args:
+        part: the ``NucleicAcidPart`` to build into
+    """
+
+    def __init__(self, part: NucleicAcidPartT):
+        self.part: NucleicAcidPartT = part
+        self._origins: List[Vec3T] = []
+        self._lengths: List[int] = []
+        self._directions: List[Vec3T] = []
+        self._id_nums: List[int] = []
+        self._properties_list: List[tuple] = []
+        self._strands: List[StrandRowT] = []
+        self._xovers: List[XoverRowT] = []
+    # end def
+
+    def addVirtualHelices(self, origins: Sequence[Vec3T],
+                                lengths: Sequence[int],
+                                directions: Sequence[Vec3T] = None,
+                                id_nums: Sequence[int] = None,
+                                properties: Dict[str, list] = None):
+        """Queue virtual helices
+
+        Args:
+            origins: ``(x, y, z)`` or ``(x, y)`` of each virtual helix
+            lengths: number of bases of each virtual helix
+            directions: optional, direction of each virtual helix. Defaults
+                to ``(0, 0, 1)``
+            id_nums: optional, ID number of each virtual helix, ``None``
+                entries get a new ID number on :meth:`build`
+            properties: optional, ``dict`` of property key to the list of
+                values of each virtual helix
+        """
+        count = len(origins)
+        if len(lengths) != count:
+            raise ValueError("got %d lengths for %d origins" % (len(lengths), count))
+        for origin in origins:
+            origin = tuple(float(x) for x in origin)
+            self._origins.append(origin if len(origin) == 3 else origin + (0.,))
+        self._lengths += [int(x) for x in lengths]
+        self._directions += [(0, 0, 1.)]*count if directions is None else list(directions)
+        self._id_nums += [None]*count if id_nums is None else list(id_nums)
+        if properties:
+            keys = list(properties.keys())
+            self._properties_list += [(keys, list(values))
+                                      for values in zip(*[properties[key] for key in keys])]
+        else:
+            self._properties_list += [None]*count
+    # end def
+
+    def addStrands(self, strands: Iterable[StrandRowT]):
+        """Queue strands, created after all the virtual helices
+
+        Args:
+            strands: rows of ``(id_num, is_fwd, low_idx, high_idx, color)``
+        """
+        self._strands += [tuple(row) for row in strands]
+    # end def
+
+    def addXovers(self, xovers: Iterable[XoverRowT]):
+        """Queue crossovers, created after all the strands
+
+        Args:
+            xovers: rows of ``(from_id, from_is_fwd, from_idx, to_id,
+                to_is_fwd, to_idx)``, from the 3' end of a strand to the 5'
+                end of another
+        """
+        self._xovers += [tuple(row) for row in xovers]
+    # end def
+
+    def build(self, safe: bool = True, use_undostack: bool = True) -> List[int]:
+        """Add everything queued to the part and clear the queues
+
+        Args:
+            safe: compute the neighbors of the virtual helices, otherwise the
+                ``neighbors`` must be in their properties
+            use_undostack: Set to ``False`` to disable undo stack for bulk
+                operations such as file import. Otherwise the build is one
+                undo macro
+
+        Returns:
+            list of the ID numbers of the virtual helices created
+        """
+        part = self.part
+        if use_undostack:
+            part.undoStack().beginMacro("Build part")
+        try:
+            id_nums = []
+            if self._origins:
+                c = CreateVirtualHelicesCommand(part, self._origins, self._lengths,
+                                                directions=self._directions,
+                                                id_nums=self._id_nums,
+                                                properties_list=self._properties_list,
+                                                safe_list=[safe]*len(self._origins))
+                util.doCmd(part, c, use_undostack=use_undostack)
+                id_nums = list(c.id_nums)
+            self._buildStrands(use_undostack)
+            self._buildXovers(use_undostack)
+        finally:
+            if use_undostack:
+                part.undoStack().endMacro()
+        self.clear()
+        return id_nums
+    # end def
+
+    def clear(self):
+        """Empty the queues
+        """
+        self._origins = []
+        self._lengths = []
+        self._directions = []
+        self._id_nums = []
+        self._properties_list = []
+        self._strands = []
+        self._xovers = []
+    # end def
+
+    def _buildStrands(self, use_undostack: bool):
+        part = self.part
+        default_color = part.getProperty('color')
+        if use_undostack:
+            for id_num, is_fwd, low_idx, high_idx, color in self._strands:
+                fwd_ss, rev_ss = part.getStrandSets(id_num)
+                strandset = fwd_ss if is_fwd else rev_ss
+                strandset.createDeserializedStrand(low_idx, high_idx,
+                                                   default_color if color is None else color,
+                                                   use_undostack=True)
+            return
+        # insert per strandset and refresh the segments of each helix once
+        grouped = defaultdict(lambda: ([], []))
+        for id_num, is_fwd, low_idx, high_idx, color in self._strands:
+            idxs, colors = grouped[(id_num, is_fwd)]
+            idxs.append((low_idx, high_idx))
+            colors.append(default_color if color is None else color)
+        for (id_num, is_fwd), (idxs, colors) in grouped.items():
+            fwd_ss, rev_ss = part.getStrandSets(id_num)
+            strandset = fwd_ss if is_fwd else rev_ss
+            strandset.createDeserializedStrands(idxs, colors)
+        for id_num in sorted({id_num for id_num, _ in grouped}):
+            part.refreshSegments(id_num)
+    # end def
+
+    def _buildXovers(self, use_undostack: bool):
+        part = self.part
+        for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx in self._xovers:
+            from_strand = part.getStrand(from_is_fwd, from_id, from_idx)
+            to_strand = part.getStrand(to_is_fwd, to_id, to_idx)
+            part.createXover(from_strand, from_idx,
+                             to_strand, to_idx,
+                             update_oligo=use_undostack,
+                             use_undostack=use_undostack)
+        if not use_undostack and self._xovers:
+            # assign oligos in one pass at the end
+            RefreshOligosCommand(part).redo()
+    # end def
+# end class
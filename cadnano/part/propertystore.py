@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Columnar per virtual helix property storage for :class:`NucleicAcidPart`
+
+Each property is a typed NumPy column indexed by ID number.  Scalar access
+is a plain array lookup, bulk reads and writes are fancy indexing, and a
+:class:`pandas.DataFrame` is only built on request for export.
+
+Column types are inferred from the default values.  Like a DataFrame column,
+an integer column is promoted to floats when assigned a non integral value,
+any column is promoted to objects when assigned a value it cannot hold, and
+setting an unknown key adds a column filled with ``NaN``.
+"""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    KeyT,
+    ValueT
+)
+
+
+def _dtypeForValue(value: Any) -> np.dtype:
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(bool)
+    elif isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    elif isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    else:
+        return np.dtype(object)
+# end def
+
+
+def _promotedDtype(dtype: np.dtype, values: np.ndarray) -> np.dtype:
+    """Returns:
+        the dtype a column of ``dtype`` needs to hold ``values``
+    """
+    if dtype == object:
+        return dtype
+    vdtype = values.dtype
+    if dtype == bool:
+        return dtype if vdtype == bool else np.dtype(object)
+    elif vdtype == bool or vdtype == object or vdtype.kind not in 'iuf':
+        return np.dtype(object)
+    elif dtype.kind == 'i' and vdtype.kind == 'f':
+        if np.all(np.mod(values, 1) == 0):
+            return dtype
+        return np.dtype(np.float64)
+    return dtype
+# end def
+
+
+class PropertyStore(object):
+    """Typed property columns for rows ``0`` to ``len(self) - 1``
+
+    Args:
+        keys: ordered column names
+        defaults: default value of each column, used to infer its type
+        size: initial number of rows
+    """
+
+    def __init__(self, keys: Sequence[str], defaults: Sequence[Any], size: int):
+        self.keys: List[str] = list(keys)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._size: int = 0
+        for key, default in zip(keys, defaults):
+            self._columns[key] = np.empty(0, dtype=_dtypeForValue(default))
+        self.append(size, defaults)
+    # end def
+
+    def __len__(self) -> int:
+        return self._size
+    # end def
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._columns
+    # end def
+
+    def copy(self) -> 'PropertyStore':
+        """Returns:
+            a deep copy of the store
+        """
+        new_store = PropertyStore.__new__(PropertyStore)
+        new_store.keys = list(self.keys)
+        new_store._columns = {key: col.copy() for key, col in self._columns.items()}
+        new_store._size = self._size
+        return new_store
+    # end def
+
+    def append(self, count: int, defaults: Sequence[Any]):
+        """Add ``count`` rows of ``defaults``
+
+        Args:
+            count: number of rows to add
+            defaults: value of each column in the new rows. Columns added
+                with :meth:`addColumn` are filled with ``NaN``
+        """
+        columns = self._columns
+        defaults = list(defaults) + [np.nan]*(len(self.keys) - len(defaults))
+        for key, default in zip(self.keys, defaults):
+            col = columns[key]
+            new_rows = np.empty(count, dtype=col.dtype)
+            new_rows[:] = default
+            columns[key] = np.concatenate((col, new_rows))
+        self._size += count
+    # end def
+
+    def column(self, key: str) -> np.ndarray:
+        """Args:
+            key: column name
+
+        Returns:
+            the column array.  Treat it as read only, use :meth:`set` or
+            :meth:`setColumn` to write
+        """
+        return self._columns[key]
+    # end def
+
+    def addColumn(self, key: str, value: Any):
+        """Add a column of ``NaN`` typed to hold ``value``
+
+        Args:
+            key: column name
+            value: example value for the column
+        """
+        dtype = _dtypeForValue(value)
+        if dtype != object:
+            dtype = np.dtype(np.float64)
+        col = np.empty(self._size, dtype=dtype)
+        col[:] = np.nan
+        self._columns[key] = col
+        self.keys.append(key)
+    # end def
+
+    def get(self, row: int, keys: KeyT) -> ValueT:
+        """Args:
+            row: row index, ie virtual helix ID number
+            keys: :obj:`str` or :obj:`list`/:obj:`tuple` of column names
+
+        Returns:
+            python native ``object`` or list depending on type of arg ``keys``
+
+        Raises:
+            KeyError: unknown key
+        """
+        columns = self._columns
+        if isinstance(keys, (list, tuple)):
+            return [_native(columns[key][row]) for key in keys]
+        return _native(columns[keys][row])
+    # end def
+
+    def getRow(self, row: int) -> dict:
+        """Args:
+            row: row index, ie virtual helix ID number
+
+        Returns:
+            ``dict`` of all python native values of the row
+        """
+        return {key: _native(col[row]) for key, col in self._columns.items()}
+    # end def
+
+    def set(self, row: int, key: str, value: Any):
+        """Args:
+            row: row index, ie virtual helix ID number
+            key: column name
+            value: new value
+        """
+        if key not in self._columns:
+            self.addColumn(key, value)
+        col = self._columns[key]
+        if col.dtype != object:
+            dtype = _promotedDtype(col.dtype, np.asarray([value]))
+            if dtype != col.dtype:
+                col = self._columns[key] = col.astype(dtype)
+        col[row] = value
+    # end def
+
+    def setColumn(self, rows: Iterable[int], key: str, values: Any):
+        """Vectorized assignment of one column for many rows
+
+        Args:
+            rows: row indices
+            key: column name
+            values: a single value or one value per row
+        """
+        if key not in self._columns:
+            self.addColumn(key, np.asarray(values).reshape(-1)[0])
+        col = self._columns[key]
+        rows = np.asarray(list(rows), dtype=int)
+        if col.dtype != object:
+            dtype = _promotedDtype(col.dtype, np.asarray(values).reshape(-1))
+            if dtype != col.dtype:
+                col = self._columns[key] = col.astype(dtype)
+        col[rows] = values
+    # end def
+
+    def addToColumn(self, rows: Iterable[int], key: str, delta: float):
+        """Vectorized ``+=`` of one numeric column for many rows
+
+        Args:
+            rows: row indices
+            key: column name
+            delta: amount to add
+        """
+        col = self._columns[key]
+        rows = np.asarray(list(rows), dtype=int)
+        self.setColumn(rows, key, col[rows] + delta)
+    # end def
+
+    def toDict(self, rows: Any = None) -> Dict[str, list]:
+        """Args:
+            rows: optional, row indices or a ``slice``. defaults to all rows
+
+        Returns:
+            ``dict`` of column name to list of python native values
+        """
+        if rows is None:
+            rows = slice(0, self._size)
+        return {key: col[rows].tolist() for key, col in self._columns.items()}
+    # end def
+
+    def toDataFrame(self, rows: Any = None):
+        """Export view of the store
+
+        Args:
+            rows: optional, row indices or a ``slice``. defaults to all rows
+
+        Returns:
+            :class:`pandas.DataFrame` copy of the rows
+        """
+        import pandas as pd
+        if rows is None:
+            rows = slice(0, self._size)
+        return pd.DataFrame({key: col[rows] for key, col in self._columns.items()},
+                            columns=self.keys)
+    # end def
+# end class
+
+
+def _native(value: Any) -> Any:
+    """Convert NumPy scalars to python types as needed by QVariant
+    """
+    return value.item() if isinstance(value, np.generic) else value
+# end def
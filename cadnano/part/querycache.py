@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Bounded LRU cache for the radius queries of :class:`NucleicAcidPart`
+
+Keys are quantized so that float noise in repeated hover positions maps to
+the same entry.  Each entry remembers its query sphere and the ID numbers
+in its result so that a coordinate change only evicts the entries it can
+affect, rather than wiping the whole cache.
+"""
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    Vec3T
+)
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_QUANTUM = 1e-3  # nm
+
+
+class QueryCache(object):
+    """Least recently used cache of radius queries
+
+    Args:
+        size: maximum number of entries
+        quantum: key resolution in nanometers
+    """
+
+    def __init__(self, size: int = DEFAULT_CACHE_SIZE, quantum: float = DEFAULT_QUANTUM):
+        self._entries: OrderedDict = OrderedDict()
+        self.size: int = int(size)
+        self.quantum: float = float(quantum)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._entries)
+    # end def
+
+    def key(self, radius: float, point: Vec3T) -> Tuple[int, int, int, int]:
+        """Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            quantized key of the query
+        """
+        q = self.quantum
+        x, y, z = point
+        return (round(radius / q), round(x / q), round(y / q), round(z / q))
+    # end def
+
+    def get(self, key: tuple) -> Any:
+        """Args:
+            key: output of :meth:`key`
+
+        Returns:
+            the cached result or ``None``
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+    # end def
+
+    def put(self, key: tuple, radius: float, point: Vec3T, result: Any, id_nums: Iterable[int]):
+        """Store a query result, evicting the least recently used entry when
+        full
+
+        Args:
+            key: output of :meth:`key`
+            radius: distance of the query
+            point: of :obj:`float` of length 3 of the query
+            result: query result
+            id_nums: ID numbers the result refers to
+        """
+        if self.size <= 0:
+            return
+        entries = self._entries
+        entries[key] = (result, float(radius), np.asarray(point, dtype=float), frozenset(id_nums))
+        entries.move_to_end(key)
+        while len(entries) > self.size:
+            entries.popitem(last=False)
+            self.evictions += 1
+    # end def
+
+    def invalidate(self, id_nums: Iterable[int], points: np.ndarray = None):
+        """Drop the entries whose results refer to ``id_nums`` or whose query
+        sphere touches the bounding box of ``points``
+
+        Args:
+            id_nums: ID numbers whose coordinates changed
+            points: optional, n x 3 array of new coordinates
+        """
+        entries = self._entries
+        if not entries:
+            return
+        id_nums = set(id_nums)
+        box = None
+        if points is not None:
+            points = np.asarray(points, dtype=float).reshape(-1, 3)
+            points = points[np.isfinite(points).all(axis=1)]
+            if len(points):
+                box = points.min(axis=0), points.max(axis=0)
+        stale = []
+        for key, (_, radius, point, result_id_nums) in entries.items():
+            if not id_nums.isdisjoint(result_id_nums):
+                stale.append(key)
+            elif box is not None:
+                closest = np.clip(point, box[0], box[1])
+                difference = closest - point
+                if np.dot(difference, difference) <= radius*radius:
+                    stale.append(key)
+        for key in stale:
+            del entries[key]
+        self.invalidations += len(stale)
+    # end def
+
+    def clear(self):
+        """Remove all entries, keeping the counters
+        """
+        self._entries.clear()
+    # end def
+
+    def resize(self, size: int):
+        """Args:
+            size: new maximum number of entries
+        """
+        self.size = int(size)
+        entries = self._entries
+        while len(entries) > max(self.size, 0):
+            entries.popitem(last=False)
+            self.evictions += 1
+    # end def
+
+    def stats(self) -> Dict[str, int]:
+        """Returns:
+            ``dict`` with keys ``hits``, ``misses``, ``evictions``,
+            ``invalidations``, ``size`` and ``max_size``
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'max_size': self.size}
+    # end def
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    # end def
+# end class
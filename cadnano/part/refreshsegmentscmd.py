@@ -1,12 +1,16 @@
 from typing import Set
 
+from cadnano.proxies.cnenum import CommandIdEnum
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import NucleicAcidPartT
 
 class RefreshSegmentsCommand(UndoCommand):
-    """ Add an UndoCommand to the undostack calling Part.refreshSegments
+    """ Add an UndoCommand to the undostack calling Part.refreshSegments.
+    Consecutive refreshes of the same virtual helices merge into one command
     """
 
+    __slots__ = ('part', 'id_nums')
+
     def __init__(self, part: int, id_nums: Set[int]):
         super(RefreshSegmentsCommand, self).__init__("refresh segments")
         self.part = part
@@ -24,4 +28,18 @@ class RefreshSegmentsCommand(UndoCommand):
         for id_num in self.id_nums:
             part.refreshSegments(id_num)
     # end def
+
+    def id(self) -> int:
+        return CommandIdEnum.REFRESH_SEGMENTS
+    # end def
+
+    def canMergeWith(self, other: 'RefreshSegmentsCommand') -> bool:
+        return (isinstance(other, RefreshSegmentsCommand) and other.part is self.part and
+                set(other.id_nums) == set(self.id_nums))
+    # end def
+
+    def mergeWith(self, other: 'RefreshSegmentsCommand') -> bool:
+        # other already refreshed the same segments
+        return self.canMergeWith(other)
+    # end def
 # end class
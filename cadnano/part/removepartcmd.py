@@ -5,6 +5,8 @@ class RemovePartCommand(UndoCommand):
     """RemovePartCommand deletes a part. Emits partRemovedSignal.
     """
 
+    __slots__ = ('_part', '_instances', '_document')
+
     def __init__(self, part: PartT):
         super(RemovePartCommand, self).__init__("remove part")
         self._part = part
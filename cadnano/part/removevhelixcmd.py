@@ -1,6 +1,3 @@
-from ast import literal_eval
-import bisect
-
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     NucleicAcidPartT,
@@ -11,6 +8,11 @@ class RemoveVirtualHelixCommand(UndoCommand):
     neighbors, emits appropriate signals.
     """
 
+    __slots__ = (
+        'part', 'id_num', 'length', 'origin_pt', 'direction', 'neighbors', 'color', 'props',
+        'old_active_base_info', '_order_index'
+    )
+
     def __init__(self, part: NucleicAcidPartT, id_num: int):
         super(RemoveVirtualHelixCommand, self).__init__("remove virtual helix")
         self.part = part
@@ -19,12 +21,13 @@ class RemoveVirtualHelixCommand(UndoCommand):
         x, y, _ = part.getVirtualHelixOrigin(id_num)
         self.origin_pt = (x, y, 0.)
         self.direction = tuple(part.directions[id_num]) # (0, 0, 1.)
-        neighbors = part.getVirtualHelixProperties(id_num, 'neighbors')
-        self.neighbors = literal_eval(neighbors)
+        self.neighbors = part.getVirtualHelixNeighbors(id_num)
         self.color = part.getVirtualHelixProperties(id_num, 'color')
         self.props = part.getAllVirtualHelixProperties(id_num, inject_extras=False)
+        self.props['neighbors'] = self.neighbors
         self.old_active_base_info = part.active_base_info
-        self._vh_order = part.getVirtualHelixOrder().copy()  # just copy the whole list
+        # the position in the order, not a copy of the whole order
+        self._order_index = part.getVirtualHelixOrder().index(id_num)
     # end def
 
     def redo(self):
@@ -33,16 +36,13 @@ class RemoveVirtualHelixCommand(UndoCommand):
         # clear out part references
         part.clearActiveVirtualHelix()
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(
-                part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-            )
-            nneighbors.remove(id_num)
-            part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+            part._removeVirtualHelixNeighbor(neighbor_id, id_num)
         # signaling the view is two parts to clean up signals properly
         # and then allow the views to refresh
         part.partVirtualHelixRemovingSignal.emit(
             part, id_num, part.getVirtualHelix(id_num), self.neighbors)
         part._removeHelix(id_num)
+        part._invalidateCrossoverCache(id_num)
         part.partVirtualHelixRemovedSignal.emit(part, id_num)
     # end def
 
@@ -50,11 +50,7 @@ class RemoveVirtualHelixCommand(UndoCommand):
         part = self.part
         id_num = self.id_num
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(
-                part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-            )
-            bisect.insort_left(nneighbors, id_num)
-            part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+            part._addVirtualHelixNeighbor(neighbor_id, id_num)
         vh = part._createHelix(id_num, self.origin_pt,
                                         self.direction,
                                         self.length,
@@ -63,10 +59,15 @@ class RemoveVirtualHelixCommand(UndoCommand):
         vals = list(self.props.values())
         part.setVirtualHelixProperties(id_num, keys, vals, safe=False)
         part.resetCoordinates(id_num)
+        part._invalidateCrossoverCache(id_num)
         part.partVirtualHelixAddedSignal.emit(part, id_num, vh, self.neighbors)
         abi = self.old_active_base_info
         if abi:
             part.setActiveVirtualHelix(*abi[0:3])
-        part.setImportedVHelixOrder(self._vh_order)
+        # _createHelix appended id_num, put it back where it was
+        vh_order = part.getVirtualHelixOrder()
+        vh_order.remove(id_num)
+        vh_order.insert(self._order_index, id_num)
+        part._setProperty('virtual_helix_order', vh_order, emit_signals=True)
     # end def
 # end class
@@ -10,6 +10,8 @@ class ResizeVirtualHelixCommand(UndoCommand):
     minimum index
     """
 
+    __slots__ = ('_part', '_info')
+
     def __init__(self,  part: NucleicAcidPartT,
                         id_num: int,
                         is_right: bool,
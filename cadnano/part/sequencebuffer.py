@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Part wide ``uint8`` buffers of the bases of the strands
+
+Each strand set of a virtual helix gets a buffer laid out low index to high
+index like ``axis_pts``, expanded by the insertions of the helix so that
+an insertion of length ``n`` takes ``n + 1`` bytes and a skip none.  Forward
+and reverse buffers of a helix share the layout, so the bases paired with
+the bases of one strand set sit at the same offsets of the other and the
+complement of a whole helix is one table lookup.
+
+The strands keep their sequence as a 5' to 3' ``str`` read from their slice
+of the buffer.  Strands edited since the last application, by splits,
+merges and the like, are loaded back into the buffer before it is written,
+so it never goes stale.
+"""
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano import util
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT,
+    StrandT
+)
+
+ENCODING = 'latin-1'
+BLANK = ord(' ')
+
+
+def _complementTable() -> np.ndarray:
+    table = np.arange(256, dtype=np.uint8)
+    for base, pair in util.complement.items():
+        table[base] = pair
+    return table
+# end def
+
+
+COMPLEMENT_TABLE = _complementTable()
+"""base to paired base, the other bytes map to themselves like :func:`util.comp`"""
+
+
+class SequenceBuffer(object):
+    """The sequence buffers of a :class:`NucleicAcidPart`
+
+    Args:
+        part: the part owning the strands
+    """
+
+    def __init__(self, part: NucleicAcidPartT):
+        self._part = part
+        self._buffers: Dict[Tuple[int, bool], np.ndarray] = {}
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+    # end def
+
+    def nbytes(self) -> int:
+        """Returns:
+            the bytes held by the buffers
+        """
+        return sum(buf.nbytes for buf in self._buffers.values())
+    # end def
+
+    def discard(self, id_num: int):
+        """Drop the buffers of a removed virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        self._buffers.pop((id_num, True), None)
+        self._buffers.pop((id_num, False), None)
+    # end def
+
+    def layout(self, id_num: int) -> np.ndarray:
+        """Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            the offsets of the bases of the helix, index ``i`` starts at
+            ``offsets[i]`` and ends before ``offsets[i + 1]``
+        """
+        part = self._part
+        size = max(part.maxBaseIdx(id_num), 1)
+        widths = np.ones(size + 1, dtype=np.int64)
+        widths[0] = 0
+        for idx, insertion in part.insertions()[id_num].items():
+            if 0 <= idx < size:
+                widths[idx + 1] += insertion.length()
+        return np.cumsum(widths)
+    # end def
+
+    def _buffer(self, id_num: int, is_forward: bool, length: int) -> np.ndarray:
+        key = (id_num, is_forward)
+        buf = self._buffers.get(key)
+        if buf is None or len(buf) < length:
+            buf = self._buffers[key] = np.full(length, BLANK, dtype=np.uint8)
+        return buf
+    # end def
+
+    def applyOligoSequence(self, oligo: OligoT, sequence: Optional[str],
+                           layouts: dict = None) -> List[OligoT]:
+        """Set the sequence of the strands of ``oligo`` and the complement of
+        it on the strands paired with them, like :meth:`Strand.setSequence`
+        and :meth:`Strand.setComplementSequence` do strand by strand.  The
+        bases of ``oligo`` always come from ``sequence``, also where the
+        oligo pairs with itself.
+
+        Args:
+            oligo: the oligo to apply to
+            sequence: 5' to 3', padded with spaces or truncated to the length
+                of the oligo, or ``None`` to clear the sequence
+            layouts: optional ``dict`` of the :meth:`layout` lists by ID
+                number, filled as needed, to share between applications
+
+        Returns:
+            the oligos whose sequence changed, ``oligo`` first
+        """
+        strands = list(oligo.strand5p().generator3pStrand())
+        own = set(strands)
+        if layouts is None:
+            layouts = {}
+        for strand in strands:
+            id_num = strand.idNum()
+            if id_num not in layouts:
+                layouts[id_num] = self.layout(id_num).tolist()
+
+        data = None if sequence is None else sequence.encode(ENCODING, 'replace')
+        pos = 0
+        # (id_num, is_forward) of the applied bases: [(start, stop), ...]
+        spans: Dict[Tuple[int, bool], List[Tuple[int, int]]] = {}
+        # (id_num, is_forward) of the paired bases: {paired strand: (start, stop)}
+        paired: Dict[Tuple[int, bool], Dict[StrandT, Tuple[int, int]]] = {}
+        oligos = [oligo]
+        seen = {oligo}
+        for strand in strands:
+            id_num = strand.idNum()
+            offsets = layouts[id_num]
+            is_forward = strand.isForward()
+            low_idx, high_idx = strand.idxs()
+            start, stop = offsets[low_idx], offsets[high_idx + 1]
+            buf = self._buffer(id_num, is_forward, offsets[-1])
+            if data is None:
+                strand._sequence = None
+                buf[start:stop] = BLANK
+            else:
+                length = stop - start
+                chunk = data[pos:pos + length]
+                pos += length
+                if len(chunk) < length:
+                    chunk += b' '*(length - len(chunk))
+                strand._sequence = chunk.decode(ENCODING)
+                bases = np.frombuffer(chunk, dtype=np.uint8)
+                buf[start:stop] = bases if is_forward else bases[::-1]
+            spans.setdefault((id_num, is_forward), []).append((start, stop))
+
+            comp_key = (id_num, not is_forward)
+            helix_paired = paired.get(comp_key)
+            for comp_strand in strand.getComplementStrands():
+                if comp_strand in own:
+                    continue
+                if helix_paired is None:
+                    helix_paired = paired[comp_key] = {}
+                    self._buffer(id_num, not is_forward, offsets[-1])
+                elif comp_strand in helix_paired:
+                    continue
+                c_low_idx, c_high_idx = comp_strand.idxs()
+                c_start, c_stop = offsets[c_low_idx], offsets[c_high_idx + 1]
+                helix_paired[comp_strand] = (c_start, c_stop)
+                if c_low_idx < low_idx or c_high_idx > high_idx:
+                    # keep the bases not paired with this strand
+                    self._load(comp_strand, self._buffers[comp_key], c_start, c_stop)
+                comp_oligo = comp_strand.oligo()
+                if comp_oligo not in seen:
+                    seen.add(comp_oligo)
+                    oligos.append(comp_oligo)
+        # end for
+
+        # pair whole strands, the bases paired with no strand are never read
+        buffers = self._buffers
+        for (id_num, is_forward), helix_spans in spans.items():
+            if (id_num, not is_forward) not in paired:
+                continue
+            buf, comp_buf = buffers[(id_num, is_forward)], buffers[(id_num, not is_forward)]
+            for start, stop in helix_spans:
+                comp_buf[start:stop] = COMPLEMENT_TABLE[buf[start:stop]]
+        # the bases of the oligo paired with itself are its own
+        for strand in strands:
+            key = (strand.idNum(), strand.isForward())
+            if (key[0], not key[1]) in spans and key in paired:
+                offsets = layouts[key[0]]
+                low_idx, high_idx = strand.idxs()
+                self._load(strand, buffers[key], offsets[low_idx], offsets[high_idx + 1])
+
+        for (id_num, is_forward), helix_paired in paired.items():
+            text = buffers[(id_num, is_forward)].tobytes().decode(ENCODING)
+            for comp_strand, (c_start, c_stop) in helix_paired.items():
+                seq = text[c_start:c_stop] if is_forward else text[c_start:c_stop][::-1]
+                comp_strand._sequence = seq if seq else None
+        for olg in oligos:
+            olg._touch()
+        return oligos
+    # end def
+
+    def applySequences(self, assignments: Dict[OligoT, Optional[str]]) -> List[OligoT]:
+        """Apply many sequences in one pass, in the order of
+        ``assignments``, as :meth:`applyOligoSequence` would one after the
+        other.  The layouts of the helices, insertions and skips included,
+        are worked out once.
+
+        Args:
+            assignments: ``dict`` of form::
+
+                {oligo: sequence or None}
+
+        Returns:
+            the oligos whose sequence changed, each once
+        """
+        layouts = {}
+        oligos = {}
+        for oligo, sequence in assignments.items():
+            for changed in self.applyOligoSequence(oligo, sequence, layouts):
+                oligos[changed] = None
+        return list(oligos)
+    # end def
+
+    def _load(self, strand: StrandT, buf: np.ndarray, start: int, stop: int):
+        seq = strand._sequence
+        if seq is None or len(seq) != stop - start:
+            buf[start:stop] = BLANK
+            return
+        bases = np.frombuffer(seq.encode(ENCODING, 'replace'), dtype=np.uint8)
+        buf[start:stop] = bases if strand.isForward() else bases[::-1]
+    # end def
+# end class
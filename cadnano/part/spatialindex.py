@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Uniform grid spatial hash used by :class:`NucleicAcidPart` to answer
+radius queries without scanning every stored point.
+
+Entries are keyed by ``(id_num, idx)`` rather than by row in the packed
+point arrays of the part, since rows shift whenever a virtual helix earlier
+in the packing grows or shrinks.  Per virtual helix base indices are stored
+relative to a per ``id_num`` shift so that prepending points only needs a
+counter update instead of re-bucketing the whole helix.
+"""
+from typing import (
+    Dict,
+    Set,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    Vec3T
+)
+
+DEFAULT_CELL_SIZE = 2.0  # nm, on the order of a helix diameter
+
+
+class SpatialIndex(object):
+    """Bucket points into cubic cells of side ``cell_size``
+
+    Args:
+        cell_size: edge length of a grid cell in nanometers
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size: float = float(cell_size)
+        self._cells: Dict[Tuple[int, int, int], Dict[int, Set[int]]] = {}
+        self._shifts: Dict[int, int] = {}
+    # end def
+
+    def __len__(self) -> int:
+        return sum(len(idxs) for cell in self._cells.values()
+                   for idxs in cell.values())
+    # end def
+
+    def copy(self) -> 'SpatialIndex':
+        """Returns:
+            a deep copy of this index
+        """
+        new_index = SpatialIndex(self.cell_size)
+        new_index._cells = {key: {id_num: idxs.copy() for id_num, idxs in cell.items()}
+                            for key, cell in self._cells.items()}
+        new_index._shifts = self._shifts.copy()
+        return new_index
+    # end def
+
+    def clear(self):
+        """Remove all entries
+        """
+        self._cells = {}
+        self._shifts = {}
+    # end def
+
+    def _cellKeys(self, points: np.ndarray) -> np.ndarray:
+        return np.floor(np.asarray(points, dtype=float) / self.cell_size).astype(np.int64)
+    # end def
+
+    def _groupByCell(self, points: np.ndarray, idxs: np.ndarray):
+        """Generator of ``(cell_key, idxs)`` pairs for all finite points
+
+        Args:
+            points: n x 3 array of points
+            idxs: length n array of stored indices
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        idxs = np.asarray(idxs, dtype=np.int64)
+        finite = np.isfinite(points).all(axis=1)
+        if not finite.all():
+            points = points[finite]
+            idxs = idxs[finite]
+        if len(points) == 0:
+            return
+        keys = self._cellKeys(points)
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        starts = np.flatnonzero(np.any(keys[1:] != keys[:-1], axis=1)) + 1
+        bounds = [0] + starts.tolist() + [len(keys)]
+        sorted_idxs = idxs[order].tolist()
+        for key, lo, hi in zip(keys[bounds[:-1]].tolist(), bounds[:-1], bounds[1:]):
+            yield tuple(key), sorted_idxs[lo:hi]
+    # end def
+
+    def insert(self, id_num: int, idxs: np.ndarray, points: np.ndarray):
+        """Add points for a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            idxs: base indices of the points
+            points: n x 3 array of points
+        """
+        shift = self._shifts.setdefault(id_num, 0)
+        idxs = np.asarray(idxs, dtype=np.int64) - shift
+        cells = self._cells
+        for key, group in self._groupByCell(points, idxs):
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = {id_num: set(group)}
+            else:
+                cell.setdefault(id_num, set()).update(group)
+    # end def
+
+    def insertMany(self, id_nums: np.ndarray, idxs: np.ndarray, points: np.ndarray):
+        """Add points for several virtual helices at once.  Equivalent to
+        calling :meth:`insert` per ``id_num``
+
+        Args:
+            id_nums: virtual helix ID number of each point
+            idxs: base indices of the points
+            points: n x 3 array of points
+        """
+        id_nums = np.asarray(id_nums, dtype=np.int64)
+        idxs = np.asarray(idxs, dtype=np.int64)
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if len(id_nums) == 0:
+            return
+        order = np.argsort(id_nums, kind='stable')
+        sorted_ids = id_nums[order]
+        starts = np.flatnonzero(sorted_ids[1:] != sorted_ids[:-1]) + 1
+        bounds = [0] + starts.tolist() + [len(sorted_ids)]
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            group = order[lo:hi]
+            self.insert(int(sorted_ids[lo]), idxs[group], points[group])
+    # end def
+
+    def remove(self, id_num: int, idxs: np.ndarray, points: np.ndarray):
+        """Remove points for a virtual helix.  ``points`` must be the
+        coordinates the points were inserted with
+
+        Args:
+            id_num: virtual helix ID number
+            idxs: base indices of the points
+            points: n x 3 array of points
+        """
+        shift = self._shifts.get(id_num, 0)
+        idxs = np.asarray(idxs, dtype=np.int64) - shift
+        cells = self._cells
+        for key, group in self._groupByCell(points, idxs):
+            cell = cells.get(key)
+            if cell is None:
+                continue
+            stored = cell.get(id_num)
+            if stored is None:
+                continue
+            stored.difference_update(group)
+            if not stored:
+                del cell[id_num]
+                if not cell:
+                    del cells[key]
+    # end def
+
+    def shiftIndices(self, id_num: int, delta: int):
+        """Offset every stored index of a virtual helix by ``delta``, for
+        when points are prepended to or trimmed from the low end
+
+        Args:
+            id_num: virtual helix ID number
+            delta: amount to add to the indices
+        """
+        self._shifts[id_num] = self._shifts.get(id_num, 0) + delta
+    # end def
+
+    def discard(self, id_num: int):
+        """Forget the index shift of a removed virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        self._shifts.pop(id_num, None)
+    # end def
+
+    def query(self, radius: float, point: Vec3T) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate entries in all cells overlapping the bounding box of the
+        sphere of ``radius`` about ``point``.  Callers must still filter the
+        candidates by exact distance
+
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            tuple of :obj:`ndarray` of form (id_nums, idxs)
+        """
+        point = np.asarray(point, dtype=float)
+        if not np.isfinite(point).all() or radius < 0:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        lo = self._cellKeys(point - radius).tolist()
+        hi = self._cellKeys(point + radius).tolist()
+        cells = self._cells
+        num_box_cells = (hi[0] - lo[0] + 1)*(hi[1] - lo[1] + 1)*(hi[2] - lo[2] + 1)
+        if num_box_cells > len(cells):
+            # large query, cheaper to walk the occupied cells
+            hit_cells = [cell for key, cell in cells.items()
+                         if (lo[0] <= key[0] <= hi[0] and
+                             lo[1] <= key[1] <= hi[1] and
+                             lo[2] <= key[2] <= hi[2])]
+        else:
+            hit_cells = []
+            for i in range(lo[0], hi[0] + 1):
+                for j in range(lo[1], hi[1] + 1):
+                    for k in range(lo[2], hi[2] + 1):
+                        cell = cells.get((i, j, k))
+                        if cell is not None:
+                            hit_cells.append(cell)
+        shifts = self._shifts
+        out_id_nums = []
+        out_idxs = []
+        for cell in hit_cells:
+            for id_num, idxs in cell.items():
+                shift = shifts[id_num]
+                out_id_nums += [id_num]*len(idxs)
+                out_idxs += [x + shift for x in idxs]
+        return (np.array(out_id_nums, dtype=int),
+                np.array(out_idxs, dtype=int))
+    # end def
+# end class
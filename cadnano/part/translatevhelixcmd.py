@@ -1,30 +1,36 @@
 from typing import Set
 
+import numpy as np
+
+from cadnano.proxies.cnenum import CommandIdEnum
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     NucleicAcidPartT
 )
-# prevent circular imports
-# from cadnano.part.nucleicacidpart import Z_PROP_INDEX
-Z_PROP_INDEX = -1  # index for Dataframe.iloc calls
 
 
 class TranslateVirtualHelicesCommand(UndoCommand):
-    """ Move Virtual Helices around"""
+    """ Move Virtual Helices around.  The ID numbers are kept as a sorted
+    array while the command is in the undo history.  Consecutive translations
+    of the same virtual helices, as when dragging them, merge into one command
+    """
+
+    __slots__ = ('_part', '_vhelix_set', 'delta')
 
     def __init__(self,  part: NucleicAcidPartT,
                         virtual_helix_set: Set[int],
                         dx: float, dy: float, dz: float):
         super(TranslateVirtualHelicesCommand, self).__init__("translate virtual helices")
         self._part = part
-        self._vhelix_set = virtual_helix_set.copy()
+        self._vhelix_set = np.sort(np.fromiter(virtual_helix_set, dtype=np.int32,
+                                               count=len(virtual_helix_set)))
         self.delta = (dx, dy, dz)
     # end def
 
     def redo(self):
         dx, dy, dz = self.delta
         part = self._part
-        vh_set = self._vhelix_set
+        vh_set = set(self._vhelix_set.tolist())
         part._translateVirtualHelices(vh_set, dx, dy, dz, False)
         self.doSignals(part, vh_set)
     # end def
@@ -32,29 +38,43 @@ class TranslateVirtualHelicesCommand(UndoCommand):
     def undo(self):
         dx, dy, dz = self.delta
         part = self._part
-        vh_set = self._vhelix_set
+        vh_set = set(self._vhelix_set.tolist())
         part._translateVirtualHelices(vh_set, -dx, -dy, -dz, True)
         self.doSignals(part, vh_set)
     # end def
 
     def doSignals(self, part, vh_set):
         vh_list = list(vh_set)
-        z_vals = part.vh_properties.iloc[vh_list, Z_PROP_INDEX]
         if self.delta[2] > 0:
-            if isinstance(z_vals, float):
-                z_vals = (z_vals, )
+            z_vals = part.vh_properties.column('z')[vh_list].tolist()
             for id_num, z_val in zip(vh_list, z_vals):
                 part.partVirtualHelixPropertyChangedSignal.emit(
                     part, id_num, part.getVirtualHelix(id_num), ('z',), (z_val,))
             part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), False)
     # end def
 
+    def id(self) -> int:
+        return CommandIdEnum.TRANSLATE_VIRTUAL_HELICES
+    # end def
+
+    def canMergeWith(self, other: 'TranslateVirtualHelicesCommand') -> bool:
+        return (isinstance(other, TranslateVirtualHelicesCommand) and other._part is self._part and
+                np.array_equal(other._vhelix_set, self._vhelix_set))
+    # end def
+
+    def mergeWith(self, other: 'TranslateVirtualHelicesCommand') -> bool:
+        if not self.canMergeWith(other):
+            return False
+        self.delta = tuple(a + b for a, b in zip(self.delta, other.delta))
+        return True
+    # end def
+
     def specialUndo(self):
         """ does not deselect
         """
         dx, dy, dz = self.delta
         part = self._part
-        vh_set = self._vhelix_set
+        vh_set = set(self._vhelix_set.tolist())
         part._translateVirtualHelices(vh_set, -dx, -dy, -dz, False)
     # end def
 # end class
@@ -21,6 +21,8 @@ class VirtualHelix(CNObject):
     `NucleicAcidPart`.  Having this makes it easier to write views.
     """
 
+    __slots__ = ('_id_num', '_part')
+
     def __init__(self, id_num: int, part: NucleicAcidPartT):
         super(VirtualHelix, self).__init__(part)
         self._id_num = id_num
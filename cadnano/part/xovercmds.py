@@ -4,6 +4,10 @@ import random
 # from cadnano import getBatch
 from cadnano.views.pathview import pathstyles
 from cadnano.proxies.cnproxy import UndoCommand
+from cadnano.oligo.oligomembership import (
+    joinOligos,
+    splitOligo
+)
 from cadnano.strand import Strand
 from cadnano.cntypes import (
     NucleicAcidPartT
@@ -15,8 +19,16 @@ class CreateXoverCommand(UndoCommand):
     1. preserve the old oligo of ``strand3p``
     2. install the crossover
     3. apply the strand5p oligo to the strand3p
+
+    The oligos are joined and split with :func:`joinOligos` and
+    :func:`splitOligo` so undo and redo don't visit the strands of the 3' oligo
     """
 
+    __slots__ = (
+        '_part', '_strand5p', '_strand5p_idx', '_strand3p', '_strand3p_idx', '_old_oligo3p',
+        '_update_oligo', '_union'
+    )
+
     def __init__(self,  part: NucleicAcidPartT,
                         strand5p: Strand, strand5p_idx: int,
                         strand3p: Strand, strand3p_idx: int,
@@ -29,6 +41,7 @@ class CreateXoverCommand(UndoCommand):
         self._strand3p_idx = strand3p_idx
         self._old_oligo3p = strand3p.oligo()
         self._update_oligo = update_oligo
+        self._union = None
     # end def
 
     def redo(self):
@@ -45,7 +58,6 @@ class CreateXoverCommand(UndoCommand):
         doc.removeStrandFromSelection(strand5p)
         doc.removeStrandFromSelection(strand3p)
 
-        fSetOligo = Strand.setOligo
         if self._update_oligo:
             # Test for Loopiness
             if olg5p == strand3p.oligo():
@@ -55,9 +67,8 @@ class CreateXoverCommand(UndoCommand):
                 olg5p._incrementLength(old_olg3p.length(), emit_signals=True)
                 # 2. Remove the old oligo and apply the 5' oligo to the 3' strand
                 old_olg3p.removeFromPart(emit_signals=True)
-                for strand in strand3p.generator3pStrand():
-                    # emits strandHasNewOligoSignal
-                    fSetOligo(strand, olg5p, emit_signals=True)
+                # emits oligoStrandsChangedSignal
+                self._union = joinOligos(olg5p, old_olg3p, emit_signals=True)
 
         # 3. install the Xover
         strand5p.setConnection3p(strand3p)
@@ -94,7 +105,6 @@ class CreateXoverCommand(UndoCommand):
         strand5p.setConnection3p(None)
         strand3p.setConnection5p(None)
 
-        fSetOligo = Strand.setOligo
         if self._update_oligo:
             # Test Loopiness
             if old_olg3p.isCircular():
@@ -104,9 +114,8 @@ class CreateXoverCommand(UndoCommand):
                 olg5p._decrementLength(old_olg3p.length(), emit_signals=True)
                 # 3. apply the old oligo to strand3p
                 old_olg3p.addToPart(part, emit_signals=True)
-                for strand in strand3p.generator3pStrand():
-                    # emits strandHasNewOligoSignal
-                    fSetOligo(strand, old_olg3p, emit_signals=True)
+                splitOligo(self._union, old_olg3p, strand3p, emit_signals=True)
+                self._union = None
 
         if self._update_oligo:
             strand5p.strandConnectionChangedSignal.emit(strand5p)
@@ -123,8 +132,16 @@ class RemoveXoverCommand(UndoCommand):
     2. install the crossover
     3. update the oligo length
     4. apply the new strand3p oligo to the strand3p
+
+    The first redo relabels the strands 3' of the crossover, later undo and
+    redo join and split the oligos like :class:`CreateXoverCommand`
     """
 
+    __slots__ = (
+        '_part', '_strand5p', '_strand5p_idx', '_strand3p', '_strand3p_idx', '_new_oligo3p',
+        '_isCircular', '_union'
+    )
+
     def __init__(self,  part: NucleicAcidPartT,
                         strand5p: Strand, strand3p: Strand):
         super(RemoveXoverCommand, self).__init__("remove xover")
@@ -144,6 +161,7 @@ class RemoveXoverCommand(UndoCommand):
         n_o3p.setStrand5p(strand3p)
 
         self._isCircular = strand3p.oligo().isCircular()
+        self._union = None
     # end def
 
     def redo(self):
@@ -155,8 +173,6 @@ class RemoveXoverCommand(UndoCommand):
         new_olg3p = self._new_oligo3p
         olg5p = self._strand5p.oligo()
 
-        fSetOligo = Strand.setOligo
-
         # 0. Deselect the involved strands
         doc = strand5p.document()
         doc.removeStrandFromSelection(strand5p)
@@ -174,9 +190,8 @@ class RemoveXoverCommand(UndoCommand):
             olg5p._decrementLength(new_olg3p.length(), emit_signals=True)
             # 3. apply the old oligo to strand3p
             new_olg3p.addToPart(part, emit_signals=True)
-            for strand in strand3p.generator3pStrand():
-                # emits strandHasNewOligoSignal
-                fSetOligo(strand, new_olg3p, emit_signals=True)
+            splitOligo(self._union, new_olg3p, strand3p, emit_signals=True)
+            self._union = None
 
         strand5p.strandConnectionChangedSignal.emit(strand5p)
         strand3p.strandConnectionChangedSignal.emit(strand3p)
@@ -191,8 +206,6 @@ class RemoveXoverCommand(UndoCommand):
         olg5p = strand5p.oligo()
         new_olg3p = self._new_oligo3p
 
-        fSetOligo = Strand.setOligo
-
         # 0. Deselect the involved strands
         doc = strand5p.document()
         doc.removeStrandFromSelection(strand5p)
@@ -206,9 +219,8 @@ class RemoveXoverCommand(UndoCommand):
             olg5p._incrementLength(new_olg3p.length(), emit_signals=True)
             # 2. Remove the old oligo and apply the 5' oligo to the 3' strand
             new_olg3p.removeFromPart(emit_signals=True)
-            for strand in strand3p.generator3pStrand():
-                # emits strandHasNewOligoSignal
-                fSetOligo(strand, olg5p, emit_signals=True)
+            # emits oligoStrandsChangedSignal
+            self._union = joinOligos(olg5p, new_olg3p, emit_signals=True)
         # end else
 
         # 3. install the Xover
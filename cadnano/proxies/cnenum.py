@@ -153,6 +153,16 @@ class HandleEnum(IntEnum):
 
 ENUM_NAMES['handle_type'] = enumNames(HandleEnum)
 
+
+class CommandIdEnum(IntEnum):
+    """``QUndoCommand.id`` of the undo commands consecutive pushes of which
+    are merged with ``mergeWith``
+    """
+    NO_MERGE = -1
+    RESIZE_STRAND = 1
+    TRANSLATE_VIRTUAL_HELICES = 2
+    REFRESH_SEGMENTS = 3
+
 # class BreakEnum(IntEnum):
 #     LEFT5PRIME = 0
 #     LEFT3PRIME = 1
@@ -3,6 +3,9 @@ from cadnano.proxies.cnproxy import BaseObject
 
 
 class CNObject(BaseObject):
+    # empty so subclasses with __slots__ have no instance __dict__
+    __slots__ = ()
+
     def __init__(self, parent):
         super(CNObject, self).__init__(parent)
 
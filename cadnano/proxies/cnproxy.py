@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
+import weakref
+from typing import Callable
 
 from cadnano import undocommand, undostack
+from cadnano.proxies import signalqueue
 
 
 class ProxyObject(object):
-    __slots__ = '_parent', '_signals'
+    __slots__ = '_parent', '_signals', '__weakref__'
 
     def __init__(self, parent):
         self._parent = parent
-        self._signals = {}
+        # created on the first connect, most model objects never connect
+        self._signals = None
     # end def
 
     def parent(self):
@@ -22,6 +26,8 @@ class ProxyObject(object):
     def connect(self, sender, bsignal, method):
         def f(x, y): return method(x, *y)
         bsignal.connect(method, sender=sender)
+        if self._signals is None:
+            self._signals = {}
         self._signals[(sender, bsignal, method)] = f
 
     def disconnect(self, sender, bsignal, method):
@@ -30,6 +36,8 @@ class ProxyObject(object):
         del self._signals[(sender, bsignal, method)]
 
     def signals(self):
+        if self._signals is None:
+            self._signals = {}
         return self._signals
     # end def
 
@@ -39,24 +47,269 @@ class ProxyObject(object):
 # end class
 
 
+def _slotRef(slot: Callable, slots: list):
+    """Returns:
+        a ``weakref.WeakMethod`` of a bound method, removed from ``slots``
+        when its object is garbage collected, otherwise ``slot`` itself
+    """
+    if hasattr(slot, '__self__') and hasattr(slot, '__func__'):
+        def dropSlot(ref):
+            try:
+                slots.remove(ref)
+            except ValueError:
+                pass
+        try:
+            return weakref.WeakMethod(slot, dropSlot)
+        except TypeError:
+            # the object is not weak referenceable
+            pass
+    return slot
+# end def
+
+
+def _isSlot(ref, slot: Callable) -> bool:
+    if ref.__class__ is weakref.WeakMethod:
+        return ref() == slot
+    return ref == slot
+# end def
+
+
+def _callSlots(slots: list, args: tuple):
+    for slot in tuple(slots):
+        if slot.__class__ is weakref.WeakMethod:
+            slot = slot()
+            if slot is None:
+                continue
+        slot(*args)
+# end def
+
+
 class DummySignal(object):
+    """Headless stand in for ``pyqtSignal``.
+
+    Declared as a class attribute it is a descriptor, so ``obj.someSignal``
+    is bound to ``obj`` like a Qt bound signal: it emits as ``obj`` and
+    ``obj.someSignal.connect(slot)`` only receives what ``obj`` emits.
+    Connecting to the class attribute receives the emits of every instance,
+    or only those of ``sender`` if given::
+
+        strand.strandResizedSignal.connect(slot)
+        Strand.strandResizedSignal.connect(slot, sender=strand)
+        Strand.strandResizedSignal.connect(slot)
+
+    Bound methods are held with ``weakref.WeakMethod`` and disconnected
+    when their object is garbage collected.  Other slots, such as lambdas
+    and functions, are held strongly as nothing else may keep them alive.
+    The connections of a sender are dropped when it is garbage collected.
+
+    Emitting on a sender when the signal has no connections at all does
+    nothing, outside of :func:`signalqueue.deferSignals`.
+
+    Args:
+        args: argument types, unused
+        name: the name of the signal
+    """
+    __slots__ = ('name', 'argtypes', '_receivers', '_by_sender')
+
+    def __init__(self, *args, **kwargs):
+        name = kwargs.get('name')
+        if name is None:
+            raise ValueError("missing name")
+        self.argtypes = args
+        self.name = name
+        # slots receiving the emits of every sender
+        self._receivers = []
+        # id(sender): (sender reference, slots)
+        self._by_sender = {}
+    # end def
+
+    def __repr__(self) -> str:
+        return '<%s %s>' % (self.__class__.__name__, self.name)
+    # end def
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return BoundSignal(self, obj)
+    # end def
+
+    def connect(self, slot: Callable, sender=None):
+        """Args:
+            slot: called with the emitted arguments
+            sender: optional, only receive the emits of this object
+        """
+        if sender is None:
+            slots = self._receivers
+        else:
+            key = id(sender)
+            entry = self._by_sender.get(key)
+            if entry is None:
+                by_sender = self._by_sender
+
+                def dropSender(_, key=key):
+                    by_sender.pop(key, None)
+                try:
+                    sender_ref = weakref.ref(sender, dropSender)
+                except TypeError:
+                    sender_ref = (lambda: sender)
+                entry = by_sender[key] = (sender_ref, [])
+            slots = entry[1]
+        slots.append(_slotRef(slot, slots))
+    # end def
+
+    def disconnect(self, slot: Callable, sender=None):
+        """Remove a connection made by :meth:`connect`, does nothing if there
+        is none
+        """
+        if sender is None:
+            slots = self._receivers
+        else:
+            entry = self._by_sender.get(id(sender))
+            if entry is None:
+                return
+            slots = entry[1]
+        for i, ref in enumerate(slots):
+            if _isSlot(ref, slot):
+                del slots[i]
+                break
+        if sender is not None and not slots:
+            del self._by_sender[id(sender)]
+    # end def
+
+    def emit(self, *args):
+        """Call the slots connected without a sender
+        """
+        if self._receivers:
+            _callSlots(self._receivers, args)
+    # end def
+
+    def emitNow(self, sender, args: tuple):
+        """Call the slots of ``sender`` and the slots connected without a
+        sender, ignoring :func:`signalqueue.deferSignals`
+        """
+        entry = self._by_sender.get(id(sender))
+        if entry is not None:
+            _callSlots(entry[1], args)
+        if self._receivers:
+            _callSlots(self._receivers, args)
+    # end def
+
+    def receiverCount(self, sender=None) -> int:
+        """Returns:
+            the number of slots connected for ``sender``, or without a sender
+        """
+        if sender is None:
+            return len(self._receivers)
+        return len(self._by_sender.get(id(sender), (None, ()))[1])
+    # end def
+# end class
+
+
+class BoundSignal(object):
+    """A :class:`DummySignal` bound to its sender
+
+    Args:
+        signal: the class attribute
+        sender: the instance
+    """
+    __slots__ = ('signal', 'sender')
+
+    def __init__(self, signal: DummySignal, sender):
+        self.signal = signal
+        self.sender = sender
+    # end def
+
+    def connect(self, slot: Callable):
+        """Receive the emits of the sender, see :meth:`DummySignal.connect`
+        """
+        self.signal.connect(slot, sender=self.sender)
+    # end def
+
+    def disconnect(self, slot: Callable):
+        self.signal.disconnect(slot, sender=self.sender)
+    # end def
+
+    def emit(self, *args):
+        signal = self.signal
+        if signalqueue.active_queue is not None:
+            signalqueue.active_queue.push(signal, self.sender, args)
+        elif signal._receivers or signal._by_sender:
+            signal.emitNow(self.sender, args)
+    # end def
+# end class
+
+
+class QtSignal(object):
+    """``pyqtSignal`` whose emits are queued by
+    :func:`signalqueue.deferSignals`
+
+    The ``pyqtSignal`` is added to the class as ``_qt_<attribute name>`` with
+    the Qt name ``name``.  Outside of :func:`signalqueue.deferSignals` looking
+    up the signal on an instance returns the ``pyqtBoundSignal`` itself.
+
+    Args:
+        args: argument types
+        name: the name of the signal
+    """
+    __slots__ = ('name', 'argtypes', 'qt_attr')
+
     def __init__(self, *args, **kwargs):
         name = kwargs.get('name')
         if name is None:
             raise ValueError("missing name")
-        self.targets = set()
         self.argtypes = args
         self.name = name
+        self.qt_attr = None
+    # end def
+
+    def __set_name__(self, owner: type, attr: str):
+        from PyQt5.QtCore import pyqtSignal
+        self.qt_attr = '_qt_' + attr
+        setattr(owner, self.qt_attr, pyqtSignal(*self.argtypes, name=self.name))
+    # end def
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if signalqueue.active_queue is None:
+            return getattr(obj, self.qt_attr)
+        return DeferredQtSignal(self, obj)
+    # end def
+
+    def emitNow(self, sender, args: tuple):
+        getattr(sender, self.qt_attr).emit(*args)
+    # end def
+# end class
 
-    def connect(self, target):
-        self.targets.add(target)
 
-    def disconnect(self, target):
-        self.targets.remove(target)
+class DeferredQtSignal(object):
+    """A :class:`QtSignal` bound to its sender while signals are deferred
+
+    Args:
+        signal: the class attribute
+        sender: the instance
+    """
+    __slots__ = ('signal', 'sender')
+
+    def __init__(self, signal: QtSignal, sender):
+        self.signal = signal
+        self.sender = sender
+    # end def
+
+    def connect(self, slot: Callable):
+        getattr(self.sender, self.signal.qt_attr).connect(slot)
+    # end def
+
+    def disconnect(self, slot: Callable):
+        getattr(self.sender, self.signal.qt_attr).disconnect(slot)
+    # end def
 
     def emit(self, *args):
-        for t in self.targets:
-            t(*args)
+        if signalqueue.active_queue is not None:
+            signalqueue.active_queue.push(self.signal, self.sender, args)
+        else:
+            self.signal.emitNow(self.sender, args)
+    # end def
 # end class
 
 
@@ -25,11 +25,21 @@ def proxyConfigure(signal_type=None):
         cadnano.app = cnp.app
 
     elif signal_type == "PyQt":
-        from PyQt5.QtCore import QObject, pyqtSignal
+        from PyQt5.QtCore import QObject
         from PyQt5.QtWidgets import QUndoCommand, QUndoStack
-        cnp.ProxySignal = pyqtSignal
+        from cadnano import sessionrecorder
+
+        class UndoCommand(QUndoCommand):
+            # reports the creation arguments to the session recorder
+            def __new__(cls, *args, **kwargs):
+                self = super(UndoCommand, cls).__new__(cls)
+                if sessionrecorder.active_recorder is not None:
+                    sessionrecorder.active_recorder.commandCreated(self, args, kwargs)
+                return self
+
+        cnp.ProxySignal = cnp.QtSignal
         cnp.BaseObject = QObject
-        cnp.UndoCommand = QUndoCommand
+        cnp.UndoCommand = UndoCommand
         cnp.UndoStack = QUndoStack
     else:
         cnp.ProxySignal = cnp.DummySignal
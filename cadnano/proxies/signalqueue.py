@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Defer and coalesce the signals emitted by bulk model edits
+
+Inside ``with deferSignals():`` the emits of the proxy signals,
+:class:`cnproxy.DummySignal` headless and :class:`cnproxy.QtSignal` with
+PyQt, are queued in a :class:`SignalQueue` instead of calling their slots.
+The queue is flushed when the outermost ``with`` block exits.
+
+Emits of the same signal of the same sender with the same key are coalesced
+into one with the arguments and the position of the last emit.  The key is
+every argument, except for the signals of ``KEY_ARGS`` that carry a value,
+where it is only the leading arguments naming the value.
+
+The ``IMMEDIATE`` signals adding or removing objects are not deferred, as the
+views query the model when they create or destroy their items.  Those
+removing an object discard what was queued for it.  A block can make more
+signals immediate, such as ``PART_STATE`` while a file is decoded.
+"""
+from contextlib import contextmanager
+
+KEY_ARGS = {
+    'partPropertyChangedSignal': 2,                 # self, property_name
+    'partDocumentSettingChangedSignal': 2,          # self, key
+    'partInstancePropertySignal': 3,                # self, view, key
+    'partSelectedChangedSignal': 1,
+    'partActiveChangedSignal': 1,
+    'partZDimensionsChangedSignal': 1,
+    'partActiveVirtualHelixChangedSignal': 1,
+    'partActiveBaseInfoSignal': 1,
+    'partVirtualHelixResizedSignal': 2,             # self, id_num
+    'partVirtualHelixPropertyChangedSignal': 4,     # self, id_num, virtual_helix, keys
+    'oligoPropertyChangedSignal': 2,                # self, property_name
+    'oligoSelectedChangedSignal': 1,
+    'strandResizedSignal': 1,
+    'strandSelectedChangedSignal': 1,
+}
+
+IMMEDIATE = frozenset((
+    'documentPartAddedSignal',
+    'documentAssemblyAddedSignal',
+    'documentModAddedSignal',
+    'documentModRemovedSignal',
+    'documentViewResetSignal',
+    'documentClearSelectionsSignal',
+    'partInstanceAddedSignal',
+    'partRemovedSignal',
+    'partVirtualHelixAddedSignal',
+    'partVirtualHelicesAddedSignal',
+    'partVirtualHelixRemovingSignal',
+    'partVirtualHelixRemovedSignal',
+    'partOligoAddedSignal',
+    'oligoRemovedSignal',
+    'strandsetStrandAddedSignal',
+    'strandRemovedSignal',
+    'assemblyInstanceAddedSignal',
+    'assemblyDestroyedSignal',
+    'instanceDestroyedSignal',
+))
+
+PART_STATE = frozenset((
+    'partActiveChangedSignal',
+    'partPropertyChangedSignal',
+    'partSelectedChangedSignal',
+    'partDocumentSettingChangedSignal',
+    'partInstancePropertySignal',
+))
+"""signals of the state of a part that the views read when they create their
+items and write back when an item changes.  Deferred, they reach items
+created after the emit, which then push the stale values as commands"""
+
+SENDER_REMOVED = frozenset((
+    'partRemovedSignal',
+    'oligoRemovedSignal',
+    'strandRemovedSignal',
+    'assemblyDestroyedSignal',
+    'instanceDestroyedSignal',
+))
+"""signals of a sender being removed"""
+
+VIRTUAL_HELIX_SIGNALS = frozenset((
+    'partActiveVirtualHelixChangedSignal',
+    'partStrandChangedSignal',
+    'partVirtualHelixResizedSignal',
+    'partVirtualHelixPropertyChangedSignal',
+))
+"""part signals with the ``id_num`` of a virtual helix as second argument,
+discarded by the ``partVirtualHelixRemovingSignal`` of their ``id_num``"""
+
+active_queue = None
+"""the :class:`SignalQueue` of the open :func:`deferSignals` or ``None``"""
+
+
+class SignalQueue(object):
+    """Coalesced signal emits in the order they are flushed
+    """
+    __slots__ = ('_emits', '_keys_by_sender', 'emit_count', 'immediate')
+
+    def __init__(self, immediate: frozenset = frozenset()):
+        # key: (signal, sender, args), ordered by the last emit
+        self._emits = {}
+        # id(sender): keys of the sender in _emits
+        self._keys_by_sender = {}
+        # number of emits pushed, coalesced or not
+        self.emit_count = 0
+        # names emitted immediately besides IMMEDIATE
+        self.immediate = immediate
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._emits)
+    # end def
+
+    def push(self, signal, sender, args: tuple):
+        """Queue an emit, or emit it now if it is ``IMMEDIATE`` or in
+        :attr:`immediate`
+
+        Args:
+            signal: the class attribute, with a ``name`` and an
+                ``emitNow(sender, args)`` method
+            sender: the instance the signal is emitted by
+            args: the emitted arguments
+        """
+        self.emit_count += 1
+        name = signal.name
+        sender_id = id(sender)
+        if name in IMMEDIATE or name in self.immediate:
+            if name in SENDER_REMOVED:
+                self._discard(sender_id, lambda key: True)
+            elif name == 'partVirtualHelixRemovingSignal':
+                id_num = args[1]
+                self._discard(sender_id, lambda key: (key[1] in VIRTUAL_HELIX_SIGNALS and
+                                                      self._emits[key][2][1] == id_num))
+            signal.emitNow(sender, args)
+            return
+        key_len = KEY_ARGS.get(name)
+        key = (sender_id, name, args if key_len is None else args[:key_len])
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable arguments are never coalesced
+            key = (sender_id, name, self.emit_count)
+        emits = self._emits
+        if emits.pop(key, None) is None:
+            self._keys_by_sender.setdefault(sender_id, []).append(key)
+        # (re)inserted last, with the arguments of the last emit
+        emits[key] = (signal, sender, args)
+    # end def
+
+    def _discard(self, sender_id: int, condition):
+        """Remove the queued emits of a sender for which ``condition(key)``
+        """
+        sender_keys = self._keys_by_sender.get(sender_id)
+        if not sender_keys:
+            return
+        kept = []
+        for key in sender_keys:
+            if condition(key):
+                del self._emits[key]
+            else:
+                kept.append(key)
+        self._keys_by_sender[sender_id] = kept
+    # end def
+
+    def flush(self):
+        """Emit the queued signals and empty the queue
+        """
+        emits = self._emits
+        self._emits = {}
+        self._keys_by_sender = {}
+        for signal, sender, args in emits.values():
+            signal.emitNow(sender, args)
+    # end def
+# end class
+
+
+@contextmanager
+def deferSignals(immediate: frozenset = frozenset()):
+    """Queue the signals emitted in the ``with`` block and emit them, coalesced,
+    when the outermost block exits, whether or not it raised
+
+    Args:
+        immediate: names of signals to emit immediately inside the block,
+            besides ``IMMEDIATE``
+
+    Yields:
+        the active :class:`SignalQueue`
+    """
+    global active_queue
+    if active_queue is not None:
+        outer_immediate = active_queue.immediate
+        active_queue.immediate = outer_immediate | immediate
+        try:
+            yield active_queue
+        finally:
+            active_queue.immediate = outer_immediate
+        return
+    queue = active_queue = SignalQueue(frozenset(immediate))
+    try:
+        yield queue
+    finally:
+        active_queue = None
+        queue.flush()
+# end def
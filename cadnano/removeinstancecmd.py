@@ -14,6 +14,8 @@ class RemoveInstanceCommand(UndoCommand):
         obj_instance: Object instance remove
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self,  cnobj: CNObject,
                         obj_instance: ObjectInstance):
         super(RemoveInstanceCommand, self).__init__("remove instance")
@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+"""Record the undo commands of an editing session and replay them headless
+
+While a :class:`SessionRecorder` is active, every :class:`UndoCommand` pushed
+on the undo stack or executed with :func:`util.doCmd`,
+:func:`util.execCommandList` or :func:`util.finalizeCommands` is logged with
+its class, the arguments it was created with and the seconds it took, along
+with the macros, undos and redos of the headless :class:`UndoStack`.
+
+The log is a JSON lines file, gzip compressed if its name ends with ``.gz``.
+Model objects in the arguments are logged by where they are in the design,
+for instance a strand by its part, virtual helix, direction and low index,
+so :func:`replaySession` can run the session again on the starting design
+decoded anew and time every command::
+
+    python -m cadnano.bin.replaysession design.json session.jsonl.gz
+
+Commands executed by other commands are not logged, they are executed again
+by the replay.  With PyQt the ``QUndoStack`` macros, undos and redos, and the
+commands pushed on it directly, are not logged.
+"""
+import gzip
+import importlib
+import io
+import json
+import time
+from contextlib import (
+    contextmanager,
+    nullcontext
+)
+from typing import (
+    Callable,
+    Iterator,
+    List
+)
+
+from cadnano.cntypes import (
+    DocT
+)
+
+FORMAT_VERSION = 1
+
+active_recorder = None
+"""the active :class:`SessionRecorder` or ``None``"""
+
+
+class UnrecordableError(TypeError):
+    """An argument of a command can't be logged or resolved"""
+
+
+def _modelTypes() -> dict:
+    # imported when first needed, the model imports the undo stack
+    from cadnano.document import Document
+    from cadnano.objectinstance import ObjectInstance
+    from cadnano.oligo import Oligo
+    from cadnano.part.nucleicacidpart import NucleicAcidPart
+    from cadnano.part.virtualhelix import VirtualHelix
+    from cadnano.strand import Strand
+    from cadnano.strandset import StrandSet
+    return {'Document': Document, 'ObjectInstance': ObjectInstance, 'Oligo': Oligo,
+            'NucleicAcidPart': NucleicAcidPart, 'VirtualHelix': VirtualHelix,
+            'Strand': Strand, 'StrandSet': StrandSet}
+# end def
+
+
+def _openLog(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return io.open(path, mode, encoding='utf-8')
+# end def
+
+
+def _qualifiedName(cls: type) -> str:
+    return cls.__module__ + '.' + cls.__qualname__
+# end def
+
+
+def _classFromName(name: str) -> type:
+    module_name, _, qualname = name.rpartition('.')
+    return getattr(importlib.import_module(module_name), qualname)
+# end def
+
+
+class SessionRecorder(object):
+    """Log the commands of a session on ``document`` to ``path``
+
+    Args:
+        document: the document edited
+        path: the log file, overwritten
+    """
+
+    def __init__(self, document: DocT, path: str):
+        self.document = document
+        self.path = path
+        self._file = None
+        self._types = None
+        self._depth = 0
+        self._start = None
+        # id(command): (class name, encoded args or None, error) of the
+        # created commands not logged yet
+        self._created = {}
+        self.count = 0
+    # end def
+
+    def start(self):
+        """Open the log, write the parts of the starting design and record
+
+        Raises:
+            RuntimeError: another recorder is active
+        """
+        global active_recorder
+        if active_recorder is not None:
+            raise RuntimeError("a session is already being recorded")
+        self._types = _modelTypes()
+        self._file = _openLog(self.path, 'w')
+        parts = [[part.uuid, part.getName()] for part in self.document.getParts()]
+        self._write({'cadnano_session': FORMAT_VERSION, 'parts': parts})
+        self._start = time.perf_counter()
+        active_recorder = self
+    # end def
+
+    def stop(self):
+        """Stop recording and close the log
+        """
+        global active_recorder
+        if active_recorder is self:
+            active_recorder = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._created.clear()
+    # end def
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry, separators=(',', ':')))
+        self._file.write('\n')
+    # end def
+
+    def commandCreated(self, undocommand, args: tuple, kwargs: dict):
+        """Called by ``UndoCommand.__new__`` with the creation arguments
+        """
+        if self._depth > 0:
+            return
+        created = self._created
+        if len(created) > 100000:
+            # commands that were never pushed
+            created.clear()
+        try:
+            encoded = [self.encode(list(args)), {key: self.encode(value) for key, value in kwargs.items()}]
+            error = None
+        except UnrecordableError as e:
+            encoded, error = None, str(e)
+        created[id(undocommand)] = (_qualifiedName(type(undocommand)), encoded, error)
+    # end def
+
+    @contextmanager
+    def record(self, op: str, undocommand=None, name: str = None):
+        """Log what the ``with`` block executes, unless it is executed by
+        an operation already being logged
+
+        Args:
+            op: ``'push'``, ``'exec'`` for a command executed without the undo
+                stack, ``'begin'`` and ``'end'`` of a macro, ``'undo'`` or
+                ``'redo'``
+            undocommand: the command pushed or executed
+            name: the name of the macro begun
+        """
+        if self._depth > 0:
+            yield
+            return
+        entry = {'op': op, 'at': round(time.perf_counter() - self._start, 6)}
+        if undocommand is not None:
+            cls_name, encoded, error = self._created.pop(
+                id(undocommand), (_qualifiedName(type(undocommand)), None, "created before recording"))
+            entry['cmd'] = cls_name
+            entry['args'] = encoded
+            if error is not None:
+                entry['error'] = error
+        if name is not None:
+            entry['name'] = name
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry['t'] = round(time.perf_counter() - start, 7)
+            self._write(entry)
+            self.count += 1
+    # end def
+
+    def encode(self, value):
+        """Returns:
+            ``value`` as JSON, model objects as their place in the design
+
+        Raises:
+            UnrecordableError: ``value`` holds an object that can't be logged
+        """
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, (int, float)):
+            # also the IntEnums
+            return value if type(value) in (int, float) else value.real
+        if isinstance(value, list):
+            return [self.encode(x) for x in value]
+        if isinstance(value, tuple):
+            return {'$tuple': [self.encode(x) for x in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'$set': [self.encode(x) for x in value]}
+        if isinstance(value, dict):
+            return {'$dict': [[self.encode(k), self.encode(v)] for k, v in value.items()]}
+        if hasattr(value, 'tolist'):
+            # numpy arrays and scalars
+            return self.encode(value.tolist())
+        return self._encodeModel(value)
+    # end def
+
+    def _encodeModel(self, obj):
+        types = self._types
+        if isinstance(obj, types['Strand']):
+            strandset = obj.strandSet()
+            idx_low = obj.idxs()[0]
+            if strandset.getStrand(idx_low) is not obj:
+                raise UnrecordableError("strand %s is not in its strandset" % (obj,))
+            return {'$strand': [obj.part().uuid, obj.idNum(), obj.isForward(), idx_low]}
+        if isinstance(obj, types['Oligo']):
+            return {'$oligo': self._encodeModel(obj.strand5p())}
+        if isinstance(obj, types['StrandSet']):
+            return {'$strandset': [obj.part().uuid, obj.idNum(), obj.isForward()]}
+        if isinstance(obj, types['VirtualHelix']):
+            return {'$vh': [obj.part().uuid, obj.idNum()]}
+        if isinstance(obj, types['NucleicAcidPart']):
+            if obj in self.document.children():
+                return {'$part': obj.uuid}
+            return {'$newpart': [_qualifiedName(type(obj)), obj.uuid,
+                                 obj.getProperty('grid_type').real, obj.getProperty('is_lattice')]}
+        if isinstance(obj, types['ObjectInstance']):
+            return {'$instance': self._encodeModel(obj.reference())}
+        if isinstance(obj, types['Document']):
+            if obj is not self.document:
+                raise UnrecordableError("another document")
+            return {'$doc': 0}
+        raise UnrecordableError("can't record %s" % type(obj).__name__)
+    # end def
+# end class
+
+
+_NOT_RECORDING = nullcontext()
+
+
+def recording(op: str, undocommand=None, name: str = None):
+    """Returns:
+        :meth:`SessionRecorder.record` of the active recorder, or a context
+        doing nothing
+    """
+    if active_recorder is None:
+        return _NOT_RECORDING
+    return active_recorder.record(op, undocommand, name)
+# end def
+
+
+@contextmanager
+def recordSession(document: DocT, path: str) -> Iterator[SessionRecorder]:
+    """Record the session in the ``with`` block
+
+    Args:
+        document: the document edited
+        path: the log file
+
+    Yields:
+        the :class:`SessionRecorder`
+    """
+    recorder = SessionRecorder(document, path)
+    recorder.start()
+    try:
+        yield recorder
+    finally:
+        recorder.stop()
+# end def
+
+
+def readSession(path: str) -> Iterator[dict]:
+    """Yields:
+        the header and then the entries of the log ``path``
+    """
+    with _openLog(path, 'r') as fd:
+        for line in fd:
+            if line.strip():
+                yield json.loads(line)
+# end def
+
+
+class _Resolver(object):
+    """Finds in the replayed document the model objects of a log
+    """
+
+    def __init__(self, document: DocT, recorded_parts: list):
+        self.document = document
+        self.parts = {}
+        parts = list(document.getParts())
+        by_name = {}
+        for part in parts:
+            by_name.setdefault(part.getName(), []).append(part)
+        for uuid, name in recorded_parts:
+            if len(by_name.get(name, ())) == 1:
+                self.parts[uuid] = by_name[name][0]
+            elif len(recorded_parts) == len(parts) == 1:
+                self.parts[uuid] = parts[0]
+    # end def
+
+    def part(self, uuid: str):
+        part = self.parts.get(uuid)
+        if part is None:
+            known = set(self.parts.values())
+            new_parts = [p for p in self.document.getParts() if p not in known]
+            if len(new_parts) != 1:
+                raise UnrecordableError("can't find part %s" % uuid)
+            part = self.parts[uuid] = new_parts[0]
+        return part
+    # end def
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(x) for x in value]
+        if not isinstance(value, dict):
+            return value
+        (key, item), = value.items()
+        if key == '$tuple':
+            return tuple(self.decode(x) for x in item)
+        if key == '$set':
+            return set(self.decode(x) for x in item)
+        if key == '$dict':
+            return {self.decode(k): self.decode(v) for k, v in item}
+        if key == '$strand':
+            uuid, id_num, is_fwd, idx_low = item
+            strand = self.strandSet(uuid, id_num, is_fwd).getStrand(idx_low)
+            if strand is None:
+                raise UnrecordableError("no strand at %s" % (item,))
+            return strand
+        if key == '$oligo':
+            return self.decode(item).oligo()
+        if key == '$strandset':
+            return self.strandSet(*item)
+        if key == '$vh':
+            return self.part(item[0]).getVirtualHelix(item[1])
+        if key == '$part':
+            return self.part(item)
+        if key == '$newpart':
+            cls_name, uuid, grid_type, is_lattice = item
+            part = _classFromName(cls_name)(document=self.document, uuid=uuid,
+                                            grid_type=grid_type, is_lattice=is_lattice)
+            self.parts[uuid] = part
+            return part
+        if key == '$instance':
+            return next(iter(self.decode(item).instances()))
+        if key == '$doc':
+            return self.document
+        raise UnrecordableError("unknown %s" % key)
+    # end def
+
+    def strandSet(self, uuid: str, id_num: int, is_fwd: bool):
+        fwd_ss, rev_ss = self.part(uuid).getStrandSets(id_num)
+        return fwd_ss if is_fwd else rev_ss
+    # end def
+# end class
+
+
+def replaySession(document: DocT, path: str,
+                  callback: Callable[[dict, float], None] = None) -> List[float]:
+    """Execute the commands of the log ``path`` on ``document``, the starting
+    design of the session decoded anew
+
+    Args:
+        document: the document
+        path: the log file
+        callback: called with every entry and the seconds it took to replay
+
+    Returns:
+        the seconds every entry took to replay
+
+    Raises:
+        UnrecordableError: an entry could not be logged or replayed
+    """
+    entries = readSession(path)
+    header = next(entries)
+    if header.get('cadnano_session') != FORMAT_VERSION:
+        raise ValueError("%s is not a cadnano session log" % path)
+    resolver = _Resolver(document, header['parts'])
+    us = document.undoStack()
+    timings = []
+    for entry in entries:
+        op = entry['op']
+        if op in ('push', 'exec'):
+            if entry['args'] is None:
+                raise UnrecordableError("%s: %s" % (entry['cmd'], entry.get('error')))
+            args, kwargs = entry['args']
+            args = resolver.decode(args)
+            kwargs = {key: resolver.decode(value) for key, value in kwargs.items()}
+            undocommand = _classFromName(entry['cmd'])(*args, **kwargs)
+        # timed like the recording, without creating the command
+        start = time.perf_counter()
+        if op in ('push', 'exec'):
+            if op == 'push':
+                us.push(undocommand)
+            else:
+                undocommand.redo()
+        elif op == 'begin':
+            us.beginMacro(entry.get('name'))
+        elif op == 'end':
+            us.endMacro()
+        elif op == 'undo':
+            us.undo()
+        elif op == 'redo':
+            us.redo()
+        seconds = time.perf_counter() - start
+        timings.append(seconds)
+        if callback is not None:
+            callback(entry, seconds)
+    return timings
+# end def
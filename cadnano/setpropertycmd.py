@@ -17,6 +17,8 @@ class SetPropertyCommand(UndoCommand):
         value (any): new value
     """
 
+    __slots__ = ('_objs', '_key', '_value', '_old_values')
+
     def __init__(self, objs: Iterable, key: str, value: Any):
         super(SetPropertyCommand, self).__init__("change property")
         self._objs = objs
@@ -50,6 +52,8 @@ class SetVHPropertyCommand(UndoCommand):
         value (any): new value
     """
 
+    __slots__ = ('_part', '_id_nums', '_keys', '_values', '_safe', '_old_values')
+
     def __init__(self, part, id_nums, keys, values, safe):
         super(SetVHPropertyCommand, self).__init__("change VirtualHelix property")
         self._part = part
@@ -6,6 +6,9 @@ from cadnano.cntypes import (
 )
 
 class AddInsertionCommand(UndoCommand):
+    __slots__ = ('_strand', '_insertions', '_idx', '_length', '_insertion', '_comp_strand')
+    _shared_slots = ('_insertions',)
+
     def __init__(self, strand: StrandT, idx: int, length: int):
         super(AddInsertionCommand, self).__init__("add insertion")
         self._strand = strand
@@ -23,6 +26,7 @@ class AddInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertion
         self._insertions[self._idx] = inst
+        strand._touchOligos(c_strand)
         strand.oligo()._incrementLength(inst.length(), emit_signals=True)
         strand.strandInsertionAddedSignal.emit(strand, inst)
         if c_strand:
@@ -39,6 +43,7 @@ class AddInsertionCommand(UndoCommand):
             c_strand.oligo()._decrementLength(inst.length(), emit_signals=True)
         idx = self._idx
         del self._insertions[idx]
+        strand._touchOligos(c_strand)
         strand.strandInsertionRemovedSignal.emit(strand, idx)
         if c_strand:
             c_strand.strandInsertionRemovedSignal.emit(c_strand, idx)
@@ -47,6 +52,9 @@ class AddInsertionCommand(UndoCommand):
 
 
 class RemoveInsertionCommand(UndoCommand):
+    __slots__ = ('_strand', '_idx', '_insertions', '_insertion', '_comp_strand')
+    _shared_slots = ('_insertions',)
+
     def __init__(self, strand, idx):
         super(RemoveInsertionCommand, self).__init__("remove insertion")
         self._strand = strand
@@ -67,6 +75,7 @@ class RemoveInsertionCommand(UndoCommand):
             c_strand.oligo()._decrementLength(inst.length(), emit_signals=True)
         idx = self._idx
         del self._insertions[idx]
+        strand._touchOligos(c_strand)
         strand.strandInsertionRemovedSignal.emit(strand, idx)
         if c_strand:
             c_strand.strandInsertionRemovedSignal.emit(c_strand, idx)
@@ -78,6 +87,7 @@ class RemoveInsertionCommand(UndoCommand):
         inst = self._insertion
         strand.oligo()._incrementLength(inst.length(), emit_signals=True)
         self._insertions[self._idx] = inst
+        strand._touchOligos(c_strand)
         strand.strandInsertionAddedSignal.emit(strand, inst)
         if c_strand:
             c_strand.oligo()._incrementLength(inst.length(), emit_signals=True)
@@ -93,6 +103,9 @@ class ChangeInsertionCommand(UndoCommand):
     is required and call RemoveInsertionCommand
     """
 
+    __slots__ = ('_strand', '_insertions', '_idx', '_new_length', '_old_length', '_comp_strand')
+    _shared_slots = ('_insertions',)
+
     def __init__(self, strand, idx, new_length):
         super(ChangeInsertionCommand, self).__init__("change insertion")
         self._strand = strand
@@ -110,6 +123,7 @@ class ChangeInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
         inst.setLength(self._new_length)
+        strand._touchOligos(c_strand)
         strand.oligo()._incrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -125,6 +139,7 @@ class ChangeInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
         inst.setLength(self._old_length)
+        strand._touchOligos(c_strand)
         strand.oligo()._decrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -5,6 +5,8 @@ from cadnano.cntypes import (
 )
 
 class AddModsCommand(UndoCommand):
+    __slots__ = ('_strand', '_id_num', '_idx', '_mod_id', 'document')
+
     def __init__(self, document: DocT, strand: StrandT, idx: int, mod_id: str):
         super(AddModsCommand, self).__init__()
         self._strand = strand
@@ -35,6 +37,8 @@ class AddModsCommand(UndoCommand):
 
 
 class RemoveModsCommand(UndoCommand):
+    __slots__ = ('_strand', '_id_num', '_idx', '_mod_id', 'document')
+
     def __init__(self, document, strand, idx, mod_id):
         super(RemoveModsCommand, self).__init__()
         self._strand = strand
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from cadnano.proxies.cnenum import CommandIdEnum
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     StrandT,
@@ -6,9 +7,15 @@ from cadnano.cntypes import (
 )
 
 class ResizeCommand(UndoCommand):
+    """Consecutive resizes of a strand made with ``merge``, the steps of an
+    endpoint drag, merge into one command
+    """
+    __slots__ = ('strand', 'old_indices', 'new_idxs', 'delta', 'update_segments', 'merge')
+
     def __init__(self, strand: StrandT,
                         new_idxs: SegmentT,
-                        update_segments: bool = True):
+                        update_segments: bool = True,
+                        merge: bool = False):
         super(ResizeCommand, self).__init__("resize strand")
         self.strand = strand
         self.old_indices = o_i = strand.idxs()
@@ -27,6 +34,7 @@ class ResizeCommand(UndoCommand):
         self.delta += (n_l - o_l)
 
         self.update_segments = update_segments
+        self.merge = merge
         # the strand sequence will need to be regenerated from scratch
         # as there are no guarantees about the entirety of the strand moving
         # thanks to multiple selections
@@ -53,6 +61,26 @@ class ResizeCommand(UndoCommand):
             std5p.strandResizedSignal.emit(std5p, std5p.idxs())
     # end def
 
+    def id(self) -> int:
+        if self.merge:
+            return CommandIdEnum.RESIZE_STRAND
+        return CommandIdEnum.NO_MERGE
+    # end def
+
+    def canMergeWith(self, other: 'ResizeCommand') -> bool:
+        return (self.merge and isinstance(other, ResizeCommand) and other.merge and
+                other.strand is self.strand and other.old_indices == self.new_idxs)
+    # end def
+
+    def mergeWith(self, other: 'ResizeCommand') -> bool:
+        if not self.canMergeWith(other):
+            return False
+        self.new_idxs = other.new_idxs
+        self.delta += other.delta
+        self.update_segments = self.update_segments or other.update_segments
+        return True
+    # end def
+
     def undo(self):
         std = self.strand
         n_i = self.new_idxs
@@ -57,7 +57,9 @@ class Strand(CNObject):
     to the 5' and 3' phosphate linkages in the physical DNA strand,
     respectively. Since Strands can point 5'-to-3' in either the low-to-high
     or high-to-low directions, connection accessor methods (connectionLow and
-    connectionHigh) are bound during the init for convenience.
+    connectionHigh) map to the 5' or 3' connection by the strand direction.
+
+    Strands are numerous, so they store their state in ``__slots__``.
 
     Args:
         strandset (StrandSet):
@@ -67,6 +69,12 @@ class Strand(CNObject):
 
     """
 
+    __slots__ = (
+        '_document', '_strandset', '_id_num', '_base_idx_low', '_base_idx_high',
+        '_oligo_node', '_strand5p', '_strand3p', '_sequence', 'segments',
+        'abstract_sequence', '_is_forward'
+    )
+
     def __init__(self,  strandset: StrandSetT,
                         base_idx_low: int, base_idx_high: int,
                         oligo: OligoT = None):
@@ -80,32 +88,14 @@ class Strand(CNObject):
 
         self._base_idx_low = base_idx_low  # base index of the strand's left bound
         self._base_idx_high = base_idx_high  # base index of the right bound
-        self._oligo = oligo
+        self._oligo_node = None if oligo is None else oligo._node
         self._strand5p = None  # 5' connection to another strand
         self._strand3p = None  # 3' connection to another strand
         self._sequence = None
 
         self.segments = []
         self.abstract_sequence = []
-
-        # dynamic methods for mapping high/low connection /indices
-        # to corresponding 3Prime 5Prime
-        is_forward = strandset.isForward()
-        if is_forward:
-            self.idx5Prime = self.lowIdx
-            self.idx3Prime = self.highIdx
-            self.connectionLow = self.connection5p
-            self.connectionHigh = self.connection3p
-            self.setConnectionLow = self.setConnection5p
-            self.setConnectionHigh = self.setConnection3p
-        else:
-            self.idx5Prime = self.highIdx
-            self.idx3Prime = self.lowIdx
-            self.connectionLow = self.connection3p
-            self.connectionHigh = self.connection5p
-            self.setConnectionLow = self.setConnection3p
-            self.setConnectionHigh = self.setConnection5p
-        self._is_forward = is_forward
+        self._is_forward = strandset.isForward()
     # end def
 
     def __repr__(self) -> str:
@@ -210,11 +200,16 @@ class Strand(CNObject):
     # end def
 
     def oligo(self) -> OligoT:
-        return self._oligo
+        node = self._oligo_node
+        if node is None:
+            return None
+        if node.parent is not None:
+            node = node.find()
+        return node.oligo
     # end def
 
     def getColor(self) -> str:
-        return self._oligo.getColor()
+        return self.oligo().getColor()
     # end def
 
     def sequence(self, for_export: bool = False) -> str:
@@ -251,6 +246,7 @@ class Strand(CNObject):
 
                 (used, unused)
         """
+        self._touchOligos()
         if sequence is None:
             self._sequence = None
             return None, None
@@ -273,6 +269,7 @@ class Strand(CNObject):
         # i.e. both endpoints thanks to multiple selections so just redo the
         # whole thing
         self._sequence = None
+        self._touchOligos()
 
         for comp_strand in comp_ss.getOverlappingStrands(self._base_idx_low,
                                                          self._base_idx_high):
@@ -357,6 +354,7 @@ class Strand(CNObject):
         # if len(self._sequence.strip()) == 0:
         if not self._sequence:
             self._sequence = None
+        self._touchOligos()
 
         # print("new sequence", self._sequence)
         return self._sequence
@@ -393,6 +391,7 @@ class Strand(CNObject):
         abstract_seq = self.abstract_sequence
         # self._sequence = ''.join([ascii_letters[i % 52] for i in abstract_seq])
         self._sequence = ''.join(['|' for i in abstract_seq])
+        self._touchOligos()
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -404,6 +403,14 @@ class Strand(CNObject):
         return self._strand5p
     # end def
 
+    def connectionLow(self) -> StrandT:
+        return self._strand5p if self._is_forward else self._strand3p
+    # end def
+
+    def connectionHigh(self) -> StrandT:
+        return self._strand3p if self._is_forward else self._strand5p
+    # end def
+
     def idxs(self) -> SegmentT:
         return (self._base_idx_low, self._base_idx_high)
     # end def
@@ -416,17 +423,17 @@ class Strand(CNObject):
         return self._base_idx_high
     # end def
 
-    def idx3Prime(self):
+    def idx3Prime(self) -> int:
         """Returns the absolute base_idx of the 3' end of the strand.
-        overloaded in __init__
         """
-        # return self.idx3Prime
+        return self._base_idx_high if self._is_forward else self._base_idx_low
+    # end def
 
-    def idx5Prime(self):
+    def idx5Prime(self) -> int:
         """Returns the absolute base_idx of the 5' end of the strand.
-        overloaded in __init__
         """
-        # return self.idx5Prime
+        return self._base_idx_low if self._is_forward else self._base_idx_high
+    # end def
 
     def dump5p(self) -> Tuple[int, bool, int]:
         return self._id_num, self._is_forward, self.idx5Prime()
@@ -822,33 +829,109 @@ class Strand(CNObject):
 
     def resize(self, new_idxs: SegmentT,
                     use_undostack: bool = True,
-                    update_segments: bool = True):
+                    update_segments: bool = True,
+                    merge: bool = False):
+        """Args:
+            new_idxs: the new low and high indices
+            use_undostack: optional, default is ``True``
+            update_segments: optional, default is ``True``
+            merge: optional, merge with the previous resize of this strand,
+                for the steps of a drag. Default is ``False``
+        """
         cmds = []
 
         # Delete sequences and remove inserations upon resize
-        cmds.append(self.oligo().applySequenceCMD(None))
+        if self._hasSequenceToClear():
+            cmds.append(self.oligo().applySequenceCMD(None))
         cmds += self.getRemoveInsertionCommands(new_idxs)
 
-        cmds.append(ResizeCommand(self, new_idxs, update_segments=update_segments))
-        util.execCommandList(self, cmds, desc="Resize strand",
-                             use_undostack=use_undostack)
+        c = ResizeCommand(self, new_idxs, update_segments=update_segments, merge=merge)
+        if cmds:
+            cmds.append(c)
+            util.execCommandList(self, cmds, desc="Resize strand",
+                                 use_undostack=use_undostack)
+        else:
+            # alone so that the resizes of a drag merge
+            util.doCmd(self, c, use_undostack=use_undostack)
+    # end def
+
+    def _hasSequenceToClear(self) -> bool:
+        """Clearing the sequence of the oligo also clears its complement on
+        the strands paired with the oligo, see :meth:`resize`
+
+        Returns:
+            ``True`` if the oligo or a strand paired with it has a sequence
+        """
+        oligo = self.oligo()
+        if oligo.sequence() is not None:
+            return True
+        for strand in oligo.strands():
+            comp_ss = strand._strandset.complementStrandSet()
+            for comp_strand in comp_ss.getOverlappingStrands(*strand.idxs()):
+                if comp_strand._sequence is not None:
+                    return True
+        return False
+    # end def
+
+    def _touchOligos(self, *strands: StrandT):
+        """Drop what the oligo of this strand and the oligos of ``strands``
+        cache, see :meth:`Oligo._touch`
+
+        Args:
+            strands: other strands of the edit, any may be ``None``
+        """
+        for strand in (self,) + strands:
+            if strand is not None:
+                oligo = strand.oligo()
+                if oligo is not None:
+                    oligo._touch()
     # end def
 
     def setConnection3p(self, strand: StrandT):
+        old_strand = self._strand3p
         self._strand3p = strand
+        self._touchOligos(old_strand, strand)
     # end def
 
     def setConnection5p(self, strand: StrandT):
+        old_strand = self._strand5p
         self._strand5p = strand
+        self._touchOligos(old_strand, strand)
+    # end def
+
+    def setConnectionLow(self, strand: StrandT):
+        old_strand = self.connectionLow()
+        if self._is_forward:
+            self._strand5p = strand
+        else:
+            self._strand3p = strand
+        self._touchOligos(old_strand, strand)
+    # end def
+
+    def setConnectionHigh(self, strand: StrandT):
+        old_strand = self.connectionHigh()
+        if self._is_forward:
+            self._strand3p = strand
+        else:
+            self._strand5p = strand
+        self._touchOligos(old_strand, strand)
     # end def
 
     def setIdxs(self, idxs: SegmentT):
         self._base_idx_low = idxs[0]
         self._base_idx_high = idxs[1]
+        self._touchOligos()
     # end def
 
     def setOligo(self, new_oligo: OligoT, emit_signals: bool = False):
-        self._oligo = new_oligo
+        self._touchOligos()
+        if new_oligo is not None:
+            new_oligo._touch()
+        node = self._oligo_node
+        if node is not None:
+            # the unions of the set this strand leaves can no longer be rolled back
+            node.release()
+        self._oligo_node = None if new_oligo is None else new_oligo._node
         if emit_signals:
             self.strandHasNewOligoSignal.emit(self)
     # end def
@@ -934,7 +1017,7 @@ class Strand(CNObject):
         """
         """
         new_s = Strand(self._strandset, *self.idxs())
-        new_s._oligo = self._oligo
+        new_s._oligo_node = self._oligo_node
         new_s._strand5p = self._strand5p
         new_s._strand3p = self._strand3p
         # required to shallow copy the dictionary
@@ -946,7 +1029,7 @@ class Strand(CNObject):
         """
         """
         new_s = Strand(strandset, *self.idxs())
-        new_s._oligo = oligo
+        new_s._oligo_node = None if oligo is None else oligo._node
         new_s._sequence = self._sequence
         return new_s
     # end def
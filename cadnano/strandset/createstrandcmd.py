@@ -16,6 +16,8 @@ class CreateStrandCommand(UndoCommand):
     Oligos
     """
 
+    __slots__ = ('_strandset', '_strand', '_new_oligo', 'update_segments')
+
     def __init__(self, strandset: StrandSetT,
                  base_idx_low: int, base_idx_high: int,
                  color: str,
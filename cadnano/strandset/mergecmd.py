@@ -19,6 +19,12 @@ class MergeCommand(UndoCommand):
 
     low_strandset_idx should be known ahead of time as a result of selection
     """
+
+    __slots__ = (
+        '_strand_low', '_strand_high', '_s_set', '_new_oligo', '_s_low_oligo',
+        '_s_high_oligo', '_new_strand'
+    )
+
     def __init__(self, strand_low: Strand,
                         strand_high: Strand,
                         priority_strand: Strand):
@@ -108,6 +114,10 @@ class MergeCommand(UndoCommand):
         if h_olg != l_olg:  # check if a loop was created
             h_olg.removeFromPart(emit_signals=True)
 
+        olg._touch()
+        l_olg._touch()
+        h_olg._touch()
+
         # Emit Signals related to destruction and addition
         s_low.strandRemovedSignal.emit(s_low)
         s_high.strandRemovedSignal.emit(s_high)
@@ -160,6 +170,10 @@ class MergeCommand(UndoCommand):
         if h_olg != l_olg:
             h_olg.addToPart(s_high.part(), emit_signals=True)
 
+        olg._touch()
+        l_olg._touch()
+        h_olg._touch()
+
         # Emit Signals related to destruction and addition
         new_strand.strandRemovedSignal.emit(new_strand)
         ss.strandsetStrandAddedSignal.emit(ss, s_low)
@@ -18,6 +18,11 @@ class RemoveStrandCommand(UndoCommand):
             removed to minimize signaling
     """
 
+    __slots__ = (
+        '_strandset', '_strand', '_solo', '_old_strand5p', '_old_strand3p', '_oligo',
+        'mids', '_new_oligo5p', '_new_oligo3p'
+    )
+
     def __init__(self, strandset: StrandSetT, strand: Strand, solo: bool = True):
         super(RemoveStrandCommand, self).__init__("remove strands")
         self._strandset = strandset
@@ -18,6 +18,11 @@ class SplitCommand(UndoCommand):
     On undo, the new copies are removed and the original is restored.
     """
 
+    __slots__ = (
+        '_old_strand', '_s_set', '_old_oligo', 'strand_low', 'strand_high', '_strand3p',
+        '_strand5p', '_h_oligo', '_l_oligo'
+    )
+
     def __init__(self, strand: Strand, base_idx: int, update_sequence: bool = True):
         super(SplitCommand, self).__init__("split strand")
         # Store inputs
@@ -149,6 +154,10 @@ class SplitCommand(UndoCommand):
         if was_not_loop:
             h_olg.addToPart(s_high.part(), emit_signals=True)
 
+        olg._touch()
+        l_olg._touch()
+        h_olg._touch()
+
         # Emit Signals related to destruction and addition
         o_strand.strandRemovedSignal.emit(o_strand)
         ss.strandsetStrandAddedSignal.emit(ss, s_high)
@@ -204,6 +213,10 @@ class SplitCommand(UndoCommand):
         if was_not_loop:
             h_olg.removeFromPart(emit_signals=True)
 
+        olg._touch()
+        l_olg._touch()
+        h_olg._touch()
+
         # Emit Signals related to destruction and addition
         s_low.strandRemovedSignal.emit(s_low)
         s_high.strandRemovedSignal.emit(s_high)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from bisect import (
     bisect_left,
-    insort_left
+    bisect_right
 )
 from typing import (
     Tuple,
@@ -18,6 +18,8 @@ from cadnano.proxies.cnenum import (
     StrandEnum,
     EnumType
 )
+from cadnano.oligo import Oligo
+from cadnano.strand import Strand
 from .createstrandcmd import CreateStrandCommand
 from .removestrandcmd import RemoveStrandCommand
 from .mergecmd import MergeCommand
@@ -42,17 +44,18 @@ class StrandSet(CNObject):
     determining if edits can be made, such as the bounds of empty space in
     which a strand can be created or resized.
 
-    Internally :class:`StrandSet` uses redundant heap and a list data structures
-    to track :class:`Strands` objects, with the list of length of a virtual
-    helix looking like::
+    Internally :class:`StrandSet` keeps the strands in a sorted endpoint
+    array rather than per base storage.  strand_heap::
 
-        strand_array = [strandA, strandA, strandA, ..., None, strandB, strandB, ...]
+        strand_heap = [strandA, strandB, strandC, ...]
 
-    Where every index strandA spans has a reference to strandA and strand_heap::
+    is a sorted list from low index to high index of strand objects and the
+    parallel list::
 
-        strand_heap = [strandA, strandB, strandC, ...]
+        _low_idxs = [strandA.lowIdx(), strandB.lowIdx(), ...]
 
-    is merely a sorted list from low index to high index of strand objects
+    is bisected for O(log n) point and overlap queries.  Strands never
+    overlap so their high indices are sorted as well.
 
     Args:
         is_fwd (bool):  is this a forward or reverse StrandSet?
@@ -88,7 +91,7 @@ class StrandSet(CNObject):
             part (Part): part to copy this into
         """
         return StrandSet(self._is_fwd, self._id_num,
-                         part, len(self.strand_array))
+                         part, self._length)
     # end def
 
     def __iter__(self) -> StrandT:
@@ -149,23 +152,20 @@ class StrandSet(CNObject):
         Args:
             initial_size: size to revert to
         """
-        self.strand_array = [None]*(initial_size)
+        self._length = initial_size
         self.strand_heap = []
+        self._low_idxs = []
     # end def
 
     def resize(self, delta_low: int, delta_high: int):
-        """Resize this StrandSet.  Pad each end when growing otherwise
-        don't do anything
+        """Resize this StrandSet.  Only the length changes, strands keep
+        their indices
 
         Args:
             delta_low:  amount to resize the low index end
             delta_high:  amount to resize the high index end
         """
-        if delta_low < 0:
-            self.strand_array = self.strand_array[delta_low:]
-        if delta_high < 0:
-            self.strand_array = self.strand_array[:delta_high]
-        self.strand_array = [None]*delta_low + self.strand_array + [None]*delta_high
+        self._length = max(self._length + delta_low + delta_high, 0)
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -218,7 +218,7 @@ class StrandSet(CNObject):
         Returns:
             length of the set
         """
-        return len(self.strand_array)
+        return self._length
 
     def idNum(self) -> int:
         """Get the associated virtual helix ID number
@@ -244,8 +244,8 @@ class StrandSet(CNObject):
             of types :class:`Strand` or :obj:`None`
         """
         sh = self.strand_heap
-        i = bisect_left(sh, strand)
-        if sh[i] != strand:
+        i = bisect_left(self._low_idxs, strand.lowIdx())
+        if i == len(sh) or sh[i] != strand:
             raise ValueError("getNeighbors: strand not in set")
         if i == 0:
             low_strand = None
@@ -280,22 +280,15 @@ class StrandSet(CNObject):
 
                 (low_idx, high_idx)
         """
-        class DummyStrand(object):
-            _base_idx_low = base_idx
-
-            def __lt__(self, other):
-                return self._base_idx_low < other._base_idx_low
-
-        ds = DummyStrand()
         sh = self.strand_heap
         lsh = len(sh)
         if lsh == 0:
-            return 0, len(self.strand_array) - 1
+            return 0, self._length - 1
 
         # the i-th index is the high-side strand and the i-1 index
         # is the low-side strand since bisect_left gives the index
-        # to insert the dummy strand at
-        i = bisect_left(sh, ds)
+        # to insert a strand starting at base_idx at
+        i = bisect_left(self._low_idxs, base_idx)
         if i == 0:
             low_idx = 0
         else:
@@ -303,7 +296,7 @@ class StrandSet(CNObject):
 
         # would be an append to the list effectively if inserting the dummy strand
         if i == lsh:
-            high_idx = len(self.strand_array) - 1
+            high_idx = self._length - 1
         else:
             high_idx = sh[i].lowIdx() - 1
         return (low_idx, high_idx)
@@ -380,12 +373,41 @@ class StrandSet(CNObject):
         return 0
     # end def
 
+    def createDeserializedStrands(self, idxs: List[Int2T], colors: List[str]) -> List[StrandT]:
+        """Bulk, non undoable version of :meth:`createDeserializedStrand` for
+        file input.  The strands are inserted with one sort of the
+        strand_heap and ``partStrandChangedSignal`` is emitted once.  Segments
+        are not refreshed, call :meth:`NucleicAcidPart.refreshSegments` when
+        done.
+
+        Args:
+            idxs: ``(low_idx, high_idx)`` of each strand
+            colors: color of each new oligo
+
+        Returns:
+            the new strands
+        """
+        part = self._part
+        strands = []
+        for (base_idx_low, base_idx_high), color in zip(idxs, colors):
+            strand = Strand(self, base_idx_low, base_idx_high)
+            oligo = Oligo(None, color, length=strand.totalLength())
+            oligo.setStrand5p(strand)
+            strand.setOligo(oligo)
+            oligo.addToPart(part, emit_signals=True)
+            strands.append(strand)
+        self.strand_heap = sorted(self.strand_heap + strands)
+        self._low_idxs = [strand.lowIdx() for strand in self.strand_heap]
+        for strand in strands:
+            self.strandsetStrandAddedSignal.emit(self, strand)
+        if strands:
+            part.partStrandChangedSignal.emit(part, self._id_num)
+        return strands
+    # end def
+
     def isStrandInSet(self, strand: StrandT) -> bool:
-        sl = self.strand_array
-        if sl[strand.lowIdx()] == strand and sl[strand.highIdx()] == strand:
-            return True
-        else:
-            return False
+        i = bisect_left(self._low_idxs, strand.lowIdx())
+        return i < len(self.strand_heap) and self.strand_heap[i] is strand
     # end def
 
     def removeStrand(self,  strand: StrandT,
@@ -575,32 +597,9 @@ class StrandSet(CNObject):
             ``True`` if strandset has a strand in the region between ``idx_low``
             and ``idx_high`` (both included). ``False`` otherwise
         """
-        sa = self.strand_array
-        sh = self.strand_heap
-        lsh = len(sh)
-        strand = sa[idx_low]
-
-        if strand is None:
-            class DummyStrand(object):
-                _base_idx_low = idx_low
-
-                def __lt__(self, other):
-                    return self._base_idx_low < other._base_idx_low
-
-            ds = DummyStrand()
-            i = bisect_left(sh, ds)
-
-            while i < lsh:
-                strand = sh[i]
-                if strand.lowIdx() > idx_high:
-                    return False
-                elif idx_low <= strand.highIdx():
-                    return True
-                else:
-                    i += 1
-            return False
-        else:
-            return True
+        # the last strand starting at or before idx_high reaches the furthest
+        i = bisect_right(self._low_idxs, idx_high) - 1
+        return i >= 0 and self.strand_heap[i].highIdx() >= idx_low
     # end def
 
     def getOverlappingStrands(self, idx_low: int, idx_high: int) -> List[StrandT]:
@@ -613,35 +612,12 @@ class StrandSet(CNObject):
         Returns:
             all :class:`Strand` objects in range
         """
-        sa = self.strand_array
+        low_idxs = self._low_idxs
         sh = self.strand_heap
-        lsh = len(sh)
-
-        strand = sa[idx_low]
-        out = []
-        if strand is None:
-            class DummyStrand(object):
-                _base_idx_low = idx_low
-
-                def __lt__(self, other):
-                    return self._base_idx_low < other._base_idx_low
-
-            ds = DummyStrand()
-            i = bisect_left(sh, ds)
-        else:
-            out.append(strand)
-            i = bisect_left(sh, strand) + 1
-
-        while i < lsh:
-            strand = sh[i]
-            if strand.lowIdx() > idx_high:
-                break
-            elif idx_low <= strand.highIdx():
-                out.append(strand)
-                i += 1
-            else:
-                i += 1
-        return out
+        i = bisect_right(low_idxs, idx_low) - 1
+        if i < 0 or sh[i].highIdx() < idx_low:
+            i += 1
+        return sh[i:bisect_right(low_idxs, idx_high)]
     # end def
 
     # def hasStrandAtAndNoXover(self, idx):
@@ -653,8 +629,7 @@ class StrandSet(CNObject):
     #     Returns:
     #         bool: True if hasStrandAtAndNoXover, False otherwise
     #     """
-    #     sl = self.strand_array
-    #     strand = sl[idx]
+    #     strand = self.getStrand(idx)
     #     if strand is None:
     #         return False
     #     elif strand.hasXoverAt(idx):
@@ -672,8 +647,7 @@ class StrandSet(CNObject):
     #     Returns:
     #         bool: True if hasNoStrandAtOrNoXover, False otherwise
     #     """
-    #     sl = self.strand_array
-    #     strand = sl[idx]
+    #     strand = self.getStrand(idx)
     #     if strand is None:
     #         return True
     #     elif strand.hasXoverAt(idx):
@@ -690,12 +664,21 @@ class StrandSet(CNObject):
 
         Returns:
             Strand: :class:`Strand` at `base_idx` if it exists
+
+        Raises:
+            IndexError: ``base_idx`` out of range
         """
-        try:
-            return self.strand_array[base_idx]
-        except Exception:
-            print(self.strand_array)
-            raise
+        if base_idx < 0:
+            base_idx += self._length
+        if not 0 <= base_idx < self._length:
+            raise IndexError("StrandSet.getStrand: %d out of range for length %d" %
+                             (base_idx, self._length))
+        i = bisect_right(self._low_idxs, base_idx) - 1
+        if i >= 0:
+            strand = self.strand_heap[i]
+            if strand.highIdx() >= base_idx:
+                return strand
+        return None
     # end def
 
     def dump(self, xover_list: list) -> Tuple[List[Int2T], List[str]]:
@@ -729,44 +712,41 @@ class StrandSet(CNObject):
 
     ### PRIVATE SUPPORT METHODS ###
     def _addToStrandList(self, strand: StrandT, update_segments: bool = True):
-        """Inserts strand into the strand_array at idx
+        """Inserts strand into the strand_heap in order
 
         Args:
             strand: the strand to add
             update_segments (optional): whether to signal default=``True``
         """
-        idx_low, idx_high = strand.idxs()
-        for i in range(idx_low, idx_high+1):
-            self.strand_array[i] = strand
-        insort_left(self.strand_heap, strand)
+        idx_low = strand.lowIdx()
+        i = bisect_left(self._low_idxs, idx_low)
+        self._low_idxs.insert(i, idx_low)
+        self.strand_heap.insert(i, strand)
         if update_segments:
             self._part.refreshSegments(self._id_num)
 
     def _updateStrandIdxs(self, strand: StrandT, old_idxs: Int2T, new_idxs: Int2T):
-        """update indices in the strand array/list of an existing strand
+        """update the low index of an existing strand.  Resizing can not
+        move a strand past its neighbors so its position is unchanged
 
         Args:
             strand: the strand
-            old_idxs: range (:obj:`int`) to clear
-            new_idxs: range (:obj:`int`) to set to `strand`
+            old_idxs: range (:obj:`int`) the strand had
+            new_idxs: range (:obj:`int`) the strand has now
         """
-        for i in range(old_idxs[0], old_idxs[1] + 1):
-            self.strand_array[i] = None
-        for i in range(new_idxs[0], new_idxs[1] + 1):
-            self.strand_array[i] = strand
+        i = bisect_left(self._low_idxs, old_idxs[0])
+        self._low_idxs[i] = new_idxs[0]
 
     def _removeFromStrandList(self, strand: StrandT, update_segments: bool = True):
-        """Remove strand from strand_array.
+        """Remove strand from strand_heap.
 
         Args:
             strand: the strand
             update_segments (optional): whether to signal default=``True``
         """
         self._document.removeStrandFromSelection(strand)  # make sure the strand is no longer selected
-        idx_low, idx_high = strand.idxs()
-        for i in range(idx_low, idx_high + 1):
-            self.strand_array[i] = None
-        i = bisect_left(self.strand_heap, strand)
+        i = bisect_left(self._low_idxs, strand.lowIdx())
+        self._low_idxs.pop(i)
         self.strand_heap.pop(i)
         if update_segments:
             self._part.refreshSegments(self._id_num)
@@ -780,11 +760,9 @@ class StrandSet(CNObject):
 
                 (is_existing, index)
         """
-        try:
-            ind = self.strand_array.index(strand)
-            return (True, ind)
-        except ValueError:
-            return (False, 0)
+        if self.isStrandInSet(strand):
+            return (True, strand.lowIdx())
+        return (False, 0)
     # end def
 
     def _deepCopy(self, virtual_helix: VirtualHelixT):
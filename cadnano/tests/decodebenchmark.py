@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Time the version 3 decoder on the designs in ``tests/data``
+
+Each design is read, re-encoded to the current format and then decoded with
+the default and the fast (bulk) decoder.  Run from this directory::
+
+    python decodebenchmark.py [--repeat N] [design.json ...]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from pathsetup import TEST_PATH
+
+from cadnano.document import Document
+from cadnano.fileio import v3decode
+from cadnano.fileio.decode import decodeFile
+from cadnano.fileio.encode import encode
+
+
+def timeDecode(obj: dict, fast: bool, repeat: int) -> float:
+    """Args:
+        obj: encoded version 3 document
+        fast: use the bulk decoder
+        repeat: number of runs
+
+    Returns:
+        best time of the runs in seconds
+    """
+    json_string = json.dumps(obj)
+    best = float('inf')
+    for _ in range(repeat):
+        # decode mutates its input
+        doc_dict = json.loads(json_string)
+        document = Document()
+        start = time.perf_counter()
+        v3decode.decode(document, doc_dict, emit_signals=False, fast=fast)
+        best = min(best, time.perf_counter() - start)
+    return best
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano v3 decode benchmark")
+    parser.add_argument('--repeat', '-r', type=int, default=3, help="runs per design, the best is reported")
+    parser.add_argument('files', nargs='*', help="designs, defaults to every .json in tests/data")
+    args = parser.parse_args()
+    filenames = args.files or sorted(glob.glob(os.path.join(TEST_PATH, 'data', '*.json')))
+
+    print("%-36s %10s %10s %8s" % ("design", "default", "fast", "speedup"))
+    total_default = total_fast = 0.
+    for filename in filenames:
+        obj = json.loads(encode(decodeFile(filename)))
+        t_default = timeDecode(obj, False, args.repeat)
+        t_fast = timeDecode(obj, True, args.repeat)
+        total_default += t_default
+        total_fast += t_fast
+        print("%-36s %9.1fms %9.1fms %7.2fx" % (os.path.basename(filename),
+                                                1e3*t_default, 1e3*t_fast, t_default/t_fast))
+    print("%-36s %9.1fms %9.1fms %7.2fx" % ("total", 1e3*total_default, 1e3*total_fast,
+                                            total_default/total_fast))
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+import os
+
 import pytest
 
 from cntestcase import CNTestApp
+from pathsetup import TEST_PATH
+pjoin = os.path.join
 
 
 @pytest.fixture()
@@ -81,6 +85,38 @@ def testStapleOutput_Nature09_monolith_legacy(cnapp):
     ref_set = cnapp.getRefSequences(refname)
     assert test_set == ref_set
 
+
+@pytest.mark.parametrize('designname', ["Nature09_squarenut.json",
+                                        "Science09_prot120_98_v3.json",
+                                        "simple.json"])
+def testFastV3Decode(cnapp, designname):
+    """Bulk v3 decode builds the same design as the default decode"""
+    import json
+    import numpy as np
+    from cadnano.document import Document
+    from cadnano.fileio import v3decode
+    from cadnano.fileio.encode import encode
+    cnapp.document.readFile(pjoin(TEST_PATH, "data", designname))
+    json_string = encode(cnapp.document)
+    parts = []
+    for fast in (False, True):
+        document = Document()
+        v3decode.decode(document, json.loads(json_string), emit_signals=False, fast=fast)
+        parts.append(document.activePart())
+    default_part, fast_part = parts
+    assert fast_part.getIdNums() == default_part.getIdNums()
+    for id_num in default_part.getIdNums():
+        assert np.allclose(fast_part.getCoordinates(id_num)[1],
+                           default_part.getCoordinates(id_num)[1])
+        for default_ss, fast_ss in zip(default_part.getStrandSets(id_num),
+                                       fast_part.getStrandSets(id_num)):
+            assert [s.idxs() for s in fast_ss] == [s.idxs() for s in default_ss]
+    def oligoSummary(part):
+        return sorted((o.strand5p().idNum(), o.strand5p().idx5Prime(), o.length(),
+                       o.isCircular(), o.sequence())
+                      for o in part.oligos())
+    assert oligoSummary(fast_part) == oligoSummary(default_part)
+
 # def testStapleOutput_Nature09_squarenut(cnapp):
 #      """Staples match reference set for Nature09 squarenut"""
 #      designname = "Nature09_squarenut.json"
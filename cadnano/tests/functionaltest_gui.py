@@ -1,6 +1,8 @@
 # To run:
 # pytest -c cadnano/tests/pytestgui.ini cadnano/tests/
 
+import os
+
 import pytest
 from PyQt5.QtCore import Qt, QPointF
 from PyQt5.QtTest import QTest
@@ -8,6 +10,7 @@ from PyQt5.QtTest import QTest
 from cadnano.fileio.lattice import HoneycombDnaPart
 from cadnano.views.sliceview import slicestyles
 from cnguitestcase import GUITestApp
+from pathsetup import TEST_PATH
 
 
 @pytest.fixture()
@@ -64,3 +67,15 @@ def testCreateVirtualHelixGui(cnapp):
     # time.sleep(3)
 
 # end def
+
+
+def testReadFileUndoStack(cnapp):
+    """Opening a file pushes only the oligo names the outliner gives, not
+    the part state the views get from the decoder
+    """
+    cnapp.document.readFile(os.path.join(TEST_PATH, "data", "simple.json"))
+    cnapp.processEvents()
+    stack = cnapp.document.undoStack()
+    assert stack.count() == 12
+    assert all(stack.command(i)._key == 'name' for i in range(stack.count()))
+# end def
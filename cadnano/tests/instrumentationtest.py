@@ -0,0 +1,70 @@
+from cntestcase import cnapp  # noqa: F401
+
+from nucleicacidparttest import create3Helix
+
+from cadnano import instrumentation
+
+
+def instrumentedEdits(part):
+    """Create a strand, undo and redo it and query a base point twice with
+    instrumentation enabled
+
+    Returns:
+        the :func:`instrumentation.snapshot` of the edits
+    """
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        fwd_ss, _ = part.getStrandSets(0)
+        fwd_ss.createStrand(0, 20)
+        part.undoStack().undo()
+        part.undoStack().redo()
+        part.queryBasePoint(2., (0., 0., 0.))
+        part.queryBasePoint(2., (0., 0., 0.))
+        return instrumentation.snapshot()
+    finally:
+        instrumentation.disable()
+# end def
+
+
+def testInstrumentationCommands(cnapp):
+    stats = instrumentedEdits(create3Helix(cnapp.document, (0, 0, 1), 42))
+    assert stats['commands']['CreateStrandCommand.redo'][0] == 2
+    assert stats['commands']['CreateStrandCommand.undo'][0] == 1
+# end def
+
+
+def testInstrumentationQueries(cnapp):
+    stats = instrumentedEdits(create3Helix(cnapp.document, (0, 0, 1), 42))
+    assert stats['queries']['queryBasePoint'][0] == 2
+    assert stats['caches']['point']['hits'] >= 1
+# end def
+
+
+def testInstrumentationSignals(cnapp):
+    stats = instrumentedEdits(create3Helix(cnapp.document, (0, 0, 1), 42))
+    assert any(name.startswith('strand') for name in stats['signals'])
+# end def
+
+
+def testInstrumentationReport(cnapp):
+    stats = instrumentedEdits(create3Helix(cnapp.document, (0, 0, 1), 42))
+    assert 'CreateStrandCommand.redo' in instrumentation.report(stats)
+# end def
+
+
+def testInstrumentationDisabled(cnapp):
+    part = create3Helix(cnapp.document, (0, 0, 1), 42)
+    stats = instrumentedEdits(part)
+    part.getStrandSets(0)[0].getStrand(0).resize((0, 25))
+    assert instrumentation.snapshot()['commands'] == stats['commands']
+# end def
+
+
+def testInstrumentationReset(cnapp):
+    part = create3Helix(cnapp.document, (0, 0, 1), 42)
+    instrumentedEdits(part)
+    instrumentation.reset()
+    assert instrumentation.snapshot()['commands'] == {}
+    assert part.queryCacheStats()['point']['hits'] == 0
+# end def
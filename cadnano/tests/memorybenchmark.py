@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Count the model objects and undo commands held by the designs in
+``tests/data`` and compare their size with the ``__slots__`` layout against
+the previous ``__dict__`` layout
+
+Every design is decoded and then copied into its own part with
+:func:`v3decode.importToPart` on the undo stack, so the undo history holds a
+command per virtual helix, strand and crossover.  The ``__dict__`` layout is
+measured with ``tracemalloc`` on plain replicas made by
+:func:`dictLayoutReplica` from the attributes of each object, including what
+the previous classes held per instance: an empty signal ``dict`` per
+:class:`CNObject`, six bound direction methods per :class:`Strand` and a
+``deque`` per :class:`UndoCommand`.  The undo history of every design is
+reported with :meth:`UndoStack.memoryFootprint`.  Run from this directory::
+
+    python memorybenchmark.py [design.json ...]
+"""
+import argparse
+import gc
+import glob
+import os
+import sys
+import tracemalloc
+from collections import (
+    Counter,
+    deque
+)
+
+from pathsetup import TEST_PATH
+
+from cadnano.decorators.insertion import Insertion
+from cadnano.fileio import v3decode
+from cadnano.fileio.decode import decodeFile
+from cadnano.fileio.v3encode import encodePartList
+from cadnano.oligo import Oligo
+from cadnano.oligo.oligomembership import OligoNode
+from cadnano.part.virtualhelix import VirtualHelix
+from cadnano.strand import Strand
+from cadnano.undocommand import UndoCommand
+
+MODEL_CLASSES = (Strand, Oligo, OligoNode, Insertion, VirtualHelix)
+
+STRAND_BOUND_METHODS = ('idx5Prime', 'idx3Prime', 'connectionLow', 'connectionHigh',
+                        'setConnectionLow', 'setConnectionHigh')
+
+
+def slotNames(cls: type) -> list:
+    """Returns:
+        the ``__slots__`` of ``cls`` and its bases
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names += [slots] if isinstance(slots, str) else list(slots)
+    return [name for name in names if name not in ('__dict__', '__weakref__')]
+# end def
+
+
+def slotLayoutSize(obj) -> int:
+    """Returns:
+        bytes of ``obj`` and the per instance containers it owns
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, UndoCommand):
+        size += sys.getsizeof(obj.commands)
+    return size
+# end def
+
+
+def dictLayoutReplica(obj, replica_class: type):
+    """Returns:
+        an instance of the plain ``replica_class`` with the attributes of
+        ``obj`` and the per instance containers of the ``__dict__`` layout
+    """
+    replica = replica_class()
+    for name in slotNames(type(obj)):
+        if name == '_signals':
+            replica._signals = {}
+        elif name == 'commands':
+            replica.commands = deque(obj.commands)
+        elif hasattr(obj, name):
+            setattr(replica, name, getattr(obj, name))
+    if isinstance(obj, Strand):
+        for name in STRAND_BOUND_METHODS:
+            setattr(replica, name, getattr(obj, name))
+    return replica
+# end def
+
+
+def census(objects: list) -> dict:
+    """Returns:
+        ``dict`` of class name to ``[count, slots bytes, dict bytes]``
+    """
+    by_class = {}
+    for obj in objects:
+        if isinstance(obj, MODEL_CLASSES) or isinstance(obj, UndoCommand):
+            by_class.setdefault(type(obj), []).append(obj)
+    out = {}
+    for cls, instances in by_class.items():
+        replica_class = type('Dict' + cls.__name__, (object,), {})
+        tracemalloc.start()
+        replicas = [dictLayoutReplica(obj, replica_class) for obj in instances]
+        dict_bytes = tracemalloc.get_traced_memory()[0] - sys.getsizeof(replicas)
+        tracemalloc.stop()
+        del replicas
+        out[cls.__name__] = [len(instances), sum(slotLayoutSize(obj) for obj in instances), dict_bytes]
+    return out
+# end def
+
+
+def loadWithHistory(filename: str):
+    """Returns:
+        the document of ``filename`` with a copy of its part imported on the
+        undo stack
+    """
+    document = decodeFile(filename)
+    part = next(iter(document.getParts()))
+    part_instance = next(iter(part._instances))
+    copy_dict = encodePartList(part_instance, list(part.getIdNums()))
+    v3decode.importToPart(part_instance, copy_dict, offset=(0, 500*part.radius()))
+    return document
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano model object memory benchmark")
+    parser.add_argument('files', nargs='*', help="designs, defaults to every .json in tests/data")
+    args = parser.parse_args()
+    filenames = args.files or sorted(glob.glob(os.path.join(TEST_PATH, 'data', '*.json')))
+
+    documents = []
+    for filename in filenames:
+        print("loading", os.path.basename(filename))
+        document = loadWithHistory(filename)
+        footprint = document.undoStack().memoryFootprint()
+        print("    undo history: %d commands, %d bytes" % (footprint['undo_commands'],
+                                                          footprint['undo_bytes']))
+        documents.append(document)
+    gc.collect()
+    rows = census(gc.get_objects())
+
+    print("%-36s %9s %12s %12s %7s" % ("class", "count", "__dict__ B", "__slots__ B", "saved"))
+    totals = Counter()
+    for name in sorted(rows, key=lambda key: -rows[key][2]):
+        count, slot_bytes, dict_bytes = rows[name]
+        totals.update({'count': count, 'slots': slot_bytes, 'dict': dict_bytes})
+        print("%-36s %9d %12d %12d %6.0f%%" % (name, count, dict_bytes, slot_bytes,
+                                              100.*(dict_bytes - slot_bytes)/dict_bytes))
+    print("%-36s %9d %12d %12d %6.0f%%" % ("total", totals['count'], totals['dict'], totals['slots'],
+                                          100.*(totals['dict'] - totals['slots'])/totals['dict']))
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 import pytest
+import io
 import math
 
+import numpy as np
+
 from cntestcase import cnapp
 
+from cadnano import util
+from cadnano.fileio import sequenceexport
+from cadnano.oligo import EXPORT_COLUMNS
 from cadnano.part.nucleicacidpart import NucleicAcidPart
+from cadnano.part.partbuilder import PartBuilder
 
 
 def create3Helix(doc, direction, length):
@@ -51,3 +58,558 @@ def testRemove(cnapp):
     assert len(doc.children()) == 0
     us.undo()
     assert len(doc.children()) == 1
+
+
+def _bruteForceBasePoint(part, radius, point):
+    difference = part.axis_pts - point
+    close_points, = np.where(np.sum(difference*difference, axis=1) < radius*radius)
+    return part.id_nums[close_points].tolist(), part.indices[close_points].tolist()
+
+
+def testSpatialIndexQueries(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = 2.1*part.radius()
+    part.setVirtualHelixSize(1, 63)
+    part._resizeHelix(2, False, 7)
+    part._resizeHelix(0, False, -5)
+    part.translateVirtualHelices([2], 1.5, -0.5, 0.25, True)
+    for id_num in part.getidNums():
+        for idx in (0, 10, 30):
+            point = tuple(part.getCoordinate(id_num, idx))
+            id_nums, indices = part._queryBasePoint(radius, point)
+            assert (id_nums.tolist(), indices.tolist()) == _bruteForceBasePoint(part, radius, point)
+        origin = tuple(part.getVirtualHelixOrigin(id_num))
+        difference = part._origin_pts - origin
+        delta = np.sum(difference*difference, axis=1)
+        expected = sorted(np.where(delta <= radius*radius)[0].tolist(), key=lambda x: delta[x])
+        assert part.queryVirtualHelixOrigin(radius, origin) == expected
+    neighbors = part.getNeighbors(0, radius, 10)
+    assert neighbors and all(nid != 0 for nid, _ in neighbors)
+    part.removeVirtualHelix(1)
+    assert 1 not in part._getVirtualHelixOriginNeighbors(0, radius)
+    point = tuple(part.getCoordinate(0, 10))
+    assert 1 not in part._queryBasePoint(radius, point)[0].tolist()
+
+
+def testPotentialCrossoverMapAll(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    xover_map = part.potentialCrossoverMapAll()
+    assert sorted(xover_map) == part.getidNums()
+    for id_num in part.getidNums():
+        per_neighbor_hits, pairs = part.potentialCrossoverMap(id_num)
+        assert per_neighbor_hits
+        assert xover_map[id_num] == (per_neighbor_hits, pairs)
+
+
+def testCrossoverCache(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    part.crossoverCacheStats(reset=True)
+    first = part.potentialCrossoverMap(0)
+    stats = part.crossoverCacheStats()
+    assert stats['hits'] == 0 and stats['misses'] == 2
+    assert part.potentialCrossoverMap(0, 21) == part.queryIdNumNeighbor(0, [1, 2], 21)
+    assert part.potentialCrossoverMap(0) == first
+    assert part.crossoverCacheStats()['misses'] == 2
+    # reverse pairs were cached from the transposed candidates
+    part.potentialCrossoverMap(1)
+    assert part.crossoverCacheStats()['misses'] == 2
+
+    part.setVirtualHelixProperties(0, 'eulerZ', 10., use_undostack=False)
+    assert (0, 1) not in part._xover_cache and (1, 0) not in part._xover_cache
+    assert not part._xover_cache
+    part.potentialCrossoverMap(0)
+    assert part.crossoverCacheStats()['misses'] == 4
+
+    part.translateVirtualHelices([1], 0.5, 0, 0, True)
+    assert all(1 not in key for key in part._xover_cache)
+    part.setVirtualHelixSize(2, 63)
+    assert all(2 not in key for key in part._xover_cache)
+    part.removeVirtualHelix(1)
+    assert all(1 not in key for key in part._xover_cache)
+    assert part.crossoverCacheStats(reset=True)['size'] == len(part._xover_cache)
+    assert part.crossoverCacheStats()['hits'] == 0
+
+
+def testQueryCache(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = part.radius()
+    part.queryCacheStats(reset=True)
+    point0 = tuple(part.getCoordinate(0, 20))
+    point2 = tuple(part.getCoordinate(2, 20))
+    part.queryBasePoint(radius, point0)
+    part.queryBasePoint(radius, point2)
+    part.queryBasePoint(radius, (point0[0] + 1e-7, point0[1], point0[2]))
+    stats = part.queryCacheStats()['point']
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 2, 2)
+
+    # only the entry touching the moved helix is dropped
+    part.translateVirtualHelices([2], 0, 0.5, 0, True)
+    assert part.queryCacheStats()['point']['size'] == 1
+    point2 = tuple(part.getCoordinate(2, 20))
+    assert (part.queryBasePoint(radius, point2)[0].tolist() ==
+            _bruteForceBasePoint(part, radius, point2)[0])
+
+    part.setQueryCacheSize(1)
+    stats = part.queryCacheStats(reset=True)['point']
+    assert stats['size'] == 1 and stats['evictions'] == 1
+    assert part.queryVirtualHelixOrigin(2.1*radius, (0., 0., 0.)) == [0, 1]
+    part.removeVirtualHelix(1)
+    assert part.queryVirtualHelixOrigin(2.1*radius, (0., 0., 0.)) == [0]
+    assert part.queryCacheStats()['origin']['invalidations'] == 1
+
+
+def testVirtualHelixPropertyStore(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    assert part.getVirtualHelixProperties(1, ['bases_per_repeat', 'is_visible']) == [21, True]
+    assert isinstance(part.getVirtualHelixProperties(1, 'length'), int)
+    part.setVirtualHelixProperties(1, 'eulerZ', 12.5, use_undostack=False)
+    assert part.getVirtualHelixProperties(1, 'eulerZ') == 12.5
+    assert part.getVirtualHelixProperties(0, 'eulerZ') == 40
+    part._setVirtualHelixProperties(2, 'extra', 'hello', emit_signals=False)
+    props, origins, directions = part.helixProperties([0, 2])
+    assert props['name'] == ['vh0', 'vh2'] and props['extra'][1] == 'hello'
+    df = part.vh_properties.toDataFrame(slice(0, 3))
+    assert list(df['length']) == [42, 42, 42]
+
+    # grow past the default allocation
+    part.createVirtualHelix(100., 100., 0., 63, id_num=300)
+    assert part.getVirtualHelixProperties(300, ['name', 'length']) == ['vh300', 63]
+    assert len(part.vh_properties) > 300
+
+
+def testVirtualHelixNeighbors(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    threshold = 2.1*part.radius()
+    for id_num in range(3):
+        expected = sorted(part._getVirtualHelixOriginNeighbors(id_num, threshold))
+        assert part.getVirtualHelixNeighbors(id_num) == expected
+    assert part.recomputeNeighbors(threshold) == {i: part.getVirtualHelixNeighbors(i)
+                                                  for i in range(3)}
+    # string form kept for file IO and views
+    neighbors = part.getVirtualHelixNeighbors(0)
+    assert part.getVirtualHelixProperties(0, 'neighbors') == str(neighbors)
+    assert part.getAllVirtualHelixProperties(0)['neighbors'] == str(neighbors)
+
+    part.removeVirtualHelix(1, use_undostack=True)
+    assert all(1 not in part.getVirtualHelixNeighbors(i) for i in (0, 2))
+    doc.undoStack().undo()
+    assert part.getVirtualHelixNeighbors(0) == neighbors
+
+
+def testChunkedCoordinates(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    other_chunk = part._coords._chunks[2]
+    part.setVirtualHelixSize(1, 84, use_undostack=False)
+    part._resizeHelix(1, False, -21)
+    # only the resized helix is touched
+    assert part._coords._chunks[2] is other_chunk
+    assert part.getOffsetAndSize(1) == (42, 63)
+    assert part.getOffsetAndSize(2) == (105, 42)
+
+    # the packed view matches the per helix chunks
+    assert part.total_points == len(part.axis_pts) == 147
+    for id_num in range(3):
+        offset, size = part.getOffsetAndSize(id_num)
+        axis_pts, fwd_pts, _ = part.getCoordinates(id_num)
+        assert np.array_equal(part.axis_pts[offset:offset + size], axis_pts)
+        assert np.array_equal(part.fwd_pts[offset:offset + size], fwd_pts)
+        assert part.id_nums[offset:offset + size].tolist() == [id_num]*size
+        assert part.indices[offset:offset + size].tolist() == list(range(size))
+
+
+@pytest.mark.parametrize('use_undostack', [True, False])
+def testPartBuilder(cnapp, use_undostack):
+    doc = cnapp.document
+    reference = create3Helix(doc, (0, 0, 1), 42)
+    part = doc.createNucleicAcidPart(is_lattice=True)
+    builder = PartBuilder(part)
+    origins = [tuple(reference.getVirtualHelixOrigin(i)) for i in range(3)]
+    builder.addVirtualHelices(origins, [42, 42, 42], id_nums=[0, 1, 2],
+                              properties={'eulerZ': [40, 40, 40]})
+    builder.addStrands([(0, True, 0, 20, None), (1, False, 0, 20, None)])
+    builder.addXovers([(0, True, 20, 1, False, 20)])
+    assert builder.build(use_undostack=use_undostack) == [0, 1, 2]
+
+    for id_num in range(3):
+        assert part.getVirtualHelixNeighbors(id_num) == reference.getVirtualHelixNeighbors(id_num)
+        for pts, ref_pts in zip(part.getCoordinates(id_num), reference.getCoordinates(id_num)):
+            assert np.allclose(pts, ref_pts)
+    strand0 = part.getStrand(True, 0, 10)
+    assert strand0.connection3p() is part.getStrand(False, 1, 10)
+    assert strand0.oligo() is strand0.connection3p().oligo()
+
+    if use_undostack:
+        doc.undoStack().undo()
+        assert part.getidNums() == []
+        doc.undoStack().redo()
+        assert part.getidNums() == [0, 1, 2]
+
+
+def testOligoMembership(cnapp):
+    """Joining and splitting oligos with crossovers, undo and redo match the
+    oligos found by walking the strands
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 84)
+    fwd_ss, _ = part.getStrandSets(0)
+    strands = [fwd_ss.createStrand(12*i, 12*i + 9) for i in range(6)]
+
+    def checkOligos():
+        oligos = set()
+        for strand in strands:
+            if strand.strandSet() is None or strand.connection5p() is not None:
+                continue
+            oligo = strand.oligo()
+            chain = list(strand.generator3pStrand())
+            assert all(item.oligo() is oligo for item in chain)
+            assert oligo.length() == sum(item.totalLength() for item in chain)
+            assert oligo not in oligos
+            oligos.add(oligo)
+        assert oligos == part.oligos()
+
+    # join from the 3' end so the joined oligo is the larger set
+    for i in reversed(range(5)):
+        part.createXover(strands[i], 12*i + 9, strands[i + 1], 12*i + 12)
+        checkOligos()
+    assert len(part.oligos()) == 1
+    nodes = [strand._oligo_node for strand in strands]
+
+    stack = doc.undoStack()
+    for _ in range(5):
+        stack.undo()
+        checkOligos()
+    # undo rolled the unions back without relabeling any strand
+    assert [strand._oligo_node for strand in strands] == nodes
+    for _ in range(5):
+        stack.redo()
+        checkOligos()
+
+    # relabel part of the oligo in between so undo has to walk the strands
+    fwd_ss.splitStrand(strands[2], 28)
+    fwd_ss.removeStrand(fwd_ss.getStrand(30))
+    stack.undo()
+    stack.undo()
+    checkOligos()
+    for _ in range(5):
+        stack.undo()
+        checkOligos()
+    for _ in range(5):
+        stack.redo()
+        checkOligos()
+
+    part.removeXover(strands[1], strands[2])
+    checkOligos()
+    stack.undo()
+    checkOligos()
+    stack.redo()
+    checkOligos()
+    assert len(part.oligos()) == 2
+
+
+def batchEdits(part):
+    """Edit strands, crossovers and helix positions in one
+    :meth:`NucleicAcidPart.batch`
+
+    Returns:
+        the closed batch
+    """
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    with part.batch("test batch") as batch:
+        strands = [fwd_ss.createStrand(12*i, 12*i + 9) for i in range(4)]
+        for i in range(3):
+            part.createXover(strands[i], 12*i + 9, strands[i + 1], 12*i + 12)
+        rev_ss.createStrand(5, 30)
+        fwd_ss.removeStrand(strands[1])
+        part.translateVirtualHelices([2], 21*part.radius(), 0, 0, False, use_undostack=True)
+    return batch
+# end def
+
+
+def checkDerivedState(part):
+    """Segments, oligo lengths and neighbors match a full refresh
+    """
+    for id_num in range(3):
+        expected = part._refreshSegments(*part.getStrandSets(id_num))
+        for strandset, segments in zip(part.getStrandSets(id_num), expected):
+            assert [strand.segments for strand in strandset.strand_heap] == segments
+    for oligo in part.oligos():
+        chain = list(oligo.strand5p().generator3pStrand())
+        assert oligo.length() == sum(strand.totalLength() for strand in chain)
+    assert part.recomputeNeighbors(2.1*part.radius()) == {
+        i: part.getVirtualHelixNeighbors(i) for i in range(3)}
+# end def
+
+
+def testBatchDefersRefresh(cnapp):
+    part = create3Helix(cnapp.document, (0, 0, 1), 84)
+    fwd_ss, _ = part.getStrandSets(0)
+    neighbors = part.getVirtualHelixNeighbors(2)
+    with part.batch("test batch") as batch:
+        fwd_ss.createStrand(0, 9)
+        part.translateVirtualHelices([2], 21*part.radius(), 0, 0, False, use_undostack=True)
+        assert batch.segments == {0}
+        assert part.getVirtualHelixNeighbors(2) == neighbors
+    assert part.getVirtualHelixNeighbors(2) == []
+# end def
+
+
+def testBatchRefreshesOnClose(cnapp):
+    part = create3Helix(cnapp.document, (0, 0, 1), 84)
+    batchEdits(part)
+    checkDerivedState(part)
+# end def
+
+
+def testBatchIsOneMacro(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 84)
+    stack = doc.undoStack()
+    undo_count = len(stack.undostack)
+    batchEdits(part)
+    assert len(stack.undostack) == undo_count + 1
+    assert stack.undostack[-1].name == "test batch"
+# end def
+
+
+def testBatchUndoRedo(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 84)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    neighbors = {i: part.getVirtualHelixNeighbors(i) for i in range(3)}
+    batchEdits(part)
+    stack = doc.undoStack()
+    stack.undo()
+    assert len(fwd_ss.strand_heap) == len(rev_ss.strand_heap) == 0
+    assert {i: part.getVirtualHelixNeighbors(i) for i in range(3)} == neighbors
+    stack.redo()
+    checkDerivedState(part)
+# end def
+
+
+def testSequenceBuffer(cnapp):
+    """The complement of an applied sequence lands on the paired bases,
+    insertions and skips included
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    scaffold = fwd_ss.createStrand(0, 20)
+    staples = [rev_ss.createStrand(0, 9), rev_ss.createStrand(10, 20)]
+    scaffold.addInsertion(4, 2)
+    scaffold.addInsertion(15, -1)
+    assert scaffold.totalLength() == 22
+    sequence = 'ACGTTGCAAGCTAGCTTACGAT'
+    scaffold.oligo().applySequence(sequence)
+    assert scaffold.sequence() == sequence
+    paired = util.rcomp(staples[1].sequence() + staples[0].sequence())
+    assert paired == sequence
+
+    # a shorter sequence is padded, the padding clears the paired bases
+    scaffold.oligo().applySequence('ACGT')
+    assert staples[0].sequence() == ' '*8 + 'ACGT'[::-1].translate(util.complement)
+    assert staples[1].sequence() == ' '*10
+    doc.undoStack().undo()
+    assert util.rcomp(staples[1].sequence() + staples[0].sequence()) == sequence
+    scaffold.oligo().applySequence(None)
+    assert scaffold.oligo().sequence() is None
+    assert staples[0].sequence().strip() == ''
+    assert part.sequenceBuffer().nbytes() > 0
+# end def
+
+
+def testApplySequences(cnapp):
+    """Applying many sequences at once matches applying them one by one and
+    undoes as one command
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    scaffold = fwd_ss.createStrand(0, 30)
+    staples = [rev_ss.createStrand(0, 12), rev_ss.createStrand(13, 30)]
+    staples[0].addInsertion(6, 1)
+    stack = doc.undoStack()
+
+    def strandSequences():
+        # undo leaves the paired strands blank rather than without sequence
+        return [strand.sequence().strip() or None for strand in [scaffold] + staples]
+
+    assignments = {scaffold.oligo(): 'ACGT'*8, staples[1].oligo(): 'GGGCCC'}
+    for oligo, sequence in assignments.items():
+        oligo.applySequence(sequence)
+    expected = strandSequences()
+    for _ in assignments:
+        stack.undo()
+    assert strandSequences() == [None, None, None]
+
+    undo_count = len(stack.undostack)
+    part.applySequences(assignments)
+    assert strandSequences() == expected
+    assert len(stack.undostack) == undo_count + 1
+    stack.undo()
+    assert strandSequences() == [None, None, None]
+    stack.redo()
+    assert strandSequences() == expected
+# end def
+
+
+def testOligoDerivedDataSplit(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, _ = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 19)
+    oligo = strand.oligo()
+    oligo.applySequence('ACGT'*5)
+    assert oligo.strands() == (strand,)
+    assert oligo.sequence() == 'ACGT'*5
+    assert oligo.getStrandLengths() == [20]
+    strand.split(9)
+    low, high = fwd_ss.getStrand(0), fwd_ss.getStrand(19)
+    assert low.oligo().strands() == (low,)
+    assert low.oligo().sequence() == 'ACGTACGTAC'
+    assert high.oligo().strands() == (high,)
+    assert high.oligo().sequence() == 'GTACGTACGT'
+    doc.undoStack().undo()
+    assert strand.oligo().strands() == (strand,)
+    assert strand.oligo().getStrandLengths() == [20]
+    assert strand.oligo().sequence() == 'ACGT'*5
+    assert not doc.isOligoSelected(strand.oligo())
+# end def
+
+
+def testOligoDerivedDataInsertion(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, _ = part.getStrandSets(0)
+    oligo = fwd_ss.createStrand(0, 9).oligo()
+    oligo.applySequence('ACGTACGTAC')
+    # inserting clears the sequence
+    fwd_ss.getStrand(0).addInsertion(5, 2)
+    assert oligo.getStrandLengths() == [12]
+    assert oligo.length() == 12
+    assert oligo.sequence() is None
+    oligo.applySequence('A'*12)
+    assert oligo.sequence() == 'A'*12
+    stack = doc.undoStack()
+    stack.undo()
+    assert oligo.sequence() is None
+    stack.undo()
+    assert oligo.getStrandLengths() == [10]
+    assert oligo.sequence() == 'ACGTACGTAC'
+# end def
+
+
+def testOligoDerivedDataXover(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, _ = part.getStrandSets(0)
+    _, rev_ss = part.getStrandSets(1)
+    strand = fwd_ss.createStrand(0, 20)
+    other = rev_ss.createStrand(0, 20)
+    oligo3p = other.oligo()
+    assert oligo3p.strands() == (other,)
+    part.createXover(strand, 20, other, 20)
+    assert strand.oligo().strands() == (strand, other)
+    # resize the 3' strand while its oligo is joined
+    other.resize((5, 20), use_undostack=False)
+    doc.undoStack().undo()
+    assert other.oligo() is oligo3p
+    assert oligo3p.strands() == (other,)
+    assert oligo3p.getStrandLengths() == [16]
+# end def
+
+
+def testOligoTouchIsLocal(cnapp):
+    """Editing the strands of one oligo keeps what the others cache
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 10)
+    other = fwd_ss.createStrand(20, 30).oligo()
+    assert other.getStrandLengths() == [11]
+    data = other._derivedData()
+    strand.resize((0, 15))
+    strand.oligo().applySequence('A'*16)
+    strand.addInsertion(5, 2)
+    assert other._derivedData() is data
+    rev_ss.createStrand(25, 35).oligo().applySequence('C'*11)
+    assert other._derivedData() is not data
+    assert other.sequence() == ' '*5 + 'G'*6
+# end def
+
+
+def testOligoPositionsAtLengths(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = rev_ss.createStrand(0, 19)
+    strand.addInsertion(5, 2)
+    strand.addInsertion(8, -1)
+    oligo = strand.oligo()
+    assert oligo.length() == 21
+    # from the 5' end at 19, over the skip at 8 and through the insertion at 5
+    expected = list(range(19, 8, -1)) + [7, 6, 5, 5, 5, 4, 3, 2, 1, 0]
+    positions = oligo.positionsAtLengths(range(-1, 22))
+    assert positions[0] is None and positions[-1] is None
+    assert [idx for _, _, idx in positions[1:-1]] == expected
+    assert oligo.getAbsolutePositionAtLength(12) == (0, rev_ss.strandType(), 6)
+# end def
+
+
+def testSplitOligoAtAbsoluteLengths(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, _ = part.getStrandSets(0)
+    _, rev_ss = part.getStrandSets(1)
+    strand = fwd_ss.createStrand(0, 20)
+    strand.addInsertion(5, 2)
+    other = rev_ss.createStrand(0, 20)
+    part.createXover(strand, 20, other, 20)
+    oligo = strand.oligo()
+    assert oligo.length() == 44
+    # mid strand through the insertion, at the crossover and mid strand
+    # going reverse
+    assert part.splitOligoAtAbsoluteLengths(oligo, [10, 23, 33]) == -1
+    assert [s.idxs() for s in fwd_ss.strands()] == [(0, 7), (8, 20)]
+    assert [s.idxs() for s in rev_ss.strands()] == [(0, 10), (11, 20)]
+    strands5p = (fwd_ss.getStrand(0), fwd_ss.getStrand(20),
+                 rev_ss.getStrand(20), rev_ss.getStrand(0))
+    assert [s.oligo().length() for s in strands5p] == [10, 13, 10, 11]
+    assert strands5p[1].connection3p() is None
+# end def
+
+
+def testSequenceExport(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_ss.createStrand(0, 9).oligo().applySequence('ACGTACGTAC')
+    rev_ss.createStrand(20, 29)
+
+    lines = part.getSequences().splitlines()
+    assert lines[0] == ','.join(EXPORT_COLUMNS)
+    assert len(lines) == 3
+    assert '0[0],0[9],%s,,ACGTACGTAC,,()' % fwd_ss.getStrand(0).oligo().getColor() in lines
+
+    lines = part.getSequences(columns=('Start', 'Sequence'), fmt='tsv').splitlines()
+    assert sorted(lines) == sorted(['Start\tSequence', '0[0]\tACGTACGTAC', '0[29]\t' + '?'*10])
+
+    out = io.StringIO()
+    assert part.writeSequences(out, columns=('Start',), fmt='plate96') == 2
+    assert [line.split(',')[:2] for line in out.getvalue().splitlines()] == [
+        ['Plate', 'Well'], ['1', 'A1'], ['1', 'A2']]
+    wells = sequenceexport.iterWells(8, 12)
+    assert [next(wells) for _ in range(97)][-2:] == [(1, 'H12'), (2, 'A1')]
+
+    with pytest.raises(KeyError):
+        part.getSequences(columns=('Start', 'Name'))
+    with pytest.raises(ValueError):
+        part.getSequences(fmt='xlsx')
+# end def
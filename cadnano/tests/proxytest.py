@@ -0,0 +1,181 @@
+import gc
+
+import pytest
+
+from cntestcase import cnapp  # noqa: F401
+
+from nucleicacidparttest import create3Helix
+
+from cadnano.proxies.cnproxy import (
+    DummySignal,
+    ProxyObject,
+    QtSignal
+)
+from cadnano.proxies.signalqueue import deferSignals
+from cadnano.strand import Strand
+
+
+class Sender(ProxyObject):
+    __slots__ = ()
+    changedSignal = DummySignal(object, name='changedSignal')
+
+
+class Receiver(object):
+    def __init__(self):
+        self.received = []
+
+    def changedSlot(self, obj):
+        self.received.append(obj)
+
+
+def testSignalConnectSender(cnapp):
+    sender_a = Sender(None)
+    sender_b = Sender(None)
+    receiver = Receiver()
+    # nothing connected, emits are dropped
+    sender_a.changedSignal.emit(sender_a)
+    sender_a.changedSignal.connect(receiver.changedSlot)
+    assert Sender.changedSignal.receiverCount(sender_a) == 1
+    assert Sender.changedSignal.receiverCount() == 0
+    sender_b.changedSignal.emit(sender_b)
+    sender_a.changedSignal.emit(sender_a)
+    assert receiver.received == [sender_a]
+    sender_a.changedSignal.disconnect(receiver.changedSlot)
+    assert Sender.changedSignal.receiverCount(sender_a) == 0
+# end def
+
+
+def testSignalPerSender(cnapp):
+    sender_a = Sender(None)
+    sender_b = Sender(None)
+    receiver = Receiver()
+    Sender.changedSignal.connect(receiver.changedSlot, sender=sender_a)
+    sender_b.changedSignal.emit(sender_b)
+    sender_a.changedSignal.emit(sender_a)
+    assert receiver.received == [sender_a]
+    Sender.changedSignal.disconnect(receiver.changedSlot, sender=sender_a)
+    assert id(sender_a) not in Sender.changedSignal._by_sender
+# end def
+
+
+def testSignalEverySender(cnapp):
+    sender = Sender(None)
+    received = []
+    Sender.changedSignal.connect(received.append)
+    sender.changedSignal.emit(sender)
+    Sender.changedSignal.disconnect(received.append)
+    assert received == [sender]
+    assert Sender.changedSignal.receiverCount() == 0
+# end def
+
+
+def testSignalHoldsSlots(cnapp):
+    sender = Sender(None)
+    received = []
+    Sender.changedSignal.connect(lambda obj: received.append(obj), sender=sender)
+    gc.collect()
+    sender.changedSignal.emit(sender)
+    assert received == [sender]
+# end def
+
+
+def testSignalDropsBoundMethod(cnapp):
+    sender = Sender(None)
+    receiver = Receiver()
+    sender.changedSignal.connect(receiver.changedSlot)
+    assert Sender.changedSignal.receiverCount(sender) == 1
+    del receiver
+    gc.collect()
+    assert Sender.changedSignal.receiverCount(sender) == 0
+    sender.changedSignal.emit(sender)
+# end def
+
+
+def testSignalDropsSender(cnapp):
+    sender = Sender(None)
+    receiver = Receiver()
+    Sender.changedSignal.connect(receiver.changedSlot, sender=sender)
+    assert Sender.changedSignal.receiverCount(sender) == 1
+    key = id(sender)
+    del sender
+    gc.collect()
+    assert key not in Sender.changedSignal._by_sender
+# end def
+
+
+def _connectResized(strand, resized: list):
+    Strand.strandResizedSignal.connect(lambda s, idxs: resized.append((s, idxs)), sender=strand)
+# end def
+
+
+def testDeferSignalsCoalesces(cnapp):
+    part = create3Helix(cnapp.document, [0, 0, 1], 42)
+    strand = part.getStrandSets(0)[0].createStrand(0, 20)
+    resized = []
+    _connectResized(strand, resized)
+    with part.deferSignals():
+        strand.resize((0, 21))
+        strand.resize((0, 22))
+        assert resized == []
+    assert resized == [(strand, (0, 22))]
+    strand.resize((0, 23))
+    assert resized[-1] == (strand, (0, 23))
+# end def
+
+
+def testDeferSignalsNested(cnapp):
+    part = create3Helix(cnapp.document, [0, 0, 1], 42)
+    with part.deferSignals() as queue:
+        with cnapp.document.deferSignals() as inner:
+            assert inner is queue
+# end def
+
+
+def testDeferSignalsImmediate(cnapp):
+    part = create3Helix(cnapp.document, [0, 0, 1], 42)
+    strand = part.getStrandSets(0)[0].createStrand(0, 20)
+    resized = []
+    _connectResized(strand, resized)
+    with part.deferSignals():
+        with cnapp.document.deferSignals(immediate=frozenset(('strandResizedSignal',))):
+            strand.resize((0, 21))
+            assert resized == [(strand, (0, 21))]
+        strand.resize((0, 22))
+        assert len(resized) == 1
+    assert resized[-1] == (strand, (0, 22))
+# end def
+
+
+def testDeferSignalsRemoval(cnapp):
+    part = create3Helix(cnapp.document, [0, 0, 1], 42)
+    rev_ss = part.getStrandSets(0)[1]
+    strand = rev_ss.createStrand(0, 20)
+    resized = []
+    removed = []
+    _connectResized(strand, resized)
+    Strand.strandRemovedSignal.connect(removed.append, sender=strand)
+    with part.deferSignals():
+        strand.resize((0, 21))
+        rev_ss.removeStrand(strand)
+        assert removed == [strand]
+    # what was queued for the removed strand is dropped
+    assert resized == []
+# end def
+
+
+def testQtSignal():
+    QtCore = pytest.importorskip('PyQt5.QtCore')
+
+    class QtSender(QtCore.QObject):
+        changedSignal = QtSignal(object, name='changedSignal')
+
+    sender = QtSender()
+    assert isinstance(sender.changedSignal, QtCore.pyqtBoundSignal)
+    received = []
+    sender.changedSignal.connect(received.append)
+    with deferSignals():
+        sender.changedSignal.emit(1)
+        sender.changedSignal.emit(1)
+        assert received == []
+    assert received == [1]
+# end def
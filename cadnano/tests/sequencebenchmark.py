@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Time applying a scaffold sequence through the :class:`SequenceBuffer` of
+the part against the previous strand by strand application
+
+The previous :class:`ApplySequenceCommand` is reproduced by
+:func:`applyStrandByStrand` with :meth:`Strand.setSequence` and
+:meth:`Strand.setComplementSequence`.  The longest oligo of each design is
+the scaffold.  Run from this directory::
+
+    python sequencebenchmark.py [--repeat N] [design.json ...]
+"""
+import argparse
+import glob
+import os
+import random
+import time
+
+from pathsetup import TEST_PATH
+
+from cadnano import util
+from cadnano.fileio.decode import decodeFile
+
+LARGEST_DESIGNS = ('Science09_beachball_v1.json', 'nanorobot.v2.json', 'Nature09_squarenut.json',
+                   'Nature09_monolith.json', 'Science09_prot120_98_v3.json', 'super_barcode_hex.json')
+
+
+def applyStrandByStrand(oligo, sequence: str):
+    """The previous ``ApplySequenceCommand.redo``
+    """
+    for strand in oligo.strand5p().generator3pStrand():
+        used_seq, sequence = strand.setSequence(sequence)
+        used_seq = None if used_seq is None else util.comp(used_seq)
+        for comp_strand in strand.getComplementStrands():
+            comp_strand.setComplementSequence(used_seq, strand)
+# end def
+
+
+def applyBuffered(oligo, sequence: str):
+    oligo.part().sequenceBuffer().applyOligoSequence(oligo, sequence)
+# end def
+
+
+def timeApply(apply, oligo, sequences: list, repeat: int) -> float:
+    """Returns:
+        best time of applying every sequence in ``sequences`` in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sequence in sequences:
+            apply(oligo, sequence)
+        best = min(best, time.perf_counter() - start)
+    return best
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano scaffold sequence benchmark")
+    parser.add_argument('--repeat', '-r', type=int, default=5, help="runs per design, the best is reported")
+    parser.add_argument('files', nargs='*', help="designs, defaults to the largest in tests/data")
+    args = parser.parse_args()
+    filenames = args.files or [os.path.join(TEST_PATH, 'data', name) for name in LARGEST_DESIGNS]
+    filenames = [name for name in filenames if glob.glob(name)]
+
+    random.seed(0)
+    print("%-36s %8s %8s %12s %12s %8s" % ("design", "bases", "strands", "per strand", "buffered",
+                                           "speedup"))
+    for filename in filenames:
+        part = next(iter(decodeFile(filename).getParts()))
+        oligo = max(part.oligos(), key=lambda olg: olg.length())
+        length = oligo.length()
+        sequences = [''.join(random.choice('ACGT') for _ in range(length)), None]
+        num_strands = sum(1 for _ in oligo.strand5p().generator3pStrand())
+        t_old = timeApply(applyStrandByStrand, oligo, sequences, args.repeat)
+        t_new = timeApply(applyBuffered, oligo, sequences, args.repeat)
+        print("%-36s %8d %8d %10.1fms %10.1fms %7.2fx" % (os.path.basename(filename), length, num_strands,
+                                                         1e3*t_old, 1e3*t_new, t_old/t_new))
+# end def
+
+
+if __name__ == '__main__':
+    main()
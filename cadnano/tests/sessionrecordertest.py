@@ -0,0 +1,71 @@
+from cntestcase import cnapp  # noqa: F401
+
+from nucleicacidparttest import create3Helix
+
+from cadnano.fileio.decode import decodeFile
+from cadnano.sessionrecorder import (
+    readSession,
+    recordSession,
+    replaySession
+)
+
+
+def strandState(document) -> list:
+    part = next(iter(document.getParts()))
+    state = []
+    for id_num in part.getidNums():
+        for strandset in part.getStrandSets(id_num):
+            for strand in strandset.strands():
+                strand3p = strand.connection3p()
+                state.append((id_num, strand.isForward(), strand.idxs(), strand.sequence(),
+                              None if strand3p is None else (strand3p.idNum(), strand3p.idx5Prime())))
+    return sorted(state, key=repr)
+# end def
+
+
+def recordEdits(doc, tmp_path):
+    """Save the document, then record strand, crossover, sequence and undo
+    edits to a session log
+
+    Returns:
+        tuple of form::
+
+            (path of the saved document, path of the log, recorder)
+    """
+    part = create3Helix(doc, (0, 0, 1), 42)
+    start_path = str(tmp_path / 'start.json')
+    log_path = str(tmp_path / 'session.jsonl.gz')
+    doc.writeToFile(start_path)
+    with recordSession(doc, log_path) as recorder:
+        fwd_ss, rev_ss = part.getStrandSets(0)
+        strand = fwd_ss.createStrand(0, 20)
+        other = rev_ss.createStrand(0, 20)
+        strand.resize((0, 25))
+        part.createXover(strand, 25, other, 20)
+        strand.oligo().applySequence('ACGT'*12)
+        doc.undoStack().undo()
+        doc.undoStack().redo()
+        rev_ss.createStrand(30, 40)
+    return start_path, log_path, recorder
+# end def
+
+
+def testRecordSession(cnapp, tmp_path):
+    doc = cnapp.document
+    _, log_path, recorder = recordEdits(doc, tmp_path)
+    assert recorder.count > 0
+    entries = list(readSession(log_path))
+    part = next(iter(doc.getParts()))
+    assert entries[0]['parts'] == [[part.uuid, part.getName()]]
+    assert all('error' not in entry for entry in entries[1:])
+# end def
+
+
+def testReplaySession(cnapp, tmp_path):
+    doc = cnapp.document
+    start_path, log_path, _ = recordEdits(doc, tmp_path)
+    replayed = decodeFile(start_path)
+    timings = replaySession(replayed, log_path)
+    assert len(timings) == len(list(readSession(log_path))) - 1
+    assert strandState(replayed) == strandState(doc)
+# end def
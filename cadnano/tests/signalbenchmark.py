@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Time emitting a signal with the per instance :class:`DummySignal`, the
+previous shared :class:`DummySignal` and the ``blinker`` mode of
+:func:`proxyConfigure`
+
+The previous proxy is reproduced by :class:`SharedDummySignal`, a single set
+of slots per signal, so every connected slot is called for every sender.  The
+``blinker`` mode is skipped if ``blinker`` isn't installed.  Run from this
+directory::
+
+    python signalbenchmark.py [--senders N] [--emits E]
+"""
+import argparse
+import time
+
+import pathsetup  # noqa: F401
+
+from cadnano.proxies.cnproxy import (
+    DummySignal,
+    ProxyObject
+)
+
+
+class SharedDummySignal(object):
+    """The previous headless proxy: slots are shared by every sender
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.targets = set()
+        self.argtypes = args
+        self.name = kwargs.get('name')
+
+    def connect(self, target):
+        self.targets.add(target)
+
+    def disconnect(self, target):
+        self.targets.remove(target)
+
+    def emit(self, *args):
+        for t in self.targets:
+            t(*args)
+# end class
+
+
+class Counter(object):
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+    def changedSlot(self, obj):
+        self.count += 1
+# end class
+
+
+def makeSenderClass(signal_factory):
+    class Sender(ProxyObject):
+        __slots__ = ()
+        changedSignal = signal_factory(object, name='changedSignal')
+    return Sender
+# end def
+
+
+def timeEmits(senders: list, emits: int) -> float:
+    """Returns:
+        seconds per emit of the ``changedSignal`` of the first sender
+    """
+    sender = senders[0]
+    start = time.perf_counter()
+    for _ in range(emits):
+        sender.changedSignal.emit(sender)
+    return (time.perf_counter() - start)/emits
+# end def
+
+
+def runScenarios(name: str, sender_class, num_senders: int, emits: int, connect):
+    """Time no connection and ``num_senders`` senders with one slot each
+    """
+    senders = [sender_class(None) for _ in range(num_senders)]
+    no_slots = timeEmits(senders, emits)
+    counters = [Counter() for _ in senders]
+    for sender, counter in zip(senders, counters):
+        connect(sender, counter.changedSlot)
+    connected = timeEmits(senders, emits)
+    calls = sum(counter.count for counter in counters)
+    print("%-14s %12.0f ns %12.0f ns %14.1f" % (name, 1e9*no_slots, 1e9*connected, calls/emits))
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano headless signal benchmark")
+    parser.add_argument('--senders', type=int, default=1000, help="senders with one slot each")
+    parser.add_argument('--emits', type=int, default=20000)
+    args = parser.parse_args()
+
+    print("%d senders, emitting on one of them" % args.senders)
+    print("%-14s %15s %15s %14s" % ("signal", "no slots", "connected", "calls / emit"))
+
+    def connectSender(sender, slot):
+        sender.changedSignal.connect(slot)
+
+    runScenarios("shared", makeSenderClass(SharedDummySignal), args.senders, args.emits,
+                 connectSender)
+    runScenarios("per instance", makeSenderClass(DummySignal), args.senders, args.emits,
+                 connectSender)
+
+    try:
+        import blinker
+    except ImportError:
+        print("%-14s skipped, blinker is not installed" % "blinker")
+    else:
+        class BlinkerSignal(blinker.NamedSignal):
+            # the emit proxyConfigure('blinker') adds
+            def emit(self, a, *args):
+                self.send(a, data=args)
+
+        def blinkerSignal(*args, **kwargs):
+            return BlinkerSignal(kwargs.get('name'))
+
+        blinker_sender = makeSenderClass(blinkerSignal)
+        runScenarios("blinker", blinker_sender, args.senders, args.emits,
+                     lambda sender, slot: blinker_sender.changedSignal.connect(
+                         lambda obj, data: slot(obj), sender=sender, weak=False))
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Compare the sorted endpoint :class:`StrandSet` with the previous per base
+``strand_array`` layout on a large part
+
+The per base layout is reproduced by :class:`PerBaseStrandList` with the
+same query code the ``StrandSet`` used to have.  Run from this directory::
+
+    python strandsetbenchmark.py [--helices N] [--length L] [--strands S]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from bisect import (
+    bisect_left,
+    insort_left
+)
+
+import pathsetup  # noqa: F401
+
+from cadnano.document import Document
+
+
+class PerBaseStrandList(object):
+    """The previous ``StrandSet`` storage: one reference per base plus a
+    sorted list of strands
+    """
+
+    def __init__(self, length: int):
+        self.strand_array = [None]*length
+        self.strand_heap = []
+    # end def
+
+    def add(self, strand):
+        idx_low, idx_high = strand.idxs()
+        for i in range(idx_low, idx_high + 1):
+            self.strand_array[i] = strand
+        insort_left(self.strand_heap, strand)
+    # end def
+
+    def remove(self, strand):
+        idx_low, idx_high = strand.idxs()
+        for i in range(idx_low, idx_high + 1):
+            self.strand_array[i] = None
+        self.strand_heap.pop(bisect_left(self.strand_heap, strand))
+    # end def
+
+    def getStrand(self, base_idx: int):
+        return self.strand_array[base_idx]
+    # end def
+
+    def getOverlappingStrands(self, idx_low: int, idx_high: int) -> list:
+        sh = self.strand_heap
+        lsh = len(sh)
+        strand = self.strand_array[idx_low]
+        out = []
+        if strand is None:
+            class DummyStrand(object):
+                _base_idx_low = idx_low
+
+                def __lt__(self, other):
+                    return self._base_idx_low < other._base_idx_low
+            i = bisect_left(sh, DummyStrand())
+        else:
+            out.append(strand)
+            i = bisect_left(sh, strand) + 1
+        while i < lsh:
+            strand = sh[i]
+            if strand.lowIdx() > idx_high:
+                break
+            elif idx_low <= strand.highIdx():
+                out.append(strand)
+            i += 1
+        return out
+    # end def
+# end class
+
+
+def buildPart(num_helices: int, length: int, num_strands: int):
+    """Returns:
+        a part with ``num_strands`` evenly spaced strands on every strandset
+    """
+    document = Document()
+    part = document.createNucleicAcidPart(use_undostack=False)
+    radius = part.radius()
+    origins = [(4*radius*(i % 32), 4*radius*(i // 32)) for i in range(num_helices)]
+    part.createVirtualHelices(origins, [length]*num_helices, use_undostack=False)
+    step = length // num_strands
+    for id_num in part.getIdNums():
+        for strandset in part.getStrandSets(id_num):
+            strandset.createDeserializedStrands([(i*step, i*step + step - 2) for i in range(num_strands)],
+                                                ['#0066cc']*num_strands)
+    return part
+# end def
+
+
+def measureMemory(factory) -> int:
+    """Returns:
+        bytes allocated by ``factory()`` and still alive
+    """
+    tracemalloc.start()
+    kept = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+# end def
+
+
+def timeOps(name: str, func, args_list: list) -> float:
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    per_op = (time.perf_counter() - start)/len(args_list)
+    print("  %-28s %8.2f us" % (name, 1e6*per_op))
+    return per_op
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano StrandSet benchmark")
+    parser.add_argument('--helices', type=int, default=256)
+    parser.add_argument('--length', type=int, default=4200)
+    parser.add_argument('--strands', type=int, default=40, help="strands per strandset")
+    parser.add_argument('--queries', type=int, default=20000)
+    args = parser.parse_args()
+    random.seed(0)
+
+    part = buildPart(args.helices, args.length, args.strands)
+    strandsets = [ss for id_num in part.getIdNums() for ss in part.getStrandSets(id_num)]
+    print("%d strandsets of %d bases, %d strands each" % (len(strandsets), args.length, args.strands))
+
+    def perBaseLists():
+        out = []
+        for ss in strandsets:
+            psl = PerBaseStrandList(ss.length())
+            for strand in ss.strands():
+                psl.add(strand)
+            out.append(psl)
+        return out
+
+    def endpointLists():
+        return [(list(ss.strand_heap), list(ss._low_idxs)) for ss in strandsets]
+
+    print("memory")
+    print("  %-28s %8.1f MB" % ("per base strand_array", measureMemory(perBaseLists)/2**20))
+    print("  %-28s %8.1f MB" % ("sorted endpoints", measureMemory(endpointLists)/2**20))
+
+    per_base = dict(zip(strandsets, perBaseLists()))
+    picks = [random.choice(strandsets) for _ in range(args.queries)]
+    points = [(ss, random.randrange(args.length)) for ss in picks]
+    ranges = [(ss, lo, min(lo + random.randrange(200), args.length - 1))
+              for ss, lo in points]
+
+    print("getStrand")
+    timeOps("per base", lambda ss, i: per_base[ss].getStrand(i), points)
+    timeOps("sorted endpoints", lambda ss, i: ss.getStrand(i), points)
+    print("getOverlappingStrands")
+    timeOps("per base", lambda ss, lo, hi: per_base[ss].getOverlappingStrands(lo, hi), ranges)
+    timeOps("sorted endpoints", lambda ss, lo, hi: ss.getOverlappingStrands(lo, hi), ranges)
+
+    print("remove + add strand")
+    moves = [(ss, random.choice(ss.strands())) for ss in picks[:2000]]
+
+    def perBaseMove(ss, strand):
+        psl = per_base[ss]
+        psl.remove(strand)
+        psl.add(strand)
+
+    def endpointMove(ss, strand):
+        ss._removeFromStrandList(strand, update_segments=False)
+        ss._addToStrandList(strand, update_segments=False)
+    timeOps("per base", perBaseMove, moves)
+    timeOps("sorted endpoints", endpointMove, moves)
+# end def
+
+
+if __name__ == '__main__':
+    main()
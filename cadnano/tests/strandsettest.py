@@ -93,3 +93,95 @@ def testStrandset(cnapp):
 
     # resize --> resize Part???
 # end def
+
+
+QUERY_HELIX_LENGTH = 84
+
+
+def createResizedStrandset(doc):
+    """Returns:
+        the forward strandset of helix 0 with strands ``a`` at (0, 5),
+        ``b`` at (15, 35) and one at (40, 41), and the strands ``a``, ``b``
+    """
+    part = create3Helix(doc, [0, 0, 1], QUERY_HELIX_LENGTH)
+    fwd_ss, _ = part.getStrandSets(0)
+    strand_a = fwd_ss.createStrand(2, 10)
+    strand_b = fwd_ss.createStrand(20, 30)
+    fwd_ss.createStrand(40, 41)
+    strand_b.resize((15, 35))
+    strand_a.resize((0, 5))
+    return fwd_ss, strand_a, strand_b
+# end def
+
+
+def checkStrandsetQueries(strandset):
+    """Point, overlap and range queries match a per base scan
+    """
+    per_base = [None]*QUERY_HELIX_LENGTH
+    for strand in strandset.strands():
+        lo, hi = strand.idxs()
+        per_base[lo:hi + 1] = [strand]*(hi - lo + 1)
+    for idx in range(QUERY_HELIX_LENGTH):
+        assert strandset.getStrand(idx) is per_base[idx]
+    for lo in range(0, QUERY_HELIX_LENGTH, 3):
+        for hi in range(lo, QUERY_HELIX_LENGTH, 7):
+            expected = []
+            for strand in per_base[lo:hi + 1]:
+                if strand is not None and strand not in expected:
+                    expected.append(strand)
+            assert strandset.getOverlappingStrands(lo, hi) == expected
+            assert strandset.hasStrandAt(lo, hi) == bool(expected)
+# end def
+
+
+def testStrandsetQueries(cnapp):
+    fwd_ss, _, _ = createResizedStrandset(cnapp.document)
+    checkStrandsetQueries(fwd_ss)
+# end def
+
+
+def testStrandsetQueriesAfterUndo(cnapp):
+    fwd_ss, strand_a, strand_b = createResizedStrandset(cnapp.document)
+    us = fwd_ss.part().undoStack()
+    us.undo()
+    us.undo()
+    assert strand_b.idxs() == (20, 30)
+    checkStrandsetQueries(fwd_ss)
+    assert fwd_ss.getNeighbors(strand_b) == (strand_a, fwd_ss.getStrand(40))
+# end def
+
+
+def testStrandsetEmptyRegion(cnapp):
+    fwd_ss, _, _ = createResizedStrandset(cnapp.document)
+    assert fwd_ss.getBoundsOfEmptyRegionContaining(37) == (36, 39)
+    assert fwd_ss.getBoundsOfEmptyRegionContaining(50) == (42, QUERY_HELIX_LENGTH - 1)
+# end def
+
+
+def testStrandsetOutOfRange(cnapp):
+    fwd_ss, _, _ = createResizedStrandset(cnapp.document)
+    with pytest.raises(IndexError):
+        fwd_ss.getStrand(QUERY_HELIX_LENGTH)
+# end def
+
+
+def testStrandDirectionAccessors(cnapp):
+    """The low/high accessors map to 5'/3' by direction on the compact
+    ``__slots__`` strands
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_strand = fwd_ss.createStrand(2, 10)
+    rev_strand = rev_ss.createStrand(4, 12)
+    assert not hasattr(fwd_strand, '__dict__')
+    assert not hasattr(fwd_strand.oligo(), '__dict__')
+    assert (fwd_strand.idx5Prime(), fwd_strand.idx3Prime()) == (2, 10)
+    assert (rev_strand.idx5Prime(), rev_strand.idx3Prime()) == (12, 4)
+
+    fwd_strand.setConnectionHigh(rev_strand)
+    rev_strand.setConnectionHigh(fwd_strand)
+    assert fwd_strand.connection3p() is rev_strand
+    assert fwd_strand.connectionHigh() is rev_strand and fwd_strand.connectionLow() is None
+    assert rev_strand.connection5p() is fwd_strand
+    assert rev_strand.connectionHigh() is fwd_strand and rev_strand.connectionLow() is None
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Resident memory of a growing undo history kept in memory and spilled to a
+file by :meth:`UndoStack.setSpill`
+
+Every step applies a new random sequence to a long oligo on the undo stack.
+The history is kept whole in memory in the ``memory`` mode, and in the
+``spill`` mode the commands beyond ``--budget`` bytes are spilled, so the
+resident size levels off.  After the last step every command is undone to
+check they are all paged back in.  Each mode runs in its own process.  Run
+from this directory::
+
+    python undobenchmark.py [--steps N] [--length L] [--budget B]
+"""
+import argparse
+import random
+import resource
+import subprocess
+import sys
+import time
+
+import pathsetup  # noqa: F401
+
+from cadnano.document import Document
+
+
+def residentBytes() -> int:
+    """Returns:
+        the current resident set size, or the peak one if it isn't available
+    """
+    try:
+        with open('/proc/self/statm') as fd:
+            return int(fd.read().split()[1])*resource.getpagesize()
+    except OSError:
+        # kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else 1024*peak
+# end def
+
+
+def runMode(mode: str, steps: int, length: int, budget: int):
+    document = Document()
+    part = document.createNucleicAcidPart(use_undostack=False)
+    part.createVirtualHelix(0., 0., 0., length=length, id_num=0, use_undostack=False)
+    fwd_ss, _ = part.getStrandSets(0)
+    oligo = fwd_ss.createStrand(0, length - 1, use_undostack=False).oligo()
+    us = document.undoStack()
+    if mode == 'memory':
+        us.setSpill(False)
+        us.setByteBudget(None)
+    else:
+        us.setByteBudget(budget)
+
+    rng = random.Random(0)
+    report_every = max(1, steps//5)
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        oligo.applySequence(''.join(rng.choice('ACGT') for _ in range(length)))
+        if step % report_every == 0:
+            footprint = us.memoryFootprint()
+            print("%-7s %7d steps %9.1f MiB RSS %9.1f MiB in memory %9.1f MiB spilled" % (
+                  mode, step, residentBytes()/2**20, footprint['undo_bytes']/2**20,
+                  footprint['spilled_bytes']/2**20))
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    undone = 0
+    while us.canUndo():
+        us.undo()
+        undone += 1
+    print("%-7s %7.1f us per step, %d undone in %.2f s, sequence %s" % (
+          mode, 1e6*elapsed/steps, undone, time.perf_counter() - start, oligo.sequence()))
+# end def
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cadnano undo history memory benchmark")
+    parser.add_argument('--steps', type=int, default=10000)
+    parser.add_argument('--length', type=int, default=2000, help="bases of the oligo")
+    parser.add_argument('--budget', type=int, default=8*2**20, help="bytes kept in memory by the spill mode")
+    parser.add_argument('--mode', choices=('memory', 'spill'), help="run a single mode in this process")
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        runMode(args.mode, args.steps, args.length, args.budget)
+        return
+    for mode in ('memory', 'spill'):
+        subprocess.check_call([sys.executable, __file__, '--mode', mode, '--steps', str(args.steps),
+                               '--length', str(args.length), '--budget', str(args.budget)])
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+from cntestcase import cnapp  # noqa: F401
+
+from nucleicacidparttest import create3Helix
+
+
+def testUndoSequence(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    oligo = fwd_ss.createStrand(0, 20).oligo()
+    oligo.applySequence('ACGT'*5 + 'A')
+    assert oligo.sequence() == 'ACGT'*5 + 'A'
+    us.undo()
+    assert oligo.sequence() is None
+    us.redo()
+    assert oligo.sequence() == 'ACGT'*5 + 'A'
+# end def
+
+
+def testUndoVirtualHelixOrder(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    part.removeVirtualHelix(1)
+    assert part.getVirtualHelixOrder() == [0, 2]
+    us.undo()
+    assert part.getVirtualHelixOrder() == [0, 1, 2]
+    us.redo()
+    assert part.getVirtualHelixOrder() == [0, 2]
+# end def
+
+
+def testUndoFootprint(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    part.removeVirtualHelix(1)
+    us.undo()
+    footprint = us.memoryFootprint()
+    assert footprint['redo_commands'] == 1 and footprint['redo_bytes'] > 0
+    part.translateVirtualHelices({2}, 1., 0., 0., False, use_undostack=True)
+    footprint = us.memoryFootprint()
+    assert footprint['redo_commands'] == footprint['redo_bytes'] == 0
+    assert footprint['undo_bytes'] == sum(cmd.nbytes() for cmd in us.undostack)
+# end def
+
+
+def testUndoSharedBytes(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 40)
+    strand.addInsertion(1, 2)
+    cmd = us.undostack[-1]
+    nbytes = cmd.nbytes()
+    for idx in range(3, 40, 2):
+        strand.addInsertion(idx, 2)
+    # the insertions of the helix belong to the part
+    assert cmd.nbytes() == nbytes
+# end def
+
+
+def testUndoByteBudget(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    part.translateVirtualHelices({2}, 1., 0., 0., False, use_undostack=True)
+    assert us.memoryFootprint()['undo_commands'] > 1
+    us.setSpill(False)
+    us.setByteBudget(us.undostack[-1].nbytes())
+    assert us.memoryFootprint()['undo_commands'] == 1
+    us.undo()
+    assert not us.canUndo()
+# end def
+
+
+def _spillUndoHistory(fwd_ss, us):
+    """Push one more command and spill every command before it
+    """
+    fwd_ss.createStrand(38, 40)
+    us.setByteBudget(1)
+    assert us.memoryFootprint()['undo_commands'] == 1
+    us.undo()
+# end def
+
+
+def testUndoSpillBudget(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    fwd_ss.createStrand(0, 20)
+    part.removeVirtualHelix(2)
+    us.setByteBudget(1)
+    footprint = us.memoryFootprint()
+    assert footprint['undo_commands'] == 1
+    assert footprint['spilled_commands'] > 1 and footprint['spilled_bytes'] > 0
+# end def
+
+
+def testUndoSpillRoundTrip(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 20)
+    other = rev_ss.createStrand(10, 30)
+    rev_ss.removeStrand(other)
+    strand.oligo().applySequence('ACGT'*5 + 'A')
+    part.removeVirtualHelix(2)
+    us.setByteBudget(1)
+    while us.canUndo():
+        us.undo()
+    assert len(doc.children()) == 0
+    assert us.memoryFootprint()['spilled_bytes'] == 0
+    while us.canRedo():
+        us.redo()
+    assert part.getidNums() == [0, 1]
+    assert fwd_ss.getStrand(5) is strand
+    assert strand.oligo().sequence() == 'ACGT'*5 + 'A'
+    assert rev_ss.getStrand(15) is None
+# end def
+
+
+def testUndoSpillInsertion(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 20)
+    strand.addInsertion(5, 2)
+    _spillUndoHistory(fwd_ss, us)
+    us.undo()
+    assert part.insertions()[0] == {}
+    assert strand.oligo().length() == 21
+    us.redo()
+    assert part.insertions()[0][5].length() == 2
+    assert strand.oligo().length() == 23
+# end def
+
+
+def testUndoSpillResize(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 20)
+    strand.resize((0, 25))
+    _spillUndoHistory(fwd_ss, us)
+    us.undo()
+    assert strand.idxs() == (0, 20) and strand.oligo().length() == 21
+    assert fwd_ss.getStrand(23) is None
+    us.redo()
+    assert fwd_ss.getStrand(23) is strand and strand.oligo().length() == 26
+# end def
+
+
+def testUndoSpillXover(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    _, rev_ss = part.getStrandSets(1)
+    strand = fwd_ss.createStrand(0, 20)
+    other = rev_ss.createStrand(0, 20)
+    part.createXover(strand, 20, other, 20)
+    _spillUndoHistory(fwd_ss, us)
+    us.undo()
+    assert strand.connection3p() is None and other.connection5p() is None
+    assert strand.oligo() is not other.oligo()
+    assert strand.oligo().length() == other.oligo().length() == 21
+    us.redo()
+    assert strand.connection3p() is other and other.oligo() is strand.oligo()
+    assert strand.oligo().length() == 42
+# end def
+
+
+def testMergeResizes(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, _ = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 10)
+    depth = len(us.undostack)
+    for idx_high in range(11, 20):
+        strand.resize((0, idx_high), merge=True)
+    assert len(us.undostack) == depth + 1
+    assert strand.oligo().length() == 20
+    us.undo()
+    assert strand.idxs() == (0, 10) and strand.oligo().length() == 11
+    us.redo()
+    assert strand.idxs() == (0, 19)
+# end def
+
+
+def testMergeSelectionResizes(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 10)
+    other = rev_ss.createStrand(0, 10)
+    depth = len(us.undostack)
+    doc.addStrandToSelection(strand, (False, True))
+    doc.addStrandToSelection(other, (False, True))
+    for _ in range(3):
+        doc.resizeSelection(1, merge=True)
+    assert len(us.undostack) == depth + 1
+    assert strand.idxs() == (0, 13) and other.idxs() == (0, 13)
+    us.undo()
+    assert strand.idxs() == (0, 10) and other.idxs() == (0, 10)
+# end def
+
+
+def testSeparateResizes(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 20)
+    other = rev_ss.createStrand(0, 20)
+    depth = len(us.undostack)
+    strand.resize((0, 25))
+    strand.resize((0, 30))
+    assert len(us.undostack) == depth + 2
+    us.undo()
+    assert strand.idxs() == (0, 25)
+    doc.addStrandToSelection(other, (False, True))
+    doc.resizeSelection(1)
+    doc.resizeSelection(1)
+    us.undo()
+    assert other.idxs() == (0, 21)
+# end def
+
+
+def testMergeTranslations(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    us = doc.undoStack()
+    depth = len(us.undostack)
+    for _ in range(4):
+        part.translateVirtualHelices({1, 2}, 1., 0., 0., False, use_undostack=True)
+    part.translateVirtualHelices({2}, 1., 0., 0., False, use_undostack=True)
+    assert len(us.undostack) == depth + 2
+    x0 = part.getVirtualHelixOrigin(1)[0]
+    us.undo()
+    us.undo()
+    assert part.getVirtualHelixOrigin(1)[0] == x0 - 4.
+# end def
+
+
+def testResizeClearsComplement(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    other = rev_ss.createStrand(0, 10)
+    other.oligo().applySequence('ACGT'*2 + 'AAA')
+    # created after the sequence, so its oligo has none
+    strand = fwd_ss.createStrand(4, 10)
+    assert strand.oligo().sequence() is None
+    strand.resize((4, 12))
+    assert other.oligo().sequence() == ' '*7 + 'TAAA'
+# end def
@@ -1,11 +1,140 @@
 # -*- coding: utf-8 -*-
-from collections import deque
+import sys
+import zlib
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano import sessionrecorder
+from cadnano.proxies.cnenum import CommandIdEnum
+
+_SLOT_NAMES = {}
+"""class: payload ``__slots__`` of the class and its bases, see :meth:`UndoCommand.nbytes`"""
+
+
+def packSequence(sequence: Optional[str]) -> Optional[bytes]:
+    """Compress a sequence held by an undo command.  Sequences are mostly
+    runs of a few letters, so they compress well.
+
+    Args:
+        sequence: the sequence or ``None``
+
+    Returns:
+        the compressed sequence or ``None``
+    """
+    if sequence is None:
+        return None
+    return zlib.compress(sequence.encode('utf-8'), 1)
+# end def
+
+
+def unpackSequence(packed: Optional[bytes]) -> Optional[str]:
+    """Inverse of :func:`packSequence`
+    """
+    if packed is None:
+        return None
+    return zlib.decompress(packed).decode('utf-8')
+# end def
+
+
+def packSequences(sequences: List[Optional[str]]) -> Tuple[bytes, np.ndarray]:
+    """Compress many sequences held by an undo command into one block, see
+    :func:`packSequence`
+
+    Args:
+        sequences: the sequences, any may be ``None``
+
+    Returns:
+        tuple of form::
+
+            (compressed sequences, lengths with -1 for ``None``)
+    """
+    lengths = np.array([-1 if seq is None else len(seq) for seq in sequences], dtype=np.int32)
+    joined = ''.join(seq for seq in sequences if seq is not None)
+    return zlib.compress(joined.encode('utf-8'), 1), lengths
+# end def
+
+
+def unpackSequences(packed: Tuple[bytes, np.ndarray]) -> List[Optional[str]]:
+    """Inverse of :func:`packSequences`
+    """
+    data, lengths = packed
+    joined = zlib.decompress(data).decode('utf-8')
+    sequences = []
+    pos = 0
+    for length in lengths.tolist():
+        if length < 0:
+            sequences.append(None)
+        else:
+            sequences.append(joined[pos:pos + length])
+            pos += length
+    return sequences
+# end def
+
+
+def _payloadSize(value, depth: int = 0) -> int:
+    """Returns:
+        bytes of the plain data ``value`` holds.  Model objects, which are
+        shared with the document, count for nothing.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return 0 if depth == 0 else sys.getsizeof(value)
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (value.nbytes if value.base is None else 0)
+    if isinstance(value, (tuple, list, set, frozenset)) and depth < 3:
+        return sys.getsizeof(value) + sum(_payloadSize(x, depth + 1) for x in value)
+    if isinstance(value, dict) and depth < 3:
+        return sys.getsizeof(value) + sum(_payloadSize(k, depth + 1) + _payloadSize(v, depth + 1)
+                                          for k, v in value.items())
+    return 0
+# end def
+
+
+def _slotNames(cls: type) -> tuple:
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            names += [slots] if isinstance(slots, str) else list(slots)
+        skip = ('name', 'commands', '__dict__', '__weakref__') + cls._shared_slots
+        names = _SLOT_NAMES[cls] = tuple(name for name in names if name not in skip)
+    return names
+# end def
 
 
 class UndoCommand(object):
+    """Headless stand in for ``QUndoCommand``.  Commands accumulate in the
+    undo history, so subclasses declare ``__slots__`` too.
+
+    Like ``QUndoCommand`` a command with an :meth:`id` other than
+    ``CommandIdEnum.NO_MERGE`` is offered to the last executed command of the
+    same id with :meth:`mergeWith`, so continuous edits such as drags make a
+    single command.  A macro, a command with child commands, merges with the
+    previous macro if their children merge pairwise.
+
+    Subclasses list in ``_shared_slots`` the slots that hold containers of
+    the model, such as the insertions of a virtual helix, rather than a copy.
+    """
+    __slots__ = ('name', 'commands')
+    _shared_slots = ()
+
+    def __new__(cls, *args, **kwargs):
+        self = super(UndoCommand, cls).__new__(cls)
+        if sessionrecorder.active_recorder is not None:
+            sessionrecorder.active_recorder.commandCreated(self, args, kwargs)
+        return self
+    # end def
+
     def __init__(self, name=None):
         self.name = name
-        self.commands = deque()
+        self.commands = []
     # end def
 
     def redo(self):
@@ -14,9 +143,70 @@ class UndoCommand(object):
     # end def
 
     def undo(self):
-        for cmd in self.commands:
+        for cmd in reversed(self.commands):
             cmd.undo()
     # end def
 
     def addCommand(self, cmd):
         self.commands.append(cmd)
+    # end def
+
+    def id(self) -> int:
+        """Returns:
+            the ``CommandIdEnum`` of commands this one can merge with
+        """
+        return CommandIdEnum.NO_MERGE
+    # end def
+
+    def canMergeWith(self, other: 'UndoCommand') -> bool:
+        """Args:
+            other: the command executed after this one
+
+        Returns:
+            ``True`` if :meth:`mergeWith` would merge ``other``
+        """
+        commands = self.commands
+        if not commands or self.id() != CommandIdEnum.NO_MERGE:
+            return False
+        other_commands = other.commands
+        return (type(other) is type(self) and self.name == other.name and
+                len(other_commands) == len(commands) and
+                all(cmd.id() == other_cmd.id() and cmd.canMergeWith(other_cmd)
+                    for cmd, other_cmd in zip(commands, other_commands)))
+    # end def
+
+    def mergeWith(self, other: 'UndoCommand') -> bool:
+        """Fold ``other``, already executed, into this command, so undoing
+        this command undoes both
+
+        Args:
+            other: the command executed after this one
+
+        Returns:
+            ``True`` if merged, ``False`` if nothing changed
+        """
+        if not self.canMergeWith(other):
+            return False
+        for cmd, other_cmd in zip(self.commands, other.commands):
+            cmd.mergeWith(other_cmd)
+        return True
+    # end def
+
+    def nbytes(self) -> int:
+        """Estimate the memory the command and its child commands hold in the
+        undo history: the commands themselves and the strings, arrays and
+        containers of their slots.  The model objects they reference and the
+        containers of ``_shared_slots`` are shared with the document and are
+        not counted.
+
+        Returns:
+            the estimated size in bytes
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.commands)
+        for name in _slotNames(type(self)):
+            size += _payloadSize(getattr(self, name, None))
+        for cmd in self.commands:
+            size += cmd.nbytes()
+        return size
+    # end def
+# end class
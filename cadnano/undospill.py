@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Append-only file holding the oldest commands of an :class:`UndoStack`
+
+Commands are pickled with their immutable data: nested commands, strings,
+numbers and tuples.  Every other object they reference, the parts, strands,
+oligos of the document, the lists, dicts and arrays that may be shared with
+the model and the objects only the history keeps alive, is pickled as a
+persistent reference and kept in memory, so a command paged back in references
+the very same objects as before it was spilled.
+"""
+import io
+import pickle
+import tempfile
+from typing import (
+    List,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.undocommand import UndoCommand
+
+_BY_VALUE = (UndoCommand, str, bytes, bool, int, float, complex, type(None),
+             tuple, frozenset, np.generic)
+
+
+def _commandState(undocommand: UndoCommand) -> Tuple[tuple, tuple]:
+    """Returns:
+        tuple of form::
+
+            (attribute names, attribute values)
+
+        of a command, its child commands as a tuple
+    """
+    names = []
+    for klass in type(undocommand).__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        names += [slots] if isinstance(slots, str) else list(slots)
+    names = [name for name in names
+             if name not in ('__dict__', '__weakref__') and hasattr(undocommand, name)]
+    names += list(getattr(undocommand, '__dict__', ()))
+    values = [getattr(undocommand, name) for name in names]
+    values[names.index('commands')] = tuple(undocommand.commands)
+    return tuple(names), tuple(values)
+# end def
+
+
+def _restoreCommand(cls: type, names: tuple, values: tuple) -> UndoCommand:
+    """Inverse of :func:`_commandState`.  Skips ``UndoCommand.__new__`` so
+    paging a command back in is not recorded as creating it
+    """
+    undocommand = object.__new__(cls)
+    for name, value in zip(names, values):
+        setattr(undocommand, name, value)
+    undocommand.commands = list(undocommand.commands)
+    return undocommand
+# end def
+
+
+class _SpillPickler(pickle.Pickler):
+    def __init__(self, file, refs: list):
+        super(_SpillPickler, self).__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.refs = refs
+        self.ref_index = {}
+
+    def reducer_override(self, obj):
+        # the default state of a slotted object is a fresh dict, which would
+        # be kept in memory as a persistent reference
+        if isinstance(obj, UndoCommand):
+            return (_restoreCommand, (type(obj),) + _commandState(obj))
+        return NotImplemented
+
+    def persistent_id(self, obj):
+        if isinstance(obj, _BY_VALUE):
+            return None
+        index = self.ref_index.get(id(obj))
+        if index is None:
+            index = self.ref_index[id(obj)] = len(self.refs)
+            self.refs.append(obj)
+        return index
+# end class
+
+
+class _SpillUnpickler(pickle.Unpickler):
+    def __init__(self, file, refs: tuple):
+        super(_SpillUnpickler, self).__init__(file)
+        self.refs = refs
+
+    def persistent_load(self, index: int):
+        return self.refs[index]
+# end class
+
+
+class UndoSpillFile(object):
+    """Stack of spilled commands, the last spilled is the first paged back in
+
+    Args:
+        path: file to spill to, truncated first.  Defaults to an anonymous
+            temporary file, created at the first spill
+    """
+    __slots__ = ('path', '_file', '_entries', '_end')
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self._file = None
+        # (offset, size, referenced objects) of every spilled command
+        self._entries: List[Tuple[int, int, tuple]] = []
+        self._end = 0
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._entries)
+    # end def
+
+    def nbytes(self) -> int:
+        """Returns:
+            bytes of the spilled commands in the file
+        """
+        return self._end
+    # end def
+
+    def spill(self, undocommand: UndoCommand) -> bool:
+        """Append a command to the file
+
+        Args:
+            undocommand: the command, no longer referenced by the caller if
+                spilled
+
+        Returns:
+            ``True`` if spilled, ``False`` if it could not be pickled
+        """
+        refs = []
+        buffer = io.BytesIO()
+        try:
+            _SpillPickler(buffer, refs).dump(undocommand)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        if self._file is None:
+            if self.path is None:
+                self._file = tempfile.TemporaryFile(prefix='cadnano-undo-')
+            else:
+                self._file = open(self.path, 'w+b')
+        data = buffer.getbuffer()
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._entries.append((self._end, len(data), tuple(refs)))
+        self._end += len(data)
+        return True
+    # end def
+
+    def pageIn(self) -> UndoCommand:
+        """Read back the last spilled command and release its space
+
+        Returns:
+            the command
+
+        Raises:
+            IndexError: nothing is spilled
+        """
+        offset, size, refs = self._entries.pop()
+        f = self._file
+        f.seek(offset)
+        undocommand = _SpillUnpickler(io.BytesIO(f.read(size)), refs).load()
+        self._end = offset
+        if not self._entries:
+            f.truncate(0)
+        return undocommand
+    # end def
+
+    def clear(self):
+        """Drop every spilled command
+        """
+        self._entries = []
+        self._end = 0
+        if self._file is not None:
+            self._file.truncate(0)
+    # end def
+
+    def close(self):
+        """Drop every spilled command and close the file
+        """
+        self._entries = []
+        self._end = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    # end def
+# end class
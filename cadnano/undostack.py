@@ -1,14 +1,38 @@
 # -*- coding: utf-8 -*-
 from collections import deque
 
+from cadnano.sessionrecorder import recording
 from cadnano.undocommand import UndoCommand
+from cadnano.undospill import UndoSpillFile
+
+DEFAULT_BYTE_BUDGET = 64*1024*1024
+"""default bytes of undo history kept by an :class:`UndoStack`"""
 
 
 class UndoStack(object):
-    def __init__(self, limit: int = 10):
+    """Headless stand in for ``QUndoStack``.  The undo history is bounded by
+    ``limit`` commands, if not ``None``, and by ``byte_budget`` bytes, as
+    estimated by :meth:`UndoCommand.nbytes`, if not ``None``.  The oldest
+    commands are dropped first and the newest one is always kept.  With
+    :meth:`setSpill` they are moved to an :class:`UndoSpillFile` instead and
+    paged back in when undone, so the history is unbounded.
+
+    Args:
+        limit: maximum number of undo commands in memory
+        byte_budget: maximum bytes of undo and redo commands in memory
+    """
+    def __init__(self, limit: int = None, byte_budget: int = DEFAULT_BYTE_BUDGET):
         self.undostack = deque()    # not using deque maxlen because pattern is awkward
         self.redostack = []
         self.limit = limit
+        self.byte_budget = byte_budget
+        # sizes of the commands of undostack and redostack, in the same order
+        self._undo_sizes = deque()
+        self._redo_sizes = []
+        self._undo_nbytes = 0
+        self._redo_nbytes = 0
+        self._in_undo_redo = False
+        self._spill: UndoSpillFile = None
 
         self.top_macro = None
         self.current_macro = None
@@ -17,23 +41,94 @@ class UndoStack(object):
     # end def
 
     def push(self, undocommand: UndoCommand):
-        if self.macro_count > 0:
-            self.current_macro.addCommand(undocommand)
+        """Like ``QUndoStack.push`` the command is executed right away, also
+        inside a macro, so later commands of the macro see its effect, and then
+        merged into the last executed command if they have the same
+        :meth:`UndoCommand.id`
+        """
+        with recording('push', undocommand):
+            if self.macro_count > 0:
+                undocommand.redo()
+                commands = self.current_macro.commands
+                if not (commands and self._tryMerge(commands[-1], undocommand)):
+                    self.current_macro.addCommand(undocommand)
+            else:
+                self.appendUndoStack(undocommand)
+    # end def
+
+    def _tryMerge(self, last: UndoCommand, undocommand: UndoCommand) -> bool:
+        """Returns:
+            ``True`` if ``undocommand`` was merged into ``last``
+        """
+        if self._in_undo_redo or last.id() != undocommand.id():
+            return False
+        return last.mergeWith(undocommand)
+    # end def
+
+    def appendUndoStack(self, undocommand: UndoCommand, do_redo: bool = True):
+        if not self._in_undo_redo:
+            # like QUndoStack a new command makes the redo history obsolete
+            self.redostack.clear()
+            self._redo_sizes.clear()
+            self._redo_nbytes = 0
+        if do_redo:
+            undocommand.redo()
+        stack = self.undostack
+        if stack and self._tryMerge(stack[-1], undocommand):
+            size = stack[-1].nbytes()
+            self._undo_nbytes += size - self._undo_sizes[-1]
+            self._undo_sizes[-1] = size
         else:
-            self.appendUndoStack(undocommand)
+            size = undocommand.nbytes()
+            stack.append(undocommand)
+            self._undo_sizes.append(size)
+            self._undo_nbytes += size
+        self._trim()
     # end def
 
-    def appendUndoStack(self, undocommand: UndoCommand):
+    def _trim(self):
+        """Spill, or drop, the oldest undo commands beyond ``limit`` or
+        ``byte_budget``
+        """
         stack = self.undostack
-        stack.append(undocommand)
-        undocommand.redo()
-        if len(stack) > self.limit:
-            stack.popleft()
+        sizes = self._undo_sizes
+        limit = self.limit
+        budget = self.byte_budget
+        spill = self._spill
+        while len(stack) > 1 and (
+                (limit is not None and len(stack) > limit) or
+                (budget is not None and self._undo_nbytes + self._redo_nbytes > budget)):
+            undocommand = stack.popleft()
+            self._undo_nbytes -= sizes.popleft()
+            if spill is not None and not spill.spill(undocommand):
+                # unpicklable, so the older history can't be undone anymore
+                spill.clear()
+    # end def
+
+    def setSpill(self, enabled: bool, path: str = None):
+        """Spill the commands beyond ``limit`` or ``byte_budget`` to a file
+        instead of dropping them
+
+        Args:
+            enabled: spill if ``True``, otherwise drop the spilled commands
+            path: file to spill to, defaults to a temporary file
+        """
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        if enabled:
+            self._spill = UndoSpillFile(path)
     # end def
 
     def beginMacro(self, message: str):
+        with recording('begin', name=message):
+            self._beginMacro(message)
+    # end def
+
+    def _beginMacro(self, message: str):
         new_macro = UndoCommand(message)
         if self.current_macro is not None:
+            self.current_macro.addCommand(new_macro)
             self.macro_stack.append(self.current_macro)
         self.current_macro = new_macro
         if self.macro_count == 0:
@@ -43,6 +138,11 @@ class UndoStack(object):
     # end def
 
     def endMacro(self):
+        with recording('end'):
+            self._endMacro()
+    # end def
+
+    def _endMacro(self):
         self.macro_count -= 1
         try:
             self.current_macro = self.macro_stack.pop()
@@ -50,25 +150,57 @@ class UndoStack(object):
             self.current_macro = None
         # print('e', self.current_macro self.macro_count)
         if self.macro_count == 0:
-            self.appendUndoStack(self.top_macro)
+            # the commands already ran when pushed
+            self.appendUndoStack(self.top_macro, do_redo=False)
     # end def
 
     def undo(self):
+        with recording('undo'):
+            self._undo()
+    # end def
+
+    def _undo(self):
+        if not self.undostack and self._spill:
+            undo_cmd = self._spill.pageIn()
+            self.undostack.append(undo_cmd)
+            self._undo_sizes.append(undo_cmd.nbytes())
+            self._undo_nbytes += self._undo_sizes[-1]
         if self.canUndo():
             undo_cmd = self.undostack.pop()
-            undo_cmd.undo()
+            size = self._undo_sizes.pop()
+            self._undo_nbytes -= size
+            self._in_undo_redo = True
+            try:
+                undo_cmd.undo()
+            finally:
+                self._in_undo_redo = False
             self.redostack.append(undo_cmd)
+            self._redo_sizes.append(size)
+            self._redo_nbytes += size
     # end def
 
     def redo(self):
+        with recording('redo'):
+            self._redo()
+    # end def
+
+    def _redo(self):
         if self.canRedo():
             redo_cmd = self.redostack.pop()
-            redo_cmd.redo()
+            size = self._redo_sizes.pop()
+            self._redo_nbytes -= size
+            self._in_undo_redo = True
+            try:
+                redo_cmd.redo()
+            finally:
+                self._in_undo_redo = False
             self.undostack.append(redo_cmd)
+            self._undo_sizes.append(size)
+            self._undo_nbytes += size
     # end def
 
     def canUndo(self) -> bool:
-        return True if len(self.undostack) > 0 else False
+        return True if len(self.undostack) > 0 or self._spill else False
     # end def
 
     def canRedo(self) -> bool:
@@ -77,4 +209,34 @@ class UndoStack(object):
 
     def setUndoLimit(self, lim: int):
         self.limit = lim
+        self._trim()
+    # end def
+
+    def setByteBudget(self, byte_budget: int):
+        """Args:
+            byte_budget: maximum bytes of undo and redo commands, ``None`` for
+                no maximum
+        """
+        self.byte_budget = byte_budget
+        self._trim()
+    # end def
+
+    def memoryFootprint(self) -> dict:
+        """Returns:
+            the number of commands and their estimated bytes in the undo and
+            redo histories, the number and bytes of the spilled commands,
+            with the ``byte_budget`` and the ``limit``
+        """
+        spill = self._spill
+        return {
+            'spilled_commands': 0 if spill is None else len(spill),
+            'spilled_bytes': 0 if spill is None else spill.nbytes(),
+            'undo_commands': len(self.undostack),
+            'undo_bytes': self._undo_nbytes,
+            'redo_commands': len(self.redostack),
+            'redo_bytes': self._redo_nbytes,
+            'byte_budget': self.byte_budget,
+            'limit': self.limit
+        }
     # end def
+# end class
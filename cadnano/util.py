@@ -20,6 +20,7 @@ from cadnano.cntypes import (
     CNObjectT,
     UndoCommandT
 )
+from cadnano.sessionrecorder import recording
 
 logger = logging.getLogger(__name__)
 
@@ -143,13 +144,17 @@ def execCommandList(model_object: CNObjectT,
     """
     if use_undostack:
         us = model_object.undoStack()
-        us.beginMacro(desc)
+        with recording('begin', name=desc):
+            us.beginMacro(desc)
         for c in commands:
-            us.push(c)
-        us.endMacro()
+            with recording('push', c):
+                us.push(c)
+        with recording('end'):
+            us.endMacro()
     else:
         for c in commands:
-            c.redo()
+            with recording('exec', c):
+                c.redo()
 # end def
 
 
@@ -157,9 +162,11 @@ def doCmd(model_object: CNObjectT, command: UndoCommandT, use_undostack: bool):
     """Helper for pushing onto the undostack
     """
     if use_undostack:
-        model_object.undoStack().push(command)
+        with recording('push', command):
+            model_object.undoStack().push(command)
     else:
-        command.redo()
+        with recording('exec', command):
+            command.redo()
 # end def
 
 
@@ -184,10 +191,14 @@ def finalizeCommands(model_object: CNObjectT,
         c.specialUndo()
         # c.undo()
     # 2. push all the "undoable" commands to the undostac
-    model_object.undoStack().beginMacro(desc)
+    us = model_object.undoStack()
+    with recording('begin', name=desc):
+        us.beginMacro(desc)
     for c in commands:
-        model_object.undoStack().push(c)
-    model_object.undoStack().endMacro()
+        with recording('push', c):
+            us.push(c)
+    with recording('end'):
+        us.endMacro()
 # end def
 
 
@@ -243,6 +254,8 @@ def parse_args(argv=None, use_gui: bool = False):
     parser.add_argument("--testing", "-t", action="store_true", help="Enable testing mode/environment.")
     parser.add_argument("--profile", "-p", action="store_true", help="Profile app execution.")
     parser.add_argument("--print-stats", "-P", action="store_true", help="Print profiling statistics.")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Time undo commands, signal emits and part queries and print a report at exit.")
     parser.add_argument('--loglevel',
                         help="Specify logging level. Can be either DEBUG, INFO, WARNING, ERROR or any integer.")
     parser.add_argument("--debug-modules", nargs='*', metavar="MODULE-STR",
@@ -1211,9 +1211,8 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
         # write the file
         ap = self._document.activePart()
         if ap is not None:
-            output = ap.getSequences()
-            with open(fname, 'w') as f:
-                f.write(output)
+            with open(fname, 'w', newline='') as f:
+                ap.writeSequences(f)
     # end def
 
     def newClickedCallback(self):
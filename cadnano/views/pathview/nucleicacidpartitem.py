@@ -382,6 +382,27 @@ class PathNucleicAcidPartItem(QAbstractPartItem):
                 self.show()
     # end def
 
+    def partVirtualHelicesAddedSlot(self, sender: NucleicAcidPartT, id_nums: List[int]):
+        """Instantiate the virtualhelix items of a bulk add, laying out the
+        item list once rather than per virtual helix
+
+        Args:
+            sender: Model object that emitted the signal.
+            id_nums: VirtualHelix ID numbers. See ``NucleicAcidPart`` for
+                description and related methods.
+        """
+        if self._viewroot.are_signals_on:
+            vhi_list = self._virtual_helix_item_list
+            for id_num in id_nums:
+                vhi = PathVirtualHelixItem(id_num, self)
+                self._virtual_helix_item_hash[id_num] = vhi
+                vhi_list.append(vhi)
+            ztf = not getBatch()
+            self._setVirtualHelixItemList(vhi_list, zoom_to_fit=ztf)
+            if not self.isVisible():
+                self.show()
+    # end def
+
     def partVirtualHelixResizedSlot(self,   sender: NucleicAcidPartT,
                                             id_num: int,
                                             virtual_helix: VirtualHelixT):
@@ -245,6 +245,18 @@ class StrandItem(QGraphicsLineItem):
         pass
     # end def
 
+    def oligoStrandsChangedSlot(self, oligo: OligoT):
+        """Slot for strands joining or leaving an `Oligo` at once, which
+        may have given the model `Strand` another `Oligo`
+
+        Args:
+            oligo:
+        """
+        strand = self._model_strand
+        if strand.oligo() is not self._controller._model_oligo:
+            self.strandHasNewOligoSlot(strand)
+    # end def
+
     def strandHasNewOligoSlot(self, strand: StrandT):
         """Slot for changing the `Oligo` of the model `Strand`
 
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from ast import literal_eval
 from warnings import warn
 from typing import (
     Tuple,
@@ -327,8 +326,7 @@ class SliceNucleicAcidPartItem(QAbstractPartItem):
             id_num: VirtualHelix ID number. See `NucleicAcidPart` for description and related methods.
             vhi: the item associated with id_num
         """
-        neighbors = vhi.getProperty('neighbors')
-        neighbors = literal_eval(neighbors)
+        neighbors = self._model_part.getVirtualHelixNeighbors(id_num)
         vhi.beginAddWedgeGizmos()
         for nvh in neighbors:
             nvhi = self._virtual_helix_item_hash.get(nvh, False)